@@ -0,0 +1,106 @@
+"""Benchmark: BMesh ``reverse_faces`` vs. ``mesh_data.reverse_winding``.
+
+Run with Blender in background mode::
+
+    blender -b --factory-startup --python benchmarks/reverse_winding.py -- [faces_per_side]
+
+Builds a UV-mapped quad grid (1000 x 1000 = 1M faces by default), reverses
+copies of it with both methods, checks the results match and prints the
+timings.
+"""
+
+import importlib.util
+import os
+import sys
+import time
+
+import bpy
+import bmesh
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+spec = importlib.util.spec_from_file_location(
+    "mesh_data", os.path.join(HERE, os.pardir, "utils", "mesh_data.py")
+)
+mesh_data = sys.modules["mesh_data"] = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mesh_data)
+
+REPEAT = 3
+
+
+def grid_mesh(side):
+    """Quad grid with ``side * side`` faces and a UV map."""
+    n = side + 1
+    x, y = np.meshgrid(np.arange(n, dtype=np.float32), np.arange(n, dtype=np.float32))
+    co = np.column_stack((x.ravel(), y.ravel(), np.zeros(n * n, dtype=np.float32)))
+
+    i, j = np.meshgrid(np.arange(side), np.arange(side))
+    base = (j * n + i).ravel()
+    corner_vert = np.column_stack((base, base + 1, base + n + 1, base + n)).ravel()
+
+    me = bpy.data.meshes.new("bench_grid")
+    me.vertices.add(len(co))
+    me.vertices.foreach_set("co", co.ravel())
+    me.loops.add(len(corner_vert))
+    me.loops.foreach_set("vertex_index", corner_vert.astype(np.int32))
+    me.polygons.add(side * side)
+    me.polygons.foreach_set("loop_start", np.arange(0, len(corner_vert), 4, dtype=np.int32))
+    me.update(calc_edges=True)
+
+    uv = me.uv_layers.new(name="UVMap")
+    uv.data.foreach_set("uv", (co[corner_vert, :2] / side).ravel())
+    return me
+
+
+def reverse_bmesh(me):
+    bm = bmesh.new()
+    bm.from_mesh(me)
+    bmesh.ops.reverse_faces(bm, faces=bm.faces[:])
+    bm.to_mesh(me)
+    bm.free()
+    me.update()
+
+
+def reverse_arrays(me):
+    assert mesh_data.reverse_winding(me)
+
+
+def corners(me):
+    nl = len(me.loops)
+    verts = np.empty(nl, dtype=np.int32)
+    me.loops.foreach_get("vertex_index", verts)
+    uv = np.empty(nl * 2, dtype=np.float32)
+    me.uv_layers["UVMap"].data.foreach_get("uv", uv)
+    return verts, uv
+
+
+def bench(source, method):
+    best = float("inf")
+    for _ in range(REPEAT):
+        me = source.copy()
+        start = time.perf_counter()
+        method(me)
+        best = min(best, time.perf_counter() - start)
+        result = corners(me)
+        bpy.data.meshes.remove(me)
+    return best, result
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    side = int(argv[0]) if argv else 1000
+
+    source = grid_mesh(side)
+    print(f"{len(source.polygons):,} faces, {len(source.loops):,} corners")
+
+    t_bmesh, r_bmesh = bench(source, reverse_bmesh)
+    t_arrays, r_arrays = bench(source, reverse_arrays)
+    assert all(np.array_equal(a, b) for a, b in zip(r_bmesh, r_arrays)), "results differ"
+
+    print(f"bmesh.ops.reverse_faces  {t_bmesh * 1000:9.1f} ms")
+    print(f"reverse_winding          {t_arrays * 1000:9.1f} ms")
+    print(f"speedup                  {t_bmesh / t_arrays:9.1f}x")
+    bpy.data.meshes.remove(source)
+
+
+main()
@@ -1,11 +1,8 @@
 import bpy
-from mathutils import Euler, Matrix, Vector
-from ..utils import addon
-from ..ops.mirror_chisel import (
-    is_chisel_object,
-    get_chisel_mirror_item,
-    chisel_axis_state,
-)
+from mathutils import Matrix, Vector
+from ..utils import addon, handlers
+from ..ops.mirror_index import mirror_index
+from ..ops.mirror_plane import PlaneResolver
 
 # Helper: axis info for
 alpha = 0.8
@@ -18,6 +15,18 @@ ARROW_AXES = [
     (Vector((0, 0, -1)), "z", "Z-"),  # Blue -Z
 ]
 
+# Orientation of the arrow_3d gizmo (default points +Z) onto each signed axis.
+AXIS_MATRICES = {
+    "X+": Matrix(([0, 0, 1], [0, 1, 0], [-1, 0, 0])),
+    "X-": Matrix(([0, 0, -1], [0, 1, 0], [1, 0, 0])),
+    "Y+": Matrix(([1, 0, 0], [0, 0, 1], [0, -1, 0])),
+    "Y-": Matrix(([1, 0, 0], [0, 0, -1], [0, 1, 0])),
+    "Z+": Matrix(([1, 0, 0], [0, 1, 0], [0, 0, 1])),
+    "Z-": Matrix(([-1, 0, 0], [0, 1, 0], [0, 0, -1])),
+}
+
+FADE_THRESHOLD = 0.985
+
 
 def lighter(color, amt=0.5):
     # color: (r,g,b,a), amt: 0..1, returns lighter color
@@ -73,6 +82,172 @@ def set_mirror_gizmo(group, axis, color, idx, size=1.0):
     return gz
 
 
+def arrow_colors_and_highlights(context):
+    """Return (arrow_colors, arrow_highlights) for the 6 gizmo arrows based on the last mirror modifier."""
+    theme_axis = addon.pref().theme.axis
+    mirror_tool = addon.pref().tools.mirror
+    reverse_controls = mirror_tool.reverse_controls
+    axis_color_names = ["x", "x", "y", "y", "z", "z"]
+    axis_highlight_names = ["x", "x", "y", "y", "z", "z"]
+    # Default: all axis colors
+    arrow_colors = [theme_axis.g] * 6
+    arrow_highlights = [
+        getattr(theme_axis, axis_highlight_names[i]) for i in range(6)
+    ]
+
+    # Real mode: skip modifier-state coloring, return default colors
+    if mirror_tool.real:
+        return arrow_colors, arrow_highlights
+
+    # Find active mesh
+    active_mesh = (
+        context.active_object
+        if (
+            context.active_object
+            and context.active_object.type == "MESH"
+            and context.active_object.select_get()
+        )
+        else None
+    )
+    if not active_mesh:
+        active_mesh = next(
+            (obj for obj in context.selected_objects if obj.type == "MESH"), None
+        )
+
+    if active_mesh:
+        # Last pinned mirror modifier or chisel mirror item
+        entry, _data = mirror_index.pinned(active_mesh)
+        axis_state = (entry.use_axis, entry.use_flip) if entry else None
+        if axis_state is not None:
+            use_axis, use_flip = axis_state
+            # Start with all gray, only color used axes
+            for i, (pos_idx, neg_idx) in enumerate([(0, 1), (2, 3), (4, 5)]):
+                axis_color = getattr(theme_axis, "xyz"[i])
+                if use_axis[i]:
+                    # Swap indices when reverse_controls is enabled
+                    if reverse_controls:
+                        pos_idx, neg_idx = neg_idx, pos_idx
+                    if use_flip[i]:
+                        # Negative axis (X-, Y-, Z-)
+                        arrow_colors[neg_idx] = axis_color
+                    else:
+                        # Positive axis (X+, Y+, Z+)
+                        arrow_colors[pos_idx] = axis_color
+            # Highlights always axis color
+            arrow_highlights = [
+                getattr(theme_axis, axis_color_names[i]) for i in range(6)
+            ]
+    return arrow_colors, arrow_highlights
+
+
+class MirrorGizmoState:
+    """View-independent state of the object-mode mirror gizmos.
+
+    Origin, gizmo matrices and colors only depend on the mirror tool settings,
+    the theme, the 3D cursor, the active object and its pinned mirror
+    modifier. Setting changes arrive through msgbus and scene changes
+    (transforms, modifiers, selection) through depsgraph updates; both bump
+    ``generation``. The msgbus subscriptions are renewed after every file
+    load, undo and redo (``reset``). The cursor is also part of the key when it is used, since
+    placing it in the viewport doesn't notify msgbus. ``revision`` changes
+    whenever the state is recomputed.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self.revision = 0
+        self.key = None
+        self.origin = Vector((0, 0, 0))
+        self.matrices = {}
+        self.axis_world = {}
+        self.arrow_colors = []
+        self.arrow_highlights = []
+        self.box_colors = []
+        self.neutral_color = (0.0, 0.0, 0.0, 1.0)
+        self.element = "OBJECT"
+        self._owner = object()
+        self._subscribed = False
+
+    def bump(self, *_args):
+        self.generation += 1
+
+    def on_depsgraph_update(self, scene, depsgraph):
+        if any(
+            isinstance(update.id, (bpy.types.Object, bpy.types.Scene))
+            for update in depsgraph.updates
+        ):
+            self.generation += 1
+
+    def subscribe(self):
+        """Watch the settings the state depends on (once per file)."""
+        if self._subscribed:
+            return
+        pref = addon.pref()
+        for key in (
+            type(pref.tools.mirror),
+            type(pref.theme.axis),
+            (bpy.types.View3DCursor, "location"),
+            (bpy.types.View3DCursor, "rotation_euler"),
+            (bpy.types.LayerObjects, "active"),
+        ):
+            bpy.msgbus.subscribe_rna(
+                key=key, owner=self._owner, args=(), notify=self.bump,
+                options={"PERSISTENT"},
+            )
+        self._subscribed = True
+
+    def unsubscribe(self):
+        bpy.msgbus.clear_by_owner(self._owner)
+        self._subscribed = False
+
+    def reset(self):
+        """Loading a file clears every msgbus subscription, PERSISTENT or not:
+        subscribe again and recompute."""
+        self.unsubscribe()
+        self.subscribe()
+        self.generation += 1
+
+    def _key(self, context):
+        mirror_tool = addon.pref().tools.mirror
+        key = (self.generation, context.view_layer.as_pointer())
+        if "CURSOR" in (mirror_tool.pivot, mirror_tool.orientation):
+            key += (tuple(map(tuple, context.scene.cursor.matrix)),)
+        return key
+
+    def refresh(self, context):
+        """Recompute the state if anything changed; returns ``revision``."""
+        key = self._key(context)
+        if key != self.key:
+            self._compute(context)
+            self.key = key
+            self.revision += 1
+        return self.revision
+
+    def _compute(self, context):
+        theme_axis = addon.pref().theme.axis
+        mirror_tool = addon.pref().tools.mirror
+
+        plane = PlaneResolver(context, 0)(context.active_object)
+        self.origin = plane.pivot
+        rot = plane.rotation
+        rot4 = rot.to_4x4()
+        for axis_vec, _axis_name, tag in ARROW_AXES:
+            m = rot4 @ AXIS_MATRICES[tag].to_4x4()
+            m.translation = self.origin
+            self.matrices[tag] = m
+            self.axis_world[tag] = rot @ axis_vec
+
+        self.arrow_colors, self.arrow_highlights = arrow_colors_and_highlights(context)
+        self.box_colors = [tuple(getattr(theme_axis, name)) for _v, name, _t in ARROW_AXES]
+        self.neutral_color = tuple(theme_axis.n)
+        self.element = mirror_tool.element
+
+
+gizmo_state = MirrorGizmoState()
+handlers.subscribe_depsgraph(gizmo_state.on_depsgraph_update)
+handlers.subscribe_reset(gizmo_state.reset)
+
+
 class ROTOR_GGT_MirrorGizmoGroup(bpy.types.GizmoGroup):
     """
     GizmoGroup for Mirror Tool. Displays axis arrow gizmos for mirroring operations in the 3D view.
@@ -90,102 +265,29 @@ class ROTOR_GGT_MirrorGizmoGroup(bpy.types.GizmoGroup):
         self.gizmos_arrows = []
         self.gizmos_boxes = []
         self.gizmos_colelction_arrows = []
+        self._applied_revision = None
 
     @classmethod
     def poll(cls, context) -> bool:
         """Show gizmos only when the mirror tool is active and objects are selected."""
-        active_tool = bpy.context.workspace.tools.from_space_view3d_mode(
-            bpy.context.mode, create=False
+        active_tool = context.workspace.tools.from_space_view3d_mode(
+            context.mode, create=False
         )
-        selected_objects = [
-            obj for obj in bpy.context.selected_objects if obj.type == "MESH"
-        ]
         return bool(
             active_tool
             and active_tool.idname == "mirror.mirror_tool"
-            and selected_objects
+            and any(obj.type == "MESH" for obj in context.selected_objects)
         )
 
-    def _get_arrow_colors_and_highlights(self, context):
-        """Return (arrow_colors, arrow_highlights) for the 6 gizmo arrows based on the last mirror modifier."""
-        theme_axis = addon.pref().theme.axis
-        mirror_tool = addon.pref().tools.mirror
-        reverse_controls = mirror_tool.reverse_controls
-        axis_color_names = ["x", "x", "y", "y", "z", "z"]
-        axis_highlight_names = ["x", "x", "y", "y", "z", "z"]
-        # Default: all axis colors
-        arrow_colors = [theme_axis.g] * 6
-        arrow_highlights = [
-            getattr(theme_axis, axis_highlight_names[i]) for i in range(6)
-        ]
-
-        # Real mode: skip modifier-state coloring, return default colors
-        if mirror_tool.real:
-            return arrow_colors, arrow_highlights
-
-        # Find active mesh
-        active_mesh = (
-            context.active_object
-            if (
-                context.active_object
-                and context.active_object.type == "MESH"
-                and context.active_object.select_get()
-            )
-            else None
-        )
-        if not active_mesh:
-            selected_meshes = [
-                obj for obj in context.selected_objects if obj.type == "MESH"
-            ]
-            active_mesh = selected_meshes[0] if selected_meshes else None
-
-        if active_mesh:
-            axis_state = None
-            if is_chisel_object(active_mesh):
-                # Chisel objects: read the last pinned chisel mirror item
-                chisel_item, _ = get_chisel_mirror_item(active_mesh)
-                if chisel_item:
-                    axis_state = chisel_axis_state(chisel_item)
-            else:
-                # Find last pinned mirror modifier (iterate in reverse to get the most recent)
-                mirror_mod = None
-                for mod in reversed(active_mesh.modifiers):
-                    if mod.type == "MIRROR" and mod.use_pin_to_last:
-                        mirror_mod = mod
-                        break
-                if mirror_mod:
-                    axis_state = (
-                        mirror_mod.use_axis,
-                        mirror_mod.use_bisect_flip_axis,
-                    )
-            if axis_state is not None:
-                use_axis, use_flip = axis_state
-                # Start with all gray, only color used axes
-                for i, (pos_idx, neg_idx) in enumerate([(0, 1), (2, 3), (4, 5)]):
-                    axis_color = getattr(theme_axis, "xyz"[i])
-                    if use_axis[i]:
-                        # Swap indices when reverse_controls is enabled
-                        if reverse_controls:
-                            pos_idx, neg_idx = neg_idx, pos_idx
-                        if use_flip[i]:
-                            # Negative axis (X-, Y-, Z-)
-                            arrow_colors[neg_idx] = axis_color
-                        else:
-                            # Positive axis (X+, Y+, Z+)
-                            arrow_colors[pos_idx] = axis_color
-                # Highlights always axis color
-                arrow_highlights = [
-                    getattr(theme_axis, axis_color_names[i]) for i in range(6)
-                ]
-        return arrow_colors, arrow_highlights
-
     def setup(self, context):
         """Create axis arrow gizmos with color logic based on mirror modifier, and box gizmos with always axis color."""
         self.gizmos_arrows.clear()
         self.gizmos_boxes.clear()
         self.gizmos_colelction_arrows.clear()
+        self._applied_revision = None
+        gizmo_state.subscribe()
 
-        arrow_colors, arrow_highlights = self._get_arrow_colors_and_highlights(context)
+        arrow_colors, arrow_highlights = arrow_colors_and_highlights(context)
 
         theme_axis = addon.pref().theme.axis
         mirror_tool = addon.pref().tools.mirror
@@ -226,7 +328,7 @@ class ROTOR_GGT_MirrorGizmoGroup(bpy.types.GizmoGroup):
             gz_collection_arrow.hide = hide_collection_gizmos
             self.gizmos_colelction_arrows.append((gz_collection_arrow, tag))
 
-            main_color = getattr(addon.pref().theme.axis, axis_name)
+            main_color = getattr(theme_axis, axis_name)
             gz_box = set_mirror_gizmo(self, axis, main_color, idx, gizmo_size)
             gz_box.color_highlight = lighter(color, 0.5)[:3]
             gz_box.alpha_highlight = color[3]
@@ -237,146 +339,59 @@ class ROTOR_GGT_MirrorGizmoGroup(bpy.types.GizmoGroup):
             self.gizmos_boxes.append((gz_box, tag))
 
     def draw_prepare(self, context):
-        """Update gizmo transforms, colors, and highlights each frame."""
-        pref = addon.pref()
-        mirror_tool = pref.tools.mirror
-        orientation = getattr(mirror_tool, "orientation", "GLOBAL")
-        pivot = getattr(mirror_tool, "pivot", "ACTIVE")
-        origin = self._get_origin(context, pivot)
-        mat = self._get_orientation_matrix(context, orientation)
+        """Re-apply matrices and colors when the gizmo state changed; fade
+        axes facing the view on every redraw."""
+        state = gizmo_state
+        revision = state.refresh(context)
+        if self._applied_revision != revision:
+            self._apply(state)
+            self._applied_revision = revision
+
         camera_pos, view_direction, use_perspective = self._get_camera_info(
-            context, origin
+            context, state.origin
         )
-        axis_matrices = self._get_axis_matrices()
-        arrow_colors, arrow_highlights = self._get_arrow_colors_and_highlights(context)
-        obj = context.active_object
+        for gizmos, colors in (
+            (self.gizmos_colelction_arrows, [state.neutral_color] * 6),
+            (self.gizmos_arrows, state.arrow_colors),
+            (self.gizmos_boxes, state.box_colors),
+        ):
+            for idx, (gz, tag) in enumerate(gizmos):
+                dot = self._get_dot(
+                    camera_pos, state.origin, state.axis_world[tag],
+                    view_direction, use_perspective,
+                )
+                gz.alpha = colors[idx][3] * self._get_alpha_mult(dot)
+                self._update_highlight(gz, tag)
 
-        hide_collection_gizmos = True if mirror_tool.element == "OBJECT" else False
-        hide_mirror_gizmos = True if mirror_tool.element == "COLLECTION" else False
+    def _apply(self, state):
+        """Set the view-independent gizmo properties from ``state``."""
+        hide_collection_gizmos = state.element == "OBJECT"
+        hide_mirror_gizmos = state.element == "COLLECTION"
 
         for idx, (gz_arrow, tag) in enumerate(self.gizmos_colelction_arrows):
-            axis, sign = tag[0].lower(), 1 if tag[1] == "+" else -1
-            axis_vec = self._axis_vector(axis, sign)
-            axis_world = (
-                mat @ axis_vec
-                if orientation in ("LOCAL", "CURSOR", "CUSTOM")
-                else axis_vec
-            )
-            dot = self._get_dot(
-                camera_pos, origin, axis_world, view_direction, use_perspective
-            )
-            alpha_mult = self._get_alpha_mult(dot)
-            arrow_m = axis_matrices[tag].to_4x4()
-            if orientation == "LOCAL" and obj:
-                rot_mat = obj.matrix_world.to_3x3().normalized().to_4x4()
-                arrow_m = rot_mat @ arrow_m
-            elif orientation == "CURSOR":
-                rot_mat = context.scene.cursor.rotation_euler.to_matrix().to_4x4()
-                arrow_m = rot_mat @ arrow_m
-            elif orientation == "CUSTOM":
-                rot_mat = Euler(mirror_tool.custom_rotation, "XYZ").to_matrix().to_4x4()
-                arrow_m = rot_mat @ arrow_m
-            arrow_m.translation = origin
-            gz_arrow.matrix_basis = arrow_m
-            color = getattr(addon.pref().theme.axis, "n")
-            highlight_color = arrow_highlights[idx]
-            gz_arrow.color = color[:3]
-            gz_arrow.alpha = color[3] * alpha_mult
+            highlight_color = state.arrow_highlights[idx]
+            gz_arrow.matrix_basis = state.matrices[tag]
+            gz_arrow.color = state.neutral_color[:3]
             gz_arrow.color_highlight = lighter(highlight_color, 0.5)[:3]
             gz_arrow.alpha_highlight = highlight_color[3]
             gz_arrow.hide = hide_collection_gizmos
-            self._update_highlight(gz_arrow, tag)
 
         for idx, (gz_arrow, tag) in enumerate(self.gizmos_arrows):
-            axis, sign = tag[0].lower(), 1 if tag[1] == "+" else -1
-            axis_vec = self._axis_vector(axis, sign)
-            axis_world = (
-                mat @ axis_vec
-                if orientation in ("LOCAL", "CURSOR", "CUSTOM")
-                else axis_vec
-            )
-            dot = self._get_dot(
-                camera_pos, origin, axis_world, view_direction, use_perspective
-            )
-            alpha_mult = self._get_alpha_mult(dot)
-            arrow_m = axis_matrices[tag].to_4x4()
-            if orientation == "LOCAL" and obj:
-                rot_mat = obj.matrix_world.to_3x3().normalized().to_4x4()
-                arrow_m = rot_mat @ arrow_m
-            elif orientation == "CURSOR":
-                rot_mat = context.scene.cursor.rotation_euler.to_matrix().to_4x4()
-                arrow_m = rot_mat @ arrow_m
-            elif orientation == "CUSTOM":
-                rot_mat = Euler(mirror_tool.custom_rotation, "XYZ").to_matrix().to_4x4()
-                arrow_m = rot_mat @ arrow_m
-            arrow_m.translation = origin
-            gz_arrow.matrix_basis = arrow_m
-            color = arrow_colors[idx]
-            highlight_color = arrow_highlights[idx]
+            color = state.arrow_colors[idx]
+            highlight_color = state.arrow_highlights[idx]
+            gz_arrow.matrix_basis = state.matrices[tag]
             gz_arrow.color = color[:3]
-            gz_arrow.alpha = color[3] * alpha_mult
             gz_arrow.color_highlight = lighter(highlight_color, 0.5)[:3]
             gz_arrow.alpha_highlight = highlight_color[3]
             gz_arrow.hide = hide_mirror_gizmos
-            self._update_highlight(gz_arrow, tag)
 
         for idx, (gz_box, tag) in enumerate(self.gizmos_boxes):
-            axis, sign = tag[0].lower(), 1 if tag[1] == "+" else -1
-            axis_vec = self._axis_vector(axis, sign)
-            axis_world = (
-                mat @ axis_vec
-                if orientation in ("LOCAL", "CURSOR", "CUSTOM")
-                else axis_vec
-            )
-            dot = self._get_dot(
-                camera_pos, origin, axis_world, view_direction, use_perspective
-            )
-            alpha_mult = self._get_alpha_mult(dot)
-            box_m = axis_matrices[tag].to_4x4()
-            if orientation == "LOCAL" and context.active_object:
-                rot_mat = (
-                    context.active_object.matrix_world.to_3x3().normalized().to_4x4()
-                )
-                box_m = rot_mat @ box_m
-            elif orientation == "CURSOR":
-                rot_mat = context.scene.cursor.rotation_euler.to_matrix().to_4x4()
-                box_m = rot_mat @ box_m
-            elif orientation == "CUSTOM":
-                rot_mat = Euler(mirror_tool.custom_rotation, "XYZ").to_matrix().to_4x4()
-                box_m = rot_mat @ box_m
-            box_m.translation = origin
-            gz_box.matrix_basis = box_m
-            box_color = getattr(addon.pref().theme.axis, ARROW_AXES[idx][1])
+            box_color = state.box_colors[idx]
+            gz_box.matrix_basis = state.matrices[tag]
             gz_box.color = box_color[:3]
-            gz_box.alpha = box_color[3] * alpha_mult
             gz_box.color_highlight = lighter(box_color, 0.5)[:3]
             gz_box.alpha_highlight = box_color[3]
             gz_box.hide_select = hide_mirror_gizmos
-            self._update_highlight(gz_box, tag)
-
-    def _get_origin(self, context, pivot):
-        if pivot == "WORLD":
-            return Vector((0, 0, 0))
-        elif pivot == "ACTIVE" and context.active_object:
-            return context.active_object.matrix_world.translation
-        elif pivot == "CURSOR":
-            return context.scene.cursor.location
-        elif pivot == "CUSTOM":
-            return Vector(addon.pref().tools.mirror.custom_location)
-        elif context.active_object:
-            return context.active_object.matrix_world.translation
-        return Vector((0, 0, 0))
-
-    def _get_orientation_matrix(self, context, orientation):
-        if orientation == "GLOBAL":
-            return Matrix.Identity(3)
-        elif orientation == "LOCAL" and context.active_object:
-            return context.active_object.matrix_world.to_3x3().normalized()
-        elif orientation == "CURSOR":
-            return context.scene.cursor.rotation_euler.to_matrix()
-        elif orientation == "CUSTOM":
-            return Euler(addon.pref().tools.mirror.custom_rotation, "XYZ").to_matrix()
-        return Matrix.Identity(3)
 
     def _get_camera_info(self, context, origin):
         rv3d = context.region_data
@@ -395,23 +410,6 @@ class ROTOR_GGT_MirrorGizmoGroup(bpy.types.GizmoGroup):
             use_perspective = True
         return camera_pos, view_direction, use_perspective
 
-    def _get_axis_matrices(self):
-        return {
-            "X+": Matrix(([0, 0, 1], [0, 1, 0], [-1, 0, 0])),
-            "X-": Matrix(([0, 0, -1], [0, 1, 0], [1, 0, 0])),
-            "Y+": Matrix(([1, 0, 0], [0, 0, 1], [0, -1, 0])),
-            "Y-": Matrix(([1, 0, 0], [0, 0, -1], [0, 1, 0])),
-            "Z+": Matrix(([1, 0, 0], [0, 1, 0], [0, 0, 1])),
-            "Z-": Matrix(([-1, 0, 0], [0, 1, 0], [0, 0, -1])),
-        }
-
-    def _axis_vector(self, axis: str, sign: int) -> Vector:
-        if axis == "x":
-            return Vector((sign, 0, 0))
-        elif axis == "y":
-            return Vector((0, sign, 0))
-        return Vector((0, 0, sign))
-
     def _get_dot(self, camera_pos, origin, axis_world, view_direction, use_perspective):
         if use_perspective:
             to_camera = (camera_pos - origin).normalized()
@@ -419,10 +417,9 @@ class ROTOR_GGT_MirrorGizmoGroup(bpy.types.GizmoGroup):
         return -view_direction.dot(axis_world)
 
     def _get_alpha_mult(self, dot: float) -> float:
-        fade_threshold = 0.985
         abs_dot = abs(dot)
-        if abs_dot > fade_threshold:
-            return 1.0 - ((abs_dot - fade_threshold) / (1.0 - fade_threshold))
+        if abs_dot > FADE_THRESHOLD:
+            return 1.0 - ((abs_dot - FADE_THRESHOLD) / (1.0 - FADE_THRESHOLD))
         return 1.0
 
     def _update_highlight(self, gz, tag):
@@ -1,27 +1,17 @@
 import bpy
-from mathutils import Matrix, Vector
+from mathutils import Vector
 
-from ..ops.mirror_mesh_utils import get_mesh_mirror_frame
+from ..ops.mirror_mesh_utils import mesh_frame_cache
 from ..utils import addon
 from .mirror import (
     ARROW_AXES,
+    AXIS_MATRICES,
+    FADE_THRESHOLD,
     create_mirror_gizmo,
     lighter,
     set_mirror_gizmo,
 )
 
-# Orientation of the arrow_3d gizmo (default points +Z) onto each signed axis.
-AXIS_MATRICES = {
-    "X+": Matrix(([0, 0, 1], [0, 1, 0], [-1, 0, 0])),
-    "X-": Matrix(([0, 0, -1], [0, 1, 0], [1, 0, 0])),
-    "Y+": Matrix(([1, 0, 0], [0, 0, 1], [0, -1, 0])),
-    "Y-": Matrix(([1, 0, 0], [0, 0, -1], [0, 1, 0])),
-    "Z+": Matrix(([1, 0, 0], [0, 1, 0], [0, 0, 1])),
-    "Z-": Matrix(([-1, 0, 0], [0, 1, 0], [0, 0, -1])),
-}
-
-FADE_THRESHOLD = 0.985
-
 
 class ROTOR_GGT_MirrorMeshGizmoGroup(bpy.types.GizmoGroup):
     """Axis gizmos for the edit-mode Mirror tool.
@@ -40,6 +30,7 @@ class ROTOR_GGT_MirrorMeshGizmoGroup(bpy.types.GizmoGroup):
         super().__init__(*args, **kwargs)
         self.gizmos_arrows = []
         self.gizmos_boxes = []
+        self._placed_revision = None
 
     @classmethod
     def poll(cls, context):
@@ -57,6 +48,7 @@ class ROTOR_GGT_MirrorMeshGizmoGroup(bpy.types.GizmoGroup):
     def setup(self, context):
         self.gizmos_arrows.clear()
         self.gizmos_boxes.clear()
+        self._placed_revision = None
 
         theme_axis = addon.pref().theme.axis
         pref = addon.pref().tools.mesh
@@ -120,42 +112,51 @@ class ROTOR_GGT_MirrorMeshGizmoGroup(bpy.types.GizmoGroup):
     def draw_prepare(self, context):
         all_gizmos = self.gizmos_arrows + self.gizmos_boxes
 
-        frame_data = get_mesh_mirror_frame(context)
+        frame_data = mesh_frame_cache.get(context)
         if frame_data is None:
             for gz, _ in all_gizmos:
                 gz.hide = True
+            self._placed_revision = None
             return
 
         origin, frame = frame_data
-        rot4 = frame.to_4x4()
+        # Matrices only change with the frame; per redraw only the
+        # view-dependent fade below is recomputed.
+        if self._placed_revision != mesh_frame_cache.revision:
+            self._place(frame_data)
+            self._placed_revision = mesh_frame_cache.revision
+
         theme_axis = addon.pref().theme.axis
         camera_pos, view_direction, use_perspective = self._camera_info(context, origin)
+        to_camera = (camera_pos - origin).normalized()
 
         def alpha_for(tag):
             axis_world = (frame @ self._axis_vector(tag)).normalized()
             if use_perspective:
-                dot = (camera_pos - origin).normalized().dot(axis_world)
+                dot = to_camera.dot(axis_world)
             else:
                 dot = -view_direction.dot(axis_world)
             return self._alpha_mult(dot)
 
         for gz, tag in self.gizmos_arrows:
-            gz.hide = False
-            m = rot4 @ AXIS_MATRICES[tag].to_4x4()
-            m.translation = origin
-            gz.matrix_basis = m
             color = theme_axis.g
             gz.color = color[:3]
             gz.alpha = color[3] * alpha_for(tag)
 
         for idx, (gz, tag) in enumerate(self.gizmos_boxes):
+            color = getattr(theme_axis, ARROW_AXES[idx][1])
+            gz.color = color[:3]
+            gz.alpha = color[3] * alpha_for(tag)
+
+    def _place(self, frame_data):
+        """Position every gizmo on the mirror frame."""
+        origin, frame = frame_data
+        rot4 = frame.to_4x4()
+        for gz, tag in self.gizmos_arrows + self.gizmos_boxes:
             gz.hide = False
             m = rot4 @ AXIS_MATRICES[tag].to_4x4()
             m.translation = origin
             gz.matrix_basis = m
-            color = getattr(theme_axis, ARROW_AXES[idx][1])
-            gz.color = color[:3]
-            gz.alpha = color[3] * alpha_for(tag)
 
 
 classes = (ROTOR_GGT_MirrorMeshGizmoGroup,)
@@ -5,6 +5,11 @@ from . import (
     mirror_add_axis,
     mirror_add_collection,
     mirror_mesh,
+    mirror_live,
+    mirror_select,
+    mirror_asymmetry,
+    mirror_pivots,
+    mirror_index,
     mirror_custom_plane,
     mirror_set_orientation,
     mirror_fallback_tool,
@@ -21,6 +26,12 @@ class Scene(bpy.types.PropertyGroup):
     last_tool: bpy.props.StringProperty(
         name="Last Tool", description="Last active tool before mirror tool", default=""
     )
+    mirror_filter: bpy.props.StringProperty(
+        name="Filter", description="Only list mirrored objects whose name contains this text", default=""
+    )
+    mirror_page: bpy.props.IntProperty(
+        name="Page", description="Page of the mirror listing", default=1, min=1
+    )
 
 
 types_classes = (
@@ -36,6 +47,11 @@ classes = (
     *mirror_add_axis.classes,
     *mirror_add_collection.classes,
     *mirror_mesh.classes,
+    *mirror_live.classes,
+    *mirror_select.classes,
+    *mirror_asymmetry.classes,
+    *mirror_pivots.classes,
+    *mirror_index.classes,
     *mirror_custom_plane.classes,
     *mirror_set_orientation.classes,
     *mirror_fallback_tool.classes,
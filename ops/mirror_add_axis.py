@@ -1,7 +1,13 @@
 import bpy
 from bpy.props import CollectionProperty, IntProperty
 from ..utils import addon
-from .mirror_utils import get_mirror_object, create_mirror_modifier, bisect_object, execute_real_mirror
+from .mirror_utils import (
+    get_mirror_object,
+    create_mirror_modifier,
+    execute_real_mirror,
+    modifier_template,
+)
+from .mirror_bisect import bisect_objects, report_cleared
 from .mirror_chisel import is_chisel_object, add_chisel_mirror
 from .mirror_props import ROTOR_PG_MirrorObjectItem
 
@@ -112,6 +118,14 @@ class ROTOR_OT_AddMirrorAxis(bpy.types.Operator):
             context, active_object, pivot, orientation
         )
 
+        # Bisect every object in one batch (chisel objects are skipped)
+        cleared = []
+        if pref.bisect:
+            cleared = bisect_objects(
+                context, enabled_objects, axis_idx, pivot, orientation, is_neg
+            )
+
+        template = modifier_template()
         affected_count = 0
         for obj in enabled_objects:
             # Chisel objects: add a chisel mirror item instead of a modifier
@@ -123,16 +137,15 @@ class ROTOR_OT_AddMirrorAxis(bpy.types.Operator):
                 affected_count += 1
                 continue
 
-            if pref.bisect:
-                bisect_object(obj, axis_idx, pivot, orientation, context, is_neg)
-
             create_mirror_modifier(
-                context, obj, mirror_object, individual, axis_idx, is_neg
+                context, obj, mirror_object, individual, axis_idx, is_neg,
+                template=template,
             )
             affected_count += 1
 
         # Report success
         self.report({"INFO"}, f"Added mirror modifiers to {affected_count} objects.")
+        report_cleared(self, cleared)
 
         # Check if we should return to previous tool
         pref = addon.pref().tools.mirror
@@ -1,8 +1,8 @@
 import bpy
 from bpy.props import CollectionProperty
-from mathutils import Euler, Matrix, Vector
 from ..utils import addon
-from .mirror_utils import bisect_object
+from .mirror_bisect import bisect_objects, report_cleared
+from .mirror_plane import PlaneResolver
 from .mirror_props import ROTOR_PG_MirrorCollectionItem
 
 
@@ -85,19 +85,27 @@ class ROTOR_OT_AddMirrorCollection(bpy.types.Operator):
                         collections.add(col)
             enabled_collections = list(collections)
 
+        # Bisect the mesh objects of every collection in one batch
+        cleared = []
+        if pref.bisect:
+            mesh_objects = {
+                obj: None
+                for col in enabled_collections
+                for obj in col.objects
+                if obj.type == "MESH"
+            }
+            cleared = bisect_objects(
+                context, list(mesh_objects), axis_idx, pivot, orientation, is_neg
+            )
+
         # Avoid double instancing
+        resolver = PlaneResolver(context, axis_idx)
         created = set()
         for col in enabled_collections:
             if col in created:
                 continue
             created.add(col)
 
-            # Perform bisect operation if preference is enabled
-            if pref.bisect:
-                mesh_objects = [obj for obj in col.objects if obj.type == "MESH"]
-                for obj in mesh_objects:
-                    bisect_object(obj, axis_idx, pivot, orientation, context, is_neg)
-
             # Create an empty to instance the collection
             empty = bpy.data.objects.new(f"RotorMirrorInstance_{col.name}", None)
             empty.instance_type = "COLLECTION"
@@ -105,74 +113,9 @@ class ROTOR_OT_AddMirrorCollection(bpy.types.Operator):
             empty.empty_display_type = pref.empty_display_type
             empty.empty_display_size = pref.empty_display_size
 
-            # Always use -1 scale for mirroring on the selected axis
-            scale_vec = [1.0, 1.0, 1.0]
-            scale_vec[axis_idx] = -1.0
-            mirror_mat = (
-                Matrix.Scale(scale_vec[0], 4, Vector((1, 0, 0)))
-                @ Matrix.Scale(scale_vec[1], 4, Vector((0, 1, 0)))
-                @ Matrix.Scale(scale_vec[2], 4, Vector((0, 0, 1)))
-            )
-
-            if pivot == "WORLD":
-                pivot_point = Vector((0, 0, 0))
-            elif pivot == "ACTIVE" and context.active_object:
-                pivot_point = context.active_object.location.copy()
-            elif pivot == "INDIVIDUAL":
-                objs_in_col = [o for o in col.objects if o.type == "MESH"]
-                if objs_in_col:
-                    locs = [o.location for o in objs_in_col]
-                    pivot_point = sum(locs, Vector((0, 0, 0))) / len(locs)
-                else:
-                    pivot_point = Vector((0, 0, 0))
-            elif pivot == "CURSOR":
-                pivot_point = context.scene.cursor.location.copy()
-            elif pivot == "CUSTOM":
-                pivot_point = Vector(pref.custom_location)
-            else:
-                pivot_point = Vector((0, 0, 0))
-
-            # Compose the correct transformation: T @ R @ S @ R_inv @ T_inv
-            rot_mat = None
-            if orientation == "LOCAL":
-                if pivot == "ACTIVE" and context.active_object:
-                    rot_mat = context.active_object.rotation_euler.to_matrix().to_4x4()
-                elif pivot == "INDIVIDUAL":
-                    objs_in_col = [o for o in col.objects if o.type == "MESH"]
-                    if objs_in_col:
-                        mats = [
-                            o.rotation_euler.to_matrix().to_4x4() for o in objs_in_col
-                        ]
-                        avg_mat = sum(mats, Matrix()) * (1.0 / len(mats))
-                        rot_mat = avg_mat
-                elif pivot in ("WORLD", "CURSOR", "CUSTOM"):
-                    # For LOCAL orientation with WORLD/CURSOR/CUSTOM pivot, use collection objects' average rotation
-                    objs_in_col = [o for o in col.objects if o.type == "MESH"]
-                    if objs_in_col:
-                        mats = [
-                            o.rotation_euler.to_matrix().to_4x4() for o in objs_in_col
-                        ]
-                        avg_mat = sum(mats, Matrix()) * (1.0 / len(mats))
-                        rot_mat = avg_mat
-            elif orientation == "CURSOR":
-                # CURSOR orientation uses cursor rotation regardless of pivot
-                rot_mat = context.scene.cursor.rotation_euler.to_matrix().to_4x4()
-            elif orientation == "CUSTOM":
-                # CUSTOM orientation uses the custom rotation regardless of pivot
-                rot_mat = Euler(pref.custom_rotation, "XYZ").to_matrix().to_4x4()
-            # For GLOBAL orientation, rot_mat stays None
-
-            T = Matrix.Translation(pivot_point)
-            T_inv = Matrix.Translation(-pivot_point)
-            S = mirror_mat
-            if rot_mat is not None:
-                R = rot_mat
-                R_inv = rot_mat.inverted()
-                mirror_xform = T @ R @ S @ R_inv @ T_inv
-            else:
-                mirror_xform = T @ S @ T_inv
-
-            empty.matrix_world = mirror_xform
+            # Mirror across the plane of the collection's mesh objects
+            plane = resolver.group(o for o in col.objects if o.type == "MESH")
+            empty.matrix_world = plane.xform
             # Link empty to the Scene Collection, not to the instanced collection
             bpy.context.scene.collection.objects.link(empty)
 
@@ -181,6 +124,7 @@ class ROTOR_OT_AddMirrorCollection(bpy.types.Operator):
             self.report({"INFO"}, f"Mirrored {len(created)} collections.")
         else:
             self.report({"WARNING"}, "No collections were mirrored.")
+        report_cleared(self, cleared)
 
         # Check if we should return to previous tool
         pref = addon.pref().tools.mirror
@@ -0,0 +1,225 @@
+"""Asymmetry check and repair across the Mirror Mesh plane.
+
+Every vertex off the plane is reflected and looked up in the cached KD-tree of
+the mesh (``mirror_symmetry``); its deviation is the distance from that
+reflection to the nearest vertex. Vertices deviating more than the threshold
+are reported and highlighted in the viewport.
+
+Repair snaps mutual nearest pairs within the repair distance to exact
+symmetry, keeping the chosen side as master, and projects lone vertices near
+the plane onto it. Classification and snapping are array operations; only the
+tree queries and the final write-back of moved vertices touch Python objects.
+"""
+
+import bmesh
+import bpy
+import numpy as np
+
+from ..shaders import handle as handle_mod
+from ..utils import addon
+from .mirror_mesh_numpy import reflect, signed_distance, vert_coords
+from .mirror_mesh_utils import get_mesh_mirror_plane
+from .mirror_symmetry import symmetry_cache
+
+overlay = handle_mod.Points()
+
+
+def nearest_vertices(tree, points):
+    """Nearest tree index and distance for each row of ``points``."""
+    found = [tree.find(p) for p in points.tolist()]
+    index = np.fromiter(
+        (-1 if f[1] is None else f[1] for f in found), dtype=np.int64, count=len(found)
+    )
+    dist = np.fromiter(
+        (np.inf if f[1] is None else f[2] for f in found), dtype=np.float64, count=len(found)
+    )
+    return index, dist
+
+
+def symmetry_deviation(tree, co, plane_co, plane_no, tol):
+    """Per-vertex ``(nearest, deviation, dist)`` arrays across the plane.
+
+    Vertices within ``tol`` of the plane are their own counterpart with zero
+    deviation. ``dist`` is the signed distance to the plane.
+    """
+    dist = signed_distance(co, plane_co, plane_no)
+    nearest = np.arange(len(co))
+    deviation = np.zeros(len(co))
+
+    off = np.flatnonzero(np.abs(dist) > tol)
+    if len(off):
+        reflected = reflect(co[off], plane_co, plane_no, dist[off])
+        nearest[off], deviation[off] = nearest_vertices(tree, reflected)
+    return nearest, deviation, dist
+
+
+def repair_symmetry(co, nearest, deviation, dist, plane_co, plane_no, master, max_dist):
+    """Snap near-symmetric pairs in ``co`` to exact symmetry.
+
+    Returns the indices of the moved vertices. ``master`` is ``1`` or ``-1``,
+    the side of the plane whose vertices are kept.
+    """
+    index = np.arange(len(co))
+    side = np.sign(dist)
+
+    # Mutual nearest pairs with the master on the given side.
+    pairable = (side == master) & (nearest >= 0) & (deviation <= max_dist)
+    masters = index[pairable]
+    slaves = nearest[masters]
+    mutual = (nearest[slaves] == masters) & (side[slaves] == -master)
+    masters, slaves = masters[mutual], slaves[mutual]
+
+    target = reflect(co[masters], plane_co, plane_no, dist[masters])
+    moved_pairs = (co[slaves] != target).any(axis=1)
+    co[slaves] = target
+
+    # Lone vertices close to the plane: project onto it.
+    paired = np.zeros(len(co), dtype=bool)
+    paired[masters] = paired[slaves] = True
+    lone = index[(side != 0) & ~paired & (np.abs(dist) <= max_dist) & (nearest == index)]
+    co[lone] -= np.asarray(plane_no, dtype=np.float32) * dist[lone].astype(np.float32)[:, None]
+
+    return np.concatenate((slaves[moved_pairs], lone))
+
+
+class ROTOR_OT_CheckSymmetry(bpy.types.Operator):
+    """Find vertices without a mirrored counterpart across the Mirror Mesh plane"""
+
+    bl_idname = "mirror.check_symmetry"
+    bl_label = "Check Symmetry"
+    bl_options = {"REGISTER", "UNDO"}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ("CHECK", "Check", "Report and highlight asymmetric vertices"),
+            ("REPAIR", "Repair", "Snap near-symmetric vertices to exact symmetry"),
+            ("CLEAR", "Clear", "Remove the highlight"),
+        ],
+        default="CHECK",
+    )
+    axis: bpy.props.EnumProperty(
+        name="Axis",
+        description="Axis of the mirror frame used as the plane normal",
+        items=[("X", "X", ""), ("Y", "Y", ""), ("Z", "Z", "")],
+    )
+    master: bpy.props.EnumProperty(
+        name="Master",
+        description="Side of the plane kept when repairing",
+        items=[
+            ("POSITIVE", "Positive", "Keep the side the axis points to"),
+            ("NEGATIVE", "Negative", "Keep the side opposite to the axis"),
+        ],
+        default="POSITIVE",
+    )
+    threshold: bpy.props.FloatProperty(
+        name="Threshold",
+        description="Deviation above which a vertex counts as asymmetric",
+        default=0.0001,
+        min=0.0,
+        soft_max=0.01,
+        precision=5,
+        unit="LENGTH",
+    )
+    repair_distance: bpy.props.FloatProperty(
+        name="Repair Distance",
+        description="Maximum deviation of a pair that is snapped when repairing",
+        default=0.01,
+        min=0.0,
+        soft_max=0.1,
+        precision=4,
+        unit="LENGTH",
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return (
+            context.mode == "EDIT_MESH"
+            and context.edit_object is not None
+            and context.edit_object.type == "MESH"
+        )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.prop(self, "mode")
+        layout.prop(self, "axis")
+        layout.prop(self, "threshold")
+        if self.mode == "REPAIR":
+            layout.prop(self, "master")
+            layout.prop(self, "repair_distance")
+
+    def execute(self, context):
+        if self.mode == "CLEAR":
+            overlay.remove()
+            self._redraw(context)
+            return {"FINISHED"}
+
+        obj = context.edit_object
+        me = obj.data
+        bm = bmesh.from_edit_mesh(me)
+        if not len(bm.verts):
+            self.report({"WARNING"}, "Mesh has no vertices.")
+            return {"CANCELLED"}
+
+        plane = get_mesh_mirror_plane(context, self.axis)
+        if plane is None:
+            self.report({"WARNING"}, "No usable mirror plane for the current selection.")
+            return {"CANCELLED"}
+        plane_co, plane_no = plane
+        tol = max(self.threshold, addon.pref().tools.mesh.merge_threshold, 1e-5)
+
+        co = vert_coords(bm.verts[:])
+        tree = symmetry_cache.tree(me, bm)
+        nearest, deviation, dist = symmetry_deviation(tree, co, plane_co, plane_no, tol)
+
+        repaired = 0
+        if self.mode == "REPAIR":
+            master = 1 if self.master == "POSITIVE" else -1
+            moved = repair_symmetry(
+                co, nearest, deviation, dist, plane_co, plane_no,
+                master, max(self.repair_distance, tol),
+            )
+            repaired = len(moved)
+            if repaired:
+                bm.verts.ensure_lookup_table()
+                for i, c in zip(moved.tolist(), co[moved].tolist()):
+                    bm.verts[i].co = c
+                bm.normal_update()
+                bmesh.update_edit_mesh(me, loop_triangles=True, destructive=False)
+                symmetry_cache.invalidate(me)
+                tree = symmetry_cache.tree(me, bm)
+                nearest, deviation, dist = symmetry_deviation(
+                    tree, co, plane_co, plane_no, tol
+                )
+
+        asymmetric = np.flatnonzero(deviation > self.threshold)
+        self._highlight(context, obj, co[asymmetric])
+
+        finite = deviation[np.isfinite(deviation)]
+        max_dev = float(finite.max()) if len(finite) else 0.0
+        message = f"{len(asymmetric)} asymmetric vertices, max deviation {max_dev:.6g}"
+        if self.mode == "REPAIR":
+            message = f"Repaired {repaired} vertices. {message}"
+        self.report({"WARNING"} if len(asymmetric) else {"INFO"}, message + ".")
+        return {"FINISHED"}
+
+    def _highlight(self, context, obj, co):
+        if not len(co):
+            overlay.remove()
+        else:
+            mw = np.array(obj.matrix_world, dtype=np.float64)
+            world = co @ mw[:3, :3].T + mw[:3, 3]
+            if overlay.handle is None:
+                overlay.create(context)
+            overlay.callback.update(obj.name, world.astype(np.float32))
+        self._redraw(context)
+
+    @staticmethod
+    def _redraw(context):
+        for area in context.screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+
+
+classes = (ROTOR_OT_CheckSymmetry,)
@@ -0,0 +1,118 @@
+"""Real mirrors baked into mesh data.
+
+A real mirror normally gets ``mirror_xform @ matrix_world``, a transform with
+a negative determinant. Baking flips the mesh along the local mirror axis
+instead (positions, shape keys, custom normals and winding); ``place_mirrors``
+then gives the object ``mirror_xform @ matrix_world @ flip``: the same result
+in world space with a positive transform. The local flip commutes with the
+object scale, so no shear is introduced.
+
+Modifiers run in local space, so the copy's modifiers only give the same
+result when they don't depend on the local axes. Mirror modifiers across the
+object's own origin get the bisect side flipped on the baked axis; mirrors
+across another object, and the types in ``AXIS_FREE_MODIFIERS``, work
+unchanged. Objects with any other modifier are not bakeable (``bakeable``)
+and take the unbaked, negative-scale path instead.
+
+Objects sharing mesh data share one baked mesh.
+"""
+
+import numpy as np
+
+from ..utils.mesh_data import winding_order
+from .mirror_utils import reverse_faces
+
+
+# Modifier types whose result doesn't depend on the local axes, so they act the
+# same on the flipped data. MIRROR is handled by ``flip_modifiers``.
+AXIS_FREE_MODIFIERS = {
+    "BEVEL",
+    "BOOLEAN",
+    "DECIMATE",
+    "EDGE_SPLIT",
+    "MIRROR",
+    "SOLIDIFY",
+    "SUBSURF",
+    "TRIANGULATE",
+    "WEIGHTED_NORMAL",
+    "WELD",
+    "WIREFRAME",
+}
+
+
+def bakeable(obj):
+    """Whether every modifier of ``obj`` gives the same result on baked data."""
+    return all(mod.type in AXIS_FREE_MODIFIERS for mod in obj.modifiers)
+
+
+def flip_modifiers(obj, axis_idx):
+    """Adjust the modifiers of a baked copy to its data flipped along ``axis_idx``.
+
+    A mirror modifier without mirror object mirrors across the object's own
+    frame, so the half its bisect keeps along ``axis_idx`` swaps sides.
+    """
+    for mod in obj.modifiers:
+        if mod.type == "MIRROR" and mod.mirror_object is None:
+            flip = mod.use_bisect_flip_axis
+            flip[axis_idx] = not flip[axis_idx]
+
+
+def _read(collection, prop, count, dtype=np.float32, width=3):
+    data = np.empty(count * width, dtype=dtype)
+    if count:
+        collection.foreach_get(prop, data)
+    return data.reshape(count, width) if width > 1 else data
+
+
+def _flip_coords(collection, count, axis_idx):
+    co = _read(collection, "co", count)
+    co[:, axis_idx] *= -1.0
+    collection.foreach_set("co", co.ravel())
+
+
+def flip_mesh(me, axis_idx):
+    """Mirror ``me`` in place along its local ``axis_idx``."""
+    nv, nf, nl = len(me.vertices), len(me.polygons), len(me.loops)
+    normals = _read(me.corner_normals, "vector", nl) if me.has_custom_normals else None
+
+    _flip_coords(me.vertices, nv, axis_idx)
+    if me.shape_keys:
+        for key_block in me.shape_keys.key_blocks:
+            _flip_coords(key_block.data, nv, axis_idx)
+
+    reverse_faces(me)
+
+    if normals is not None:
+        loop_start = _read(me.polygons, "loop_start", nf, np.int32, 1)
+        loop_total = _read(me.polygons, "loop_total", nf, np.int32, 1)
+        vert_order, _edge_order = winding_order(loop_start, loop_total)
+        normals = normals[vert_order]
+        normals[:, axis_idx] *= -1.0
+        me.normals_split_custom_set(normals)
+
+    me.update()
+
+
+def create_baked_mirrors(objects, axis_idx):
+    """Copy mesh ``objects`` with their data flipped along ``axis_idx``.
+
+    The objects must be ``bakeable``.
+
+    Returns ``(source, copy)`` pairs; the copies still need ``place_mirrors``.
+    """
+    baked = {}
+    pairs = []
+    for obj in objects:
+        me = baked.get(obj.data)
+        if me is None:
+            me = baked[obj.data] = obj.data.copy()
+            flip_mesh(me, axis_idx)
+
+        new_obj = obj.copy()
+        new_obj.data = me
+        flip_modifiers(new_obj, axis_idx)
+        for col in obj.users_collection:
+            col.objects.link(new_obj)
+        pairs.append((obj, new_obj))
+
+    return pairs
@@ -0,0 +1,371 @@
+"""NumPy engine for the object-mode bisect.
+
+``bisect_objects`` bisects a batch of objects. With the NumPy engine each mesh
+is read into arrays (``utils.mesh_data``), clipped against its local plane on a
+thread pool and written back on the main thread; the BMesh round-trip of
+``bisect_object`` is only used for meshes the arrays can't represent (shape
+keys, vertex groups, custom normals, edge data, internal layers other than
+selection and hiding, attribute types without an array layout) and for faces
+the clip can't split (concave faces crossing the plane more than once).
+
+Clipping keeps the side the plane normal points to, like ``bisect_plane`` with
+``clear_inner``: faces are clipped polygon by polygon (Sutherland-Hodgman),
+with one new vertex per crossed edge shared by both neighbors. Point and
+corner attributes are interpolated at the new vertices, face attributes are
+copied.
+
+Objects sharing a mesh are cut once per distinct local plane rather than once
+per object, so instanced meshes are not bisected repeatedly.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ..utils import addon
+from ..utils.mesh_data import (
+    STRUCTURAL_ATTRIBUTES,
+    Attribute,
+    MeshArrays,
+    read_mesh,
+    unsupported_attributes,
+    write_mesh,
+)
+from .mirror_plane import PlaneResolver
+from .mirror_utils import bisect_mesh, bisect_plane_local
+
+# Internal layers the clip can drop because they only hold edit state
+# (selection and hiding, including the UV selection of every UV map). Any
+# other ``.``-prefixed layer (sculpt masks, face sets, UV pins) is skipped by
+# ``read_mesh`` and would be lost, so it sends the mesh to BMesh.
+EDIT_STATE_ATTRIBUTES = {
+    ".select_vert", ".select_edge", ".select_poly",
+    ".hide_vert", ".hide_edge", ".hide_poly",
+}
+EDIT_STATE_PREFIXES = (".vs.", ".es.")
+
+KEEP, CLIP, FALLBACK = "KEEP", "CLIP", "FALLBACK"
+
+
+def needs_bmesh(obj):
+    """Whether ``obj``'s mesh holds data the NumPy clip doesn't carry over."""
+    me = obj.data
+    if me.shape_keys is not None or len(obj.vertex_groups) or me.has_custom_normals:
+        return True
+    for attr in me.attributes:
+        name = attr.name
+        if name in STRUCTURAL_ATTRIBUTES or name in EDIT_STATE_ATTRIBUTES:
+            continue
+        if name.startswith(EDIT_STATE_PREFIXES):
+            continue
+        if attr.domain == "EDGE" or name.startswith("."):
+            return True
+    return bool(unsupported_attributes(me))
+
+
+def _lerp_rows(data, a, b, t, interpolated, nearest):
+    """Rows blended from ``a`` to ``b`` by ``t``, or copied from ``nearest``."""
+    if not interpolated:
+        return data[nearest]
+    t = t.astype(np.float32)
+    if data.ndim > 1:
+        t = t[:, None]
+    return data[a] + (data[b] - data[a]) * t
+
+
+def clip_arrays(arrays, plane_co, plane_no, eps=0.0):
+    """Clip ``arrays`` against the plane.
+
+    Returns ``(KEEP, arrays)`` when nothing is behind the plane,
+    ``(FALLBACK, None)`` when a face crosses the plane more than once and
+    ``(CLIP, clipped)`` otherwise.
+    """
+    co = arrays.co
+    diff = co.astype(np.float64) - np.asarray(plane_co, dtype=np.float64)
+    d = diff @ np.asarray(plane_no, dtype=np.float64)
+    side = np.where(d > eps, 1, np.where(d < -eps, -1, 0)).astype(np.int8)
+    kept_v = side >= 0
+    if kept_v.all():
+        return KEEP, arrays
+
+    # Polygon walk: next corner of every corner.
+    loop_start, loop_total = arrays.loop_start, arrays.loop_total
+    poly_count, corner_count = len(loop_start), len(arrays.corner_vert)
+    poly_of_corner = np.repeat(np.arange(poly_count), loop_total)
+    next_corner = np.arange(1, corner_count + 1)
+    if poly_count:
+        next_corner[loop_start + loop_total - 1] = loop_start
+    cv = arrays.corner_vert
+    cn = cv[next_corner]
+    kept_c = kept_v[cv]
+
+    # A convex clip leaves each face in one piece; more than one exit means
+    # the face needs splitting.
+    exits = np.bincount(
+        poly_of_corner, weights=(kept_c & ~kept_v[cn]).astype(np.float64), minlength=poly_count
+    )
+    if (exits > 1).any():
+        return FALLBACK, None
+
+    # New vertices: kept ones, then one per strictly crossed edge.
+    edges = arrays.edges
+    ea, eb = edges[:, 0], edges[:, 1]
+    crossed = side[ea] * side[eb] < 0
+    cross_idx = np.flatnonzero(crossed)
+    ca, cb = ea[cross_idx], eb[cross_idx]
+    t_edge = d[ca] / (d[ca] - d[cb])
+
+    kept_idx = np.flatnonzero(kept_v)
+    vert_remap = np.full(len(co), -1, dtype=np.int64)
+    vert_remap[kept_idx] = np.arange(len(kept_idx))
+    edge_vert = np.full(len(edges), -1, dtype=np.int64)
+    edge_vert[cross_idx] = len(kept_idx) + np.arange(len(cross_idx))
+    nearest = np.where(kept_v[ca], ca, cb)
+
+    new_co = np.concatenate(
+        (co[kept_idx], _lerp_rows(co, ca, cb, t_edge, True, nearest))
+    )
+
+    # Each corner emits its vertex (if kept) followed by the crossing of its
+    # outgoing edge (if any), which keeps the face winding.
+    crossed_c = crossed[arrays.corner_edge]
+    slots = np.flatnonzero(np.stack((kept_c, crossed_c), axis=1).ravel())
+    s_corner = slots // 2
+    s_cross = (slots % 2).astype(bool)
+    s_poly = poly_of_corner[s_corner]
+    sizes = np.bincount(s_poly, minlength=poly_count)
+    kept_poly = sizes >= 3
+    valid = kept_poly[s_poly]
+    s_corner, s_cross = s_corner[valid], s_cross[valid]
+
+    new_corner_vert = np.where(
+        s_cross,
+        edge_vert[arrays.corner_edge[s_corner]],
+        vert_remap[cv[s_corner]],
+    )
+    new_total = sizes[kept_poly]
+    new_start = np.zeros(len(new_total), dtype=np.int64)
+    np.cumsum(new_total[:-1], out=new_start[1:])
+
+    # Crossing corners blend the corner and the next one of the same face.
+    s_next = next_corner[s_corner]
+    d_a, d_b = d[cv[s_corner]], d[cv[s_next]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_corner = np.where(s_cross, d_a / (d_a - d_b), 0.0)
+    corner_near = np.where(kept_c[s_corner], s_corner, s_next)
+
+    # Loose edges: kept, shortened to the crossing, or dropped.
+    used = np.zeros(len(edges), dtype=bool)
+    used[arrays.corner_edge] = True
+    loose = ~used
+    both = loose & kept_v[ea] & kept_v[eb]
+    half = loose & crossed
+    new_edges = np.concatenate(
+        (
+            np.stack((vert_remap[ea[both]], vert_remap[eb[both]]), axis=1),
+            np.stack(
+                (vert_remap[np.where(kept_v[ea[half]], ea[half], eb[half])], edge_vert[half]),
+                axis=1,
+            ),
+        )
+    ).reshape(-1, 2)
+
+    attributes = []
+    for attr in arrays.attributes:
+        data = attr.data
+        if attr.domain == "POINT":
+            data = np.concatenate(
+                (data[kept_idx], _lerp_rows(data, ca, cb, t_edge, attr.interpolated, nearest))
+            )
+        elif attr.domain == "CORNER":
+            blended = _lerp_rows(
+                data, s_corner, s_next, t_corner, attr.interpolated, corner_near
+            )
+            data = np.where(
+                s_cross if data.ndim == 1 else s_cross[:, None], blended, data[s_corner]
+            )
+        elif attr.domain == "FACE":
+            data = data[kept_poly]
+        else:
+            continue
+        attributes.append(Attribute(attr.name, attr.domain, attr.data_type, data))
+
+    clipped = MeshArrays(
+        co=new_co,
+        edges=new_edges,
+        loop_start=new_start,
+        loop_total=new_total,
+        corner_vert=new_corner_vert,
+        corner_edge=np.zeros(0, dtype=np.int64),
+        attributes=attributes,
+        uv_active=arrays.uv_active,
+        uv_render=arrays.uv_render,
+    )
+    return CLIP, clipped
+
+
+def _bounds_corners(me):
+    """(8, 3) local corners bounding the current vertices of ``me``.
+
+    Read from the vertices rather than ``Object.bound_box``: the evaluated box
+    lags behind meshes changed earlier in the same operator run.
+    """
+    co = np.empty(len(me.vertices) * 3, dtype=np.float32)
+    me.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3)
+    lo, hi = co.min(axis=0), co.max(axis=0)
+    return np.array(
+        [(x, y, z) for x in (lo[0], hi[0]) for y in (lo[1], hi[1]) for z in (lo[2], hi[2])],
+        dtype=np.float64,
+    )
+
+
+def cull_by_bounds(jobs):
+    """Split ``(obj, plane)`` jobs by where their bounding boxes lie.
+
+    Returns ``(straddling, cleared)``: the jobs whose box crosses the plane and
+    the objects entirely behind it. Objects entirely on the kept side (and
+    empty meshes) are dropped.
+    """
+    jobs = [(obj, plane) for obj, plane in jobs if len(obj.data.vertices)]
+    if not jobs:
+        return [], []
+
+    boxes = {}
+    for obj, _plane in jobs:
+        if obj.data not in boxes:
+            boxes[obj.data] = _bounds_corners(obj.data)
+    corners = np.stack([boxes[obj.data] for obj, _plane in jobs])
+    plane_co = np.array([tuple(plane[0]) for _obj, plane in jobs], dtype=np.float64)
+    plane_no = np.array([tuple(plane[1]) for _obj, plane in jobs], dtype=np.float64)
+    d = np.einsum("nkj,nj->nk", corners - plane_co[:, None], plane_no)
+
+    untouched = (d >= 0.0).all(axis=1)
+    behind = (d < 0.0).all(axis=1)
+    straddling = [job for job, skip in zip(jobs, (untouched | behind).tolist()) if not skip]
+    cleared = [job[0] for job, flag in zip(jobs, behind.tolist()) if flag]
+    return straddling, cleared
+
+
+def _plane_key(plane):
+    co, no = plane
+    return tuple(round(c, 6) for c in co), tuple(round(c, 6) for c in no)
+
+
+def group_by_mesh(jobs):
+    """Merge ``(obj, plane)`` jobs into one job per mesh and local plane.
+
+    Returns ``(mesh_jobs, users)``: one representative job per mesh datablock
+    and distinct plane, and the objects each job stands for. The objects
+    still share their mesh; ``split_shared`` separates the ones that need it.
+    """
+    groups = {}
+    for obj, plane in jobs:
+        planes = groups.setdefault(obj.data, {})
+        planes.setdefault(_plane_key(plane), (plane, []))[1].append(obj)
+
+    mesh_jobs, users = [], []
+    for planes in groups.values():
+        for plane, objects in planes.values():
+            mesh_jobs.append((objects[0], plane))
+            users.append(objects)
+    return mesh_jobs, users
+
+
+def split_shared(mesh_jobs, users, acting):
+    """Give acting jobs whose mesh is shared with another job a mesh of their own.
+
+    ``acting`` flags the jobs that will change their mesh (cut or emptied).
+    A mesh stays with the jobs that leave it alone or, failing those, with its
+    first acting job; every other acting job gets a pristine copy, linked to
+    its objects. Meshes are only copied for planes that actually change them.
+    """
+    claimed = {obj.data for (obj, _plane), flag in zip(mesh_jobs, acting) if not flag}
+    for (obj, _plane), objects, flag in zip(mesh_jobs, users, acting):
+        if not flag:
+            continue
+        me = obj.data
+        if me not in claimed:
+            claimed.add(me)
+            continue
+        copy = me.copy()
+        for user in objects:
+            user.data = copy
+
+
+def bisect_objects(context, objects, axis_idx, pivot, orientation, is_neg=False):
+    """Bisect ``objects`` with the engine chosen in the tool preferences.
+
+    Each mesh datablock is cut once per distinct local plane (see
+    ``group_by_mesh``). A bounding-box pre-pass skips meshes entirely on the
+    kept side and empties the ones entirely behind the plane; only meshes
+    crossing it are bisected. Returns the emptied objects.
+    """
+    resolver = PlaneResolver(context, axis_idx, is_neg, pivot, orientation)
+    jobs = []
+    for obj in objects:
+        plane = bisect_plane_local(obj, resolver(obj))
+        if plane is not None:
+            jobs.append((obj, plane))
+
+    jobs, users = group_by_mesh(jobs)
+    straddling, cleared_jobs = cull_by_bounds(jobs)
+    acting = {obj for obj, _plane in straddling}.union(cleared_jobs)
+    split_shared(jobs, users, [obj in acting for obj, _plane in jobs])
+
+    users_of = {obj: objects for (obj, _plane), objects in zip(jobs, users)}
+    cleared = []
+    for obj in cleared_jobs:
+        obj.data.clear_geometry()
+        cleared.extend(users_of[obj])
+    jobs = straddling
+
+    if addon.pref().tools.mirror.bisect_engine == "BMESH":
+        for obj, plane in jobs:
+            bisect_mesh(obj.data, *plane)
+        return cleared
+
+    pending = []
+    for obj, plane in jobs:
+        if needs_bmesh(obj):
+            bisect_mesh(obj.data, *plane)
+        else:
+            pending.append((obj, plane))
+
+    # Every job holds a distinct mesh, so the batch can be clipped in parallel.
+    _bisect_batch(pending)
+    return cleared
+
+
+def report_cleared(operator, cleared):
+    """Warn about objects the bisect left without geometry."""
+    if cleared:
+        operator.report(
+            {"WARNING"},
+            f"{len(cleared)} objects were entirely behind the bisect plane and are now empty.",
+        )
+
+
+def _bisect_batch(batch):
+    """Clip a batch of distinct meshes; reads and writes stay on the main thread."""
+    if not batch:
+        return
+    arrays = [read_mesh(obj.data, skip_domains=("EDGE",)) for obj, _plane in batch]
+
+    def clip(index):
+        _obj, (plane_co, plane_no) = batch[index]
+        return clip_arrays(arrays[index], tuple(plane_co), tuple(plane_no))
+
+    workers = min(len(batch), os.cpu_count() or 1)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(clip, range(len(batch))))
+    else:
+        results = [clip(i) for i in range(len(batch))]
+
+    for (obj, plane), (status, clipped) in zip(batch, results):
+        if status == CLIP:
+            write_mesh(obj.data, clipped)
+        elif status == FALLBACK:
+            bisect_mesh(obj.data, *plane)
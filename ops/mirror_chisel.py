@@ -4,6 +4,7 @@ from .mirror_utils import (
     compute_mirror_xform,
     create_empty_mirror_object,
 )
+from .mirror_plane import world_location
 
 
 # Integration with the Chisel extension (SDF modeling). Chisel objects are
@@ -106,7 +107,7 @@ def add_chisel_mirror(context, obj, axis_idx, is_neg, mirror_object, individual,
     if mirror_object == obj:
         _mirror_object = None
     if individual:
-        _mirror_object = create_empty_mirror_object(context, obj.location)
+        _mirror_object = create_empty_mirror_object(context, world_location(obj))
     if item.mirror_origin != _mirror_object:
         item.mirror_origin = _mirror_object
 
@@ -0,0 +1,129 @@
+"""Flipped mesh datablocks reused across real-mirror runs.
+
+``create_real_mirror`` copies a mesh and reverses its faces. The result only
+depends on the source geometry, so it is remembered per source mesh together
+with a checksum of the source; the next real mirror of unchanged geometry
+links the same flipped mesh instead of copying and reversing it again.
+
+The checksum covers positions, topology, attribute values, shape keys and
+materials; selection and hide layers are left out. Meshes it can't cover,
+those of objects with vertex groups (weights have no array access) or with
+attribute types ``read_mesh`` skips, bypass the cache (``source_checksum``).
+
+The flipped mesh stores the source checksum and a cheap stamp of itself
+(element counts and a hash of the positions) as custom properties: an entry
+is evicted when the source changes, when the flipped mesh was edited or
+deleted, and (``prune``) when the source mesh no longer exists.
+"""
+
+import hashlib
+
+import bpy
+import numpy as np
+
+from ..utils.mesh_data import read_mesh, unsupported_attributes
+
+SOURCE_CHECKSUM_PROP = "rotor_flipped_source"
+STAMP_PROP = "rotor_flipped_stamp"
+
+
+def mesh_checksum(me):
+    """Digest of the geometry, attributes, shape keys and materials of ``me``."""
+    arrays = read_mesh(me, skip_internal=True)
+    h = hashlib.blake2b(digest_size=16)
+    for data in (
+        arrays.co, arrays.edges, arrays.loop_start, arrays.loop_total,
+        arrays.corner_vert, arrays.corner_edge,
+    ):
+        h.update(data.tobytes())
+    for attr in arrays.attributes:
+        h.update(f"{attr.name}\0{attr.domain}\0{attr.data_type}".encode())
+        h.update(attr.data.tobytes())
+    h.update(f"{arrays.uv_active}\0{arrays.uv_render}".encode())
+    if me.shape_keys is not None:
+        co = np.empty(len(me.vertices) * 3, dtype=np.float32)
+        for key_block in me.shape_keys.key_blocks:
+            h.update(
+                f"{key_block.name}\0{key_block.relative_key.name}\0{key_block.value}"
+                f"\0{key_block.mute}\0{key_block.vertex_group}\0{key_block.interpolation}"
+                f"\0{key_block.slider_min}\0{key_block.slider_max}".encode()
+            )
+            if len(co):
+                key_block.data.foreach_get("co", co)
+            h.update(co.tobytes())
+    for mat in me.materials:
+        h.update((mat.name if mat else "").encode() + b"\0")
+    return h.hexdigest()
+
+
+def edit_stamp(me):
+    """Element counts and a position digest of ``me``; cheaper than
+    ``mesh_checksum`` and enough to notice edits of a flipped mesh."""
+    co = np.empty(len(me.vertices) * 3, dtype=np.float32)
+    me.vertices.foreach_get("co", co)
+    digest = hashlib.blake2b(co.tobytes(), digest_size=16).hexdigest()
+    return f"{len(me.vertices)}:{len(me.edges)}:{len(me.loops)}:{len(me.polygons)}:{digest}"
+
+
+def source_checksum(obj):
+    """``mesh_checksum`` of the mesh of ``obj``, or None when the cache can't
+    vouch for it (vertex groups, attribute types without an array layout)."""
+    if len(obj.vertex_groups) or unsupported_attributes(obj.data):
+        return None
+    return mesh_checksum(obj.data)
+
+
+class FlippedMeshCache:
+    """Source mesh ``session_uid`` -> ``(source checksum, flipped mesh name)``.
+
+    Names rather than datablocks are kept so entries survive undo.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def find(self, source, checksum):
+        """The flipped mesh of ``source`` if it matches ``checksum``, else None."""
+        entry = self._entries.get(source.session_uid)
+        if entry is None:
+            return None
+
+        flipped = bpy.data.meshes.get(entry[1])
+        if (
+            flipped is not None
+            and not flipped.is_evaluated
+            and not flipped.is_editmode
+            and entry[0] == checksum
+            and flipped.get(SOURCE_CHECKSUM_PROP) == checksum
+            and flipped.get(STAMP_PROP) == edit_stamp(flipped)
+        ):
+            return flipped
+
+        self._evict(source.session_uid)
+        return None
+
+    def store(self, source, checksum, flipped):
+        """Remember ``flipped`` as the flipped copy of ``source``."""
+        flipped[SOURCE_CHECKSUM_PROP] = checksum
+        flipped[STAMP_PROP] = edit_stamp(flipped)
+        self._entries[source.session_uid] = (checksum, flipped.name)
+
+    def prune(self):
+        """Drop the entries of deleted source meshes."""
+        live = {me.session_uid for me in bpy.data.meshes}
+        for uid in [uid for uid in self._entries if uid not in live]:
+            self._evict(uid)
+
+    def _evict(self, uid):
+        checksum, name = self._entries.pop(uid)
+        flipped = bpy.data.meshes.get(name)
+        # The name may now belong to another mesh; only remove our own orphan.
+        if (
+            flipped is not None
+            and flipped.users == 0
+            and flipped.get(SOURCE_CHECKSUM_PROP) == checksum
+        ):
+            bpy.data.meshes.remove(flipped)
+
+
+flipped_meshes = FlippedMeshCache()
@@ -0,0 +1,285 @@
+"""Scene-wide index of mirrors.
+
+Maps every object to its mirrors (Blender mirror modifiers and chisel mirror
+items) and every mirror object (pivot empty, or any other target) to the
+objects mirroring around it. The index is built once and then kept current
+one object at a time from geometry updates in the depsgraph (modifier edits
+tag geometry, transforms don't). Chisel mirror item edits don't tag geometry,
+so chisel objects are rescanned on any update. Additions and removals of
+objects, undo, redo and file loads trigger a full rebuild on the next query.
+Operators can call ``update_object`` to refresh an object they changed before
+the depsgraph runs.
+
+Lookups that hand out modifiers or chisel items check them against the
+object first and rescan that object if the entry went stale.
+"""
+
+from typing import NamedTuple
+
+import bpy
+
+from ..utils import handlers
+from .mirror_chisel import chisel_axis_state, is_chisel_object
+
+MODIFIER, CHISEL = "MODIFIER", "CHISEL"
+
+
+class MirrorEntry(NamedTuple):
+    """One mirror: a mirror modifier (``key`` is its name) or a chisel mirror
+    item (``key`` is its index)."""
+
+    kind: str
+    key: object
+    target_uid: int
+    target_name: str
+    pinned: bool
+    use_axis: tuple
+    use_flip: tuple
+
+    @property
+    def label(self):
+        axes = " ".join(
+            "XYZ"[i] + ("-" if self.use_flip[i] else "")
+            for i in range(3)
+            if self.use_axis[i]
+        )
+        text = axes or "Off"
+        if self.target_name:
+            text += f" @ {self.target_name}"
+        return text
+
+
+def _entry(kind, key, target, pinned, use_axis, use_flip):
+    return MirrorEntry(
+        kind, key,
+        target.session_uid if target else 0,
+        target.name if target else "",
+        bool(pinned), tuple(use_axis), tuple(use_flip),
+    )
+
+
+def scan_object(obj):
+    """The mirror entries of ``obj`` in stack order."""
+    if is_chisel_object(obj):
+        return tuple(
+            _entry(CHISEL, i, item.mirror_origin, item.pinned, *chisel_axis_state(item))
+            for i, item in enumerate(obj.chisel.modifiers.items)
+            if item.modifier_type == "MIRROR"
+        )
+    return tuple(
+        _entry(
+            MODIFIER, mod.name, mod.mirror_object, mod.use_pin_to_last,
+            mod.use_axis, mod.use_bisect_flip_axis,
+        )
+        for mod in obj.modifiers
+        if mod.type == "MIRROR"
+    )
+
+
+class MirrorIndex:
+    """Object ``session_uid`` -> mirror entries, target ``session_uid`` ->
+    owner ``session_uid``s. ``revision`` changes whenever an entry does."""
+
+    def __init__(self):
+        self.revision = 0
+        self._entries = {}
+        self._names = {}
+        self._users = {}
+        self._count = -1
+        self._rows = (None, None, [])
+
+    # Maintenance
+
+    def reset(self):
+        self._count = -1
+
+    def on_depsgraph_update(self, scene, depsgraph):
+        if self._count != len(bpy.data.objects):
+            self._count = -1
+            return
+        # Modifier and pin edits tag geometry; pure transforms are skipped.
+        for update in depsgraph.updates:
+            if not isinstance(update.id, bpy.types.Object):
+                continue
+            obj = update.id.original
+            if update.is_updated_geometry or is_chisel_object(obj):
+                self.update_object(obj)
+
+    def update_object(self, obj):
+        """Rescan the mirrors of ``obj``."""
+        if self._count < 0:
+            return
+        uid = obj.session_uid
+        entries = scan_object(obj)
+        if entries == self._entries.get(uid, ()) and self._names.get(uid) == obj.name:
+            return
+        self._drop(uid)
+        self._add(uid, obj.name, entries)
+        self.revision += 1
+
+    def _ensure(self):
+        if self._count == len(bpy.data.objects):
+            return
+        self._entries.clear()
+        self._names.clear()
+        self._users.clear()
+        for obj in bpy.data.objects:
+            self._add(obj.session_uid, obj.name, scan_object(obj))
+        self._count = len(bpy.data.objects)
+        self.revision += 1
+
+    def _add(self, uid, name, entries):
+        if not entries:
+            return
+        self._entries[uid] = entries
+        self._names[uid] = name
+        for entry in entries:
+            if entry.target_uid:
+                self._users.setdefault(entry.target_uid, set()).add(uid)
+
+    def _drop(self, uid):
+        for entry in self._entries.pop(uid, ()):
+            users = self._users.get(entry.target_uid)
+            if users is not None:
+                users.discard(uid)
+                if not users:
+                    del self._users[entry.target_uid]
+        self._names.pop(uid, None)
+
+    def _resolve(self, uid):
+        obj = bpy.data.objects.get(self._names.get(uid, ""))
+        return obj if obj is not None and obj.session_uid == uid else None
+
+    # Queries
+
+    def entries(self, obj):
+        """Mirror entries of ``obj`` in stack order."""
+        self._ensure()
+        return self._entries.get(obj.session_uid, ())
+
+    def has_mirror(self, obj):
+        """True if ``obj`` has a mirror modifier or chisel mirror item."""
+        return bool(self.entries(obj))
+
+    def pinned(self, obj):
+        """The last pinned mirror of ``obj`` as ``(entry, data)``, where data is
+        the mirror modifier or chisel mirror item; ``(None, None)`` if none."""
+        for _ in range(2):
+            entry = next((e for e in reversed(self.entries(obj)) if e.pinned), None)
+            if entry is None:
+                return None, None
+            data = self._data(obj, entry)
+            if data is not None:
+                return entry, data
+            self.update_object(obj)
+        return None, None
+
+    def pinned_table(self, objects):
+        """``{object: (entry, data)}`` as from ``pinned``, for one operator
+        run over many objects."""
+        self._ensure()
+        return {obj: self.pinned(obj) for obj in objects}
+
+    def users(self, target):
+        """Objects mirroring around ``target``. If an owner went stale
+        (renamed, or deleted while the object count stayed the same) the index
+        is rebuilt."""
+        for _ in range(2):
+            self._ensure()
+            owners = [self._resolve(uid) for uid in self._users.get(target.session_uid, ())]
+            if all(obj is not None for obj in owners):
+                break
+            self.reset()
+        return [obj for obj in owners if obj is not None]
+
+    def rows(self, text=""):
+        """``(object name, entries)`` of every mirrored object, sorted by name
+        and filtered by ``text`` (case-insensitive). Names may be stale after
+        a rename or delete; ``page`` checks the rows it hands out."""
+        self._ensure()
+        revision, cached_text, rows = self._rows
+        if revision == self.revision and cached_text == text:
+            return rows
+        needle = text.lower()
+        rows = sorted(
+            (name, self._entries[uid])
+            for uid, name in self._names.items()
+            if needle in name.lower()
+        )
+        self._rows = (self.revision, text, rows)
+        return rows
+
+    def page(self, text, start, stop):
+        """``(total, rows[start:stop])`` of ``rows(text)``. The sliced rows are
+        checked against ``bpy.data``; if one went stale (renamed, or deleted
+        while the object count stayed the same) the index is rebuilt."""
+        for _ in range(2):
+            rows = self.rows(text)
+            visible = rows[start:stop]
+            if all(name in bpy.data.objects for name, _entries in visible):
+                break
+            self.reset()
+        return len(rows), visible
+
+    @staticmethod
+    def _data(obj, entry):
+        if entry.kind == MODIFIER:
+            mod = obj.modifiers.get(entry.key)
+            if mod is not None and mod.type == "MIRROR" and mod.use_pin_to_last:
+                return mod
+            return None
+        if not is_chisel_object(obj):
+            return None
+        items = obj.chisel.modifiers.items
+        if entry.key < len(items):
+            item = items[entry.key]
+            if item.modifier_type == "MIRROR" and item.pinned:
+                return item
+        return None
+
+
+mirror_index = MirrorIndex()
+handlers.subscribe_depsgraph(mirror_index.on_depsgraph_update)
+handlers.subscribe_reset(mirror_index.reset)
+
+
+class ROTOR_OT_SelectMirrorObject(bpy.types.Operator):
+    """Select a mirrored object, or the objects mirroring around the active object"""
+
+    bl_idname = "mirror.select_mirror_object"
+    bl_label = "Select Mirror Object"
+    bl_options = {"REGISTER", "UNDO", "INTERNAL"}
+
+    name: bpy.props.StringProperty(
+        name="Object",
+        description="Object to select; empty selects the objects mirroring around the active object",
+        options={"SKIP_SAVE"},
+    )
+    extend: bpy.props.BoolProperty(name="Extend", default=False, options={"SKIP_SAVE"})
+
+    def invoke(self, context, event):
+        self.extend = event.shift
+        return self.execute(context)
+
+    def execute(self, context):
+        if self.name:
+            targets = [bpy.data.objects.get(self.name)]
+        elif context.active_object is not None:
+            targets = mirror_index.users(context.active_object)
+        else:
+            targets = []
+        targets = [obj for obj in targets if obj is not None and obj.name in context.view_layer.objects]
+        if not targets:
+            self.report({"WARNING"}, "Nothing to select.")
+            return {"CANCELLED"}
+
+        if not self.extend:
+            for obj in context.selected_objects:
+                obj.select_set(False)
+        for obj in targets:
+            obj.select_set(True)
+        context.view_layer.objects.active = targets[0]
+        return {"FINISHED"}
+
+
+classes = (ROTOR_OT_SelectMirrorObject,)
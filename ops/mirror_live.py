@@ -0,0 +1,236 @@
+"""Live symmetry across the Mirror Mesh plane while editing.
+
+Blender's mesh symmetry only works on local X/Y/Z. Live symmetry freezes the
+plane the Mirror Mesh tool currently shows (any orientation) and, after every
+depsgraph update of the edit mesh, copies the reflected position of each moved
+vertex to its counterpart from the cached pair map (``mirror_symmetry``).
+
+Only the selected vertices are watched, so an update costs O(selected); the
+watched set is refreshed on every selection-only update. With proportional
+editing the vertices within the proportional size of the selection are
+watched instead; the set is rebuilt when the size changes, which Blender
+stores once a transform ends. Vertices paired with themselves (on the plane)
+are clamped back onto it, like Blender's own mirror editing.
+
+Updates only compare element counts; the full topology signature (an
+edge-list hash) is checked when the watched set is rebuilt, which the
+selection changes of topology operators trigger.
+"""
+
+import bmesh
+import bpy
+import numpy as np
+
+from ..utils import addon, handlers
+from .mirror_mesh_numpy import reflect, signed_distance, vert_coords
+from .mirror_mesh_utils import get_mesh_mirror_plane
+from .mirror_symmetry import bmesh_counts, symmetry_cache
+
+
+class LiveSymmetry:
+    """State of the (single) live symmetry session."""
+
+    def __init__(self):
+        self.active = False
+        self.axis = "X"
+        self.object_name = ""
+        self.plane_co = None
+        self.plane_no = None
+        self.tol = 1e-5
+        self.smap = None
+        self.watch_key = None
+        self.watched = None
+        self.snapshot = None
+        self._writing = False
+
+    def start(self, obj, bm, plane_co, plane_no, tol, axis):
+        self.active = True
+        self.axis = axis
+        self.object_name = obj.name
+        self.plane_co = tuple(plane_co)
+        self.plane_no = tuple(plane_no)
+        self.tol = tol
+        self.smap = symmetry_cache.get(obj.data, bm, plane_co, plane_no, tol)
+        self.watch_key = None
+        return self.smap
+
+    def stop(self):
+        self.active = False
+        self.smap = None
+        self.watched = None
+        self.snapshot = None
+        self.watch_key = None
+
+    def _watch(self, context, me, bm):
+        """(Re)build the watched vertex set when the selection, the element
+        counts or the proportional size changed. Selection changes of the same
+        size are caught by ``on_depsgraph_update``, which clears the key."""
+        tool_settings = context.tool_settings
+        proportional = tool_settings.use_proportional_edit
+        key = (
+            me.total_vert_sel,
+            bmesh_counts(bm),
+            tool_settings.proportional_size if proportional else None,
+        )
+        if key == self.watch_key and self.watched is not None:
+            return
+        # The cache checks the full topology signature after geometry updates
+        # (same counts, different topology: dissolve + subdivide, ...)
+        self.smap = symmetry_cache.get(me, bm, self.plane_co, self.plane_no, self.tol)
+        verts = bm.verts
+        verts.ensure_lookup_table()
+        selected = np.fromiter((v.select for v in verts), dtype=bool, count=len(verts))
+        watched = np.flatnonzero(selected)
+        if proportional:
+            watched = self._proportional_range(context, me, bm, watched)
+        self.watched = watched
+        self.snapshot = vert_coords([verts[i] for i in watched.tolist()])
+        self.watch_key = key
+
+    @staticmethod
+    def _proportional_range(context, me, bm, selected):
+        """Sorted indices of the vertices within the proportional editing size
+        of a selected vertex (in local space, for the smallest object scale)."""
+        if not len(selected):
+            return selected
+        scale = min(abs(s) for s in context.edit_object.matrix_world.to_scale())
+        radius = context.tool_settings.proportional_size / max(scale, 1e-6)
+        tree = symmetry_cache.tree(me, bm)
+        verts = bm.verts
+        found = {
+            index
+            for i in selected.tolist()
+            for _co, index, _dist in tree.find_range(verts[i].co, radius)
+        }
+        return np.array(sorted(found), dtype=np.int64)
+
+    def on_depsgraph_update(self, scene, depsgraph):
+        if not self.active or self._writing:
+            return
+        context = bpy.context
+        obj = context.edit_object
+        if obj is None or obj.name != self.object_name or obj.type != "MESH":
+            self.stop()
+            return
+        updates = [u for u in depsgraph.updates if u.id.original == obj.data]
+        if not updates:
+            return
+        if not any(update.is_updated_geometry for update in updates):
+            # Selection-only update (click, box select, ...): the selection may
+            # differ at the same size, so watch it afresh.
+            self.watch_key = None
+
+        me = obj.data
+        bm = bmesh.from_edit_mesh(me)
+        if self.smap is None or self.smap.signature[:3] != bmesh_counts(bm):
+            # Topology changed (extrude, delete, ...): re-pair before watching.
+            self.smap = symmetry_cache.get(me, bm, self.plane_co, self.plane_no, self.tol)
+            self.watched = None
+
+        previous = self.watched
+        self._watch(context, me, bm)
+        if previous is None or self.watched is not previous:
+            return
+
+        verts = bm.verts
+        verts.ensure_lookup_table()
+        watched = self.watched
+        co = vert_coords([verts[i] for i in watched.tolist()])
+        moved = np.flatnonzero((co != self.snapshot).any(axis=1))
+        self.snapshot = co
+        if not len(moved):
+            return
+
+        src = watched[moved]
+        dst = self.smap.counterparts(src)
+        # Skip unpaired vertices and pairs the edit already moves together.
+        valid = ((dst >= 0) & ~np.isin(dst, src)) | (dst == src)
+        src, dst, src_co = src[valid], dst[valid], co[moved][valid]
+        if not len(src):
+            return
+
+        on_plane = dst == src
+        targets = np.empty_like(src_co)
+        if on_plane.any():
+            dist = signed_distance(src_co[on_plane], self.plane_co, self.plane_no)
+            targets[on_plane] = src_co[on_plane] - np.asarray(
+                self.plane_no, dtype=np.float32
+            ) * dist.astype(np.float32)[:, None]
+        if (~on_plane).any():
+            targets[~on_plane] = reflect(src_co[~on_plane], self.plane_co, self.plane_no)
+
+        self._writing = True
+        try:
+            for i, c in zip(dst.tolist(), targets.tolist()):
+                verts[i].co = c
+            # On-plane vertices moved themselves; keep the snapshot in sync.
+            if on_plane.any():
+                clamped = np.searchsorted(watched, src[on_plane])
+                self.snapshot[clamped] = targets[on_plane]
+            bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
+        finally:
+            self._writing = False
+
+
+live_symmetry = LiveSymmetry()
+handlers.subscribe_depsgraph(live_symmetry.on_depsgraph_update)
+
+
+class ROTOR_OT_LiveSymmetry(bpy.types.Operator):
+    """Toggle live symmetry across the Mirror Mesh plane: edits are copied to the mirrored vertices"""
+
+    bl_idname = "mirror.live_symmetry"
+    bl_label = "Live Symmetry"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    axis: bpy.props.EnumProperty(
+        name="Axis",
+        description="Axis of the mirror frame used as the plane normal",
+        items=[("X", "X", ""), ("Y", "Y", ""), ("Z", "Z", "")],
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return (
+            context.mode == "EDIT_MESH"
+            and context.edit_object is not None
+            and context.edit_object.type == "MESH"
+        )
+
+    def execute(self, context):
+        obj = context.edit_object
+        if live_symmetry.active and live_symmetry.axis == self.axis:
+            live_symmetry.stop()
+            self.report({"INFO"}, "Live symmetry off.")
+            self._redraw(context)
+            return {"FINISHED"}
+
+        plane = get_mesh_mirror_plane(context, self.axis)
+        if plane is None:
+            self.report({"WARNING"}, "No usable mirror plane for the current selection.")
+            return {"CANCELLED"}
+        local_co, local_no = plane
+        tol = max(addon.pref().tools.mesh.merge_threshold, 1e-5)
+
+        bm = bmesh.from_edit_mesh(obj.data)
+        smap = live_symmetry.start(obj, bm, local_co, local_no, tol, self.axis)
+
+        unpaired = len(smap.unpaired)
+        if unpaired:
+            self.report(
+                {"WARNING"},
+                f"Live symmetry on {self.axis}: {unpaired} vertices have no counterpart.",
+            )
+        else:
+            self.report({"INFO"}, f"Live symmetry on {self.axis}.")
+        self._redraw(context)
+        return {"FINISHED"}
+
+    @staticmethod
+    def _redraw(context):
+        for area in context.screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+
+
+classes = (ROTOR_OT_LiveSymmetry,)
@@ -1,9 +1,17 @@
 import bmesh
 import bpy
 
+from ..tools.mirror.props import mesh_modes
 from ..utils import addon
-from .mirror_mesh_utils import get_mesh_mirror_frame, symmetrize_geom
-
+from .mirror_mesh_numpy import plane_region
+from .mirror_mesh_utils import (
+    edit_mesh_objects,
+    flip_copy_geom,
+    flip_geom,
+    get_mesh_mirror_frame,
+    symmetrize_geom,
+    symmetrize_multi_geom,
+)
 
 class ROTOR_OT_MirrorMesh(bpy.types.Operator):
     """Mirror (symmetrize) mesh geometry across the gizmo plane"""
@@ -31,6 +39,22 @@ class ROTOR_OT_MirrorMesh(bpy.types.Operator):
         ],
         default="SELECTION",
     )
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        description="How the geometry is mirrored (defaults to the tool setting)",
+        items=mesh_modes,
+        default="SYMMETRIZE",
+    )
+    axes: bpy.props.EnumProperty(
+        name="Axes",
+        description=(
+            "Symmetrize across several axes of the frame in one pass "
+            "(overrides Axis; always symmetrizes)"
+        ),
+        items=[("X", "X", ""), ("Y", "Y", ""), ("Z", "Z", "")],
+        options={"ENUM_FLAG"},
+        default=set(),
+    )
 
     @classmethod
     def description(cls, context, properties):
@@ -47,7 +71,6 @@ class ROTOR_OT_MirrorMesh(bpy.types.Operator):
         )
 
     def execute(self, context):
-        obj = context.edit_object
         pref = addon.pref().tools.mesh
 
         frame_data = get_mesh_mirror_frame(context)
@@ -56,52 +79,100 @@ class ROTOR_OT_MirrorMesh(bpy.types.Operator):
             return {"CANCELLED"}
         world_pivot, frame = frame_data
 
-        axis_idx = {"X": 0, "Y": 1, "Z": 2}[self.axis]
         is_neg = self.sign == "NEG"
         if pref.reverse_controls:
             is_neg = not is_neg
 
-        mw_inv = obj.matrix_world.inverted()
-        world_axis = frame.col[axis_idx]
-        if world_axis.length < 1e-6:
-            self.report({"WARNING"}, "Degenerate mirror orientation.")
+        # The world-space planes are shared by every edited object.
+        axes = [a for a in ("X", "Y", "Z") if a in self.axes] or [self.axis]
+        world_planes = []
+        for axis in axes:
+            world_axis = frame.col[{"X": 0, "Y": 1, "Z": 2}[axis]]
+            if world_axis.length < 1e-6:
+                self.report({"WARNING"}, "Degenerate mirror orientation.")
+                return {"CANCELLED"}
+            world_planes.append(-world_axis if is_neg else world_axis)
+
+        mode = self.mode if self.properties.is_property_set("mode") else pref.mode
+        if len(axes) > 1:
+            mode = "SYMMETRIZE"
+
+        mirrored = 0
+        for obj in edit_mesh_objects(context):
+            mw_inv = obj.matrix_world.inverted()
+            planes = [
+                (mw_inv @ world_pivot, (mw_inv.to_3x3() @ world_axis).normalized())
+                for world_axis in world_planes
+            ]
+            bm = bmesh.from_edit_mesh(obj.data)
+            if self._mirror_object(pref, bm, planes, mode):
+                bmesh.update_edit_mesh(obj.data)
+                mirrored += 1
+
+        if not mirrored:
+            self.report({"WARNING"}, "No selected geometry to mirror.")
             return {"CANCELLED"}
 
-        local_no = (mw_inv.to_3x3() @ world_axis).normalized()
-        if is_neg:
-            local_no = -local_no
-        local_co = mw_inv @ world_pivot
+        action = {
+            "SYMMETRIZE": "Mirrored",
+            "FLIP_COPY": "Flipped a copy of",
+            "FLIP": "Flipped",
+        }[mode]
+        scope = "mesh" if self.target == "MESH" else "selection"
+        if mirrored > 1:
+            scope = f"{scope} of {mirrored} objects"
+        self.report({"INFO"}, f"{action} {scope} across {''.join(axes)}.")
 
-        me = obj.data
-        bm = bmesh.from_edit_mesh(me)
-        bm.normal_update()
+        self._tool_fallback(context, pref)
+        return {"FINISHED"}
 
-        if self.target == "MESH":
-            verts, edges, faces = bm.verts[:], bm.edges[:], bm.faces[:]
-            select_result = False
+    def _mirror_object(self, pref, bm, planes, mode):
+        """Mirror one object's edit mesh; returns False when there is nothing to do."""
+        local_co, local_no = planes[0]
+        roi = self.target == "MESH" and pref.use_roi and mode == "SYMMETRIZE"
+        select_result = self.target == "SELECTION"
+
+        if roi and len(planes) == 1:
+            # Same tolerance symmetrize_geom bisects with.
+            tol = max(pref.merge_threshold, 1e-5)
+            verts, edges, faces = plane_region(bm, local_co, local_no, tol)
+            for f in faces:
+                f.normal_update()
+            for v in verts:
+                v.normal_update()
         else:
-            verts = [v for v in bm.verts if v.select]
-            edges = [e for e in bm.edges if e.select]
-            faces = [f for f in bm.faces if f.select]
-            select_result = True
+            if mode == "SYMMETRIZE":
+                bm.normal_update()
+            if self.target == "MESH":
+                verts, edges, faces = bm.verts[:], bm.edges[:], bm.faces[:]
+            else:
+                verts = [v for v in bm.verts if v.select]
+                edges = [e for e in bm.edges if e.select]
+                faces = [f for f in bm.faces if f.select]
             if not verts:
-                self.report({"WARNING"}, "No selected geometry to mirror.")
-                return {"CANCELLED"}
-
-        symmetrize_geom(
-            bm, verts, edges, faces, local_co, local_no,
-            pref.merge, pref.merge_threshold, select_result,
-        )
+                return False
+
+        if len(planes) > 1:
+            symmetrize_multi_geom(
+                bm, verts, edges, faces, planes,
+                pref.merge, pref.merge_threshold, select_result, pref.engine,
+            )
+        elif mode == "FLIP_COPY":
+            flip_copy_geom(
+                bm, verts, edges, faces, local_co, local_no, select_result, pref.engine
+            )
+        elif mode == "FLIP":
+            flip_geom(bm, verts, faces, local_co, local_no, pref.engine)
+            select_result = False
+        else:
+            symmetrize_geom(
+                bm, verts, edges, faces, local_co, local_no,
+                pref.merge, pref.merge_threshold, select_result, pref.engine, roi,
+            )
 
         if select_result:
             bm.select_flush(True)
-        bmesh.update_edit_mesh(me)
-
-        scope = "mesh" if self.target == "MESH" else "selection"
-        self.report({"INFO"}, f"Mirrored {scope} across {self.axis}.")
-
-        self._tool_fallback(context, pref)
-        return {"FINISHED"}
+        return True
 
     def _tool_fallback(self, context, pref):
         last_tool = context.scene.rotor.ops.last_tool
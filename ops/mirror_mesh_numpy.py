@@ -0,0 +1,261 @@
+"""NumPy engine for the edit-mesh symmetrize.
+
+BMesh has no bulk accessors, so coordinates are pulled into a float32 array
+once; signed distances, on-plane masks, reflections and seam pairs then run as
+array ops and results are written back in one pass.
+
+The arithmetic mirrors mathutils exactly (float32 storage, float32 products
+accumulated in float64 from the last component down, float32 scalar multiply)
+so the output is bit-identical to the per-vertex path in ``mirror_mesh_utils``.
+"""
+
+from itertools import chain
+from typing import NamedTuple
+
+import bmesh
+import numpy as np
+from mathutils import Vector
+
+
+def vert_coords(verts):
+    """Return an (N, 3) float32 array with the coordinates of ``verts``."""
+    count = len(verts)
+    flat = np.fromiter(
+        chain.from_iterable(v.co for v in verts), dtype=np.float32, count=count * 3
+    )
+    return flat.reshape(count, 3)
+
+
+def set_vert_coords(verts, co):
+    """Write an (N, 3) coordinate array back to ``verts``."""
+    for v, c in zip(verts, co.tolist()):
+        v.co = c
+
+
+def signed_distance(co, plane_co, n):
+    """Per-vertex ``(co - plane_co).dot(n)`` with mathutils rounding."""
+    diff = co - np.asarray(plane_co, dtype=np.float32)
+    prod = diff * np.asarray(n, dtype=np.float32)
+    prod = prod.astype(np.float64)
+    return (prod[:, 2] + prod[:, 1]) + prod[:, 0]
+
+
+def reflect(co, plane_co, n, dist=None):
+    """Reflect ``co`` across the plane; ``dist`` is the signed distance if known."""
+    if dist is None:
+        dist = signed_distance(co, plane_co, n)
+    scale = (2.0 * dist).astype(np.float32)
+    return co - np.asarray(n, dtype=np.float32) * scale[:, None]
+
+
+def reflection_affine(planes):
+    """``(A, b)`` of the composed reflections ``x -> A @ x + b``.
+
+    ``planes`` is a sequence of ``(plane_co, n)`` applied in order.
+    """
+    A = np.eye(3)
+    b = np.zeros(3)
+    for plane_co, n in planes:
+        n = np.asarray(n, dtype=np.float64)
+        R = np.eye(3) - 2.0 * np.outer(n, n)
+        t = 2.0 * np.dot(np.asarray(plane_co, dtype=np.float64), n) * n
+        A, b = R @ A, R @ b + t
+    return A, b
+
+
+def transform_verts(verts, A, b):
+    """Apply ``x -> A @ x + b`` to ``verts`` in place."""
+    if not verts:
+        return
+    co = vert_coords(verts).astype(np.float64)
+    set_vert_coords(verts, (co @ A.T + b).astype(np.float32))
+
+
+def on_plane_mask(verts, plane_co, n, tol):
+    """Boolean mask of ``verts`` lying within ``tol`` of the plane."""
+    if not verts:
+        return np.zeros(0, dtype=bool)
+    return np.abs(signed_distance(vert_coords(verts), plane_co, n)) <= tol
+
+
+def reflect_verts(verts, plane_co, n):
+    """Reflect ``verts`` across the plane in place."""
+    if not verts:
+        return
+    set_vert_coords(verts, reflect(vert_coords(verts), plane_co, n))
+
+
+def on_plane_faces(bm, geom, plane_co, n, tol):
+    """Faces of ``geom`` whose vertices all lie within ``tol`` of the plane."""
+    faces = [f for f in geom if isinstance(f, bmesh.types.BMFace)]
+    if not faces:
+        return []
+
+    bm.verts.index_update()
+    bm.verts.ensure_lookup_table()
+    face_verts = [f.verts for f in faces]
+    sizes = np.fromiter((len(fv) for fv in face_verts), dtype=np.int64, count=len(faces))
+    flat = np.fromiter(
+        (v.index for fv in face_verts for v in fv), dtype=np.int64, count=int(sizes.sum())
+    )
+
+    # Classify each referenced vertex once, then reduce per face.
+    used, inverse = np.unique(flat, return_inverse=True)
+    verts = [bm.verts[i] for i in used.tolist()]
+    mask = on_plane_mask(verts, plane_co, n, tol)[inverse]
+
+    starts = np.zeros(len(faces), dtype=np.int64)
+    np.cumsum(sizes[:-1], out=starts[1:])
+    face_on = np.logical_and.reduceat(mask, starts)
+    return [f for f, on in zip(faces, face_on.tolist()) if on]
+
+
+def seam_verts(geom, vmap, plane_co, n, tol):
+    """On-plane verts of ``geom`` interleaved with their valid duplicates."""
+    verts = [v for v in geom if isinstance(v, bmesh.types.BMVert) and v.is_valid]
+    mask = on_plane_mask(verts, plane_co, n, tol)
+    seam = []
+    for v, on in zip(verts, mask.tolist()):
+        if not on:
+            continue
+        seam.append(v)
+        mv = vmap.get(v)
+        if mv is not None and mv.is_valid:
+            seam.append(mv)
+    return seam
+
+
+def plane_region(bm, plane_co, n, tol):
+    """Region of interest for a full-mesh symmetrize.
+
+    Returns ``(verts, edges, faces)`` covering every element on or behind the
+    plane plus the one-ring of faces around them. Everything outside lies
+    strictly on the kept side, so bisect, normal updates and seam welding can
+    skip it. Only the distance test touches the whole mesh.
+    """
+    all_verts = bm.verts[:]
+    if not all_verts:
+        return [], [], []
+    dist = signed_distance(vert_coords(all_verts), plane_co, n)
+    affected = [all_verts[i] for i in np.flatnonzero(dist <= tol).tolist()]
+
+    # Ordered de-duplication keeps the bisect input deterministic.
+    core = dict.fromkeys(f for v in affected for f in v.link_faces)
+    faces = dict.fromkeys(f for c in core for v in c.verts for f in v.link_faces)
+    edges = dict.fromkeys(e for f in faces for e in f.edges)
+    edges.update(dict.fromkeys(e for v in affected for e in v.link_edges))
+    verts = dict.fromkeys(v for f in faces for v in f.verts)
+    verts.update(dict.fromkeys(v for e in edges for v in e.verts))
+    verts.update(dict.fromkeys(affected))
+    return list(verts), list(edges), list(faces)
+
+
+class SelectionStats(NamedTuple):
+    """Aggregate data of an edit-mesh selection (local space).
+
+    ``normal`` and ``tangent`` are the sums over selected faces of the face
+    normal and the per-face tangent used by the NORMAL orientation; both are
+    zero when no faces (or no face data) were requested.
+    """
+
+    verts: list
+    count: int
+    median: Vector | None
+    bounds: tuple[Vector, Vector] | None
+    face_count: int
+    normal: Vector
+    tangent: Vector
+
+
+def _normalize_rows(vecs):
+    length = np.sqrt((vecs * vecs).sum(axis=1))
+    out = np.zeros_like(vecs)
+    ok = length > 0.0
+    out[ok] = vecs[ok] / length[ok, None]
+    return out
+
+
+def _tri_tangents(co):
+    """Vectorized ``_tri_unique_edge_tangent`` for an (N, 3, 3) array."""
+    difs = np.zeros((len(co), 3))
+    for i_prev, i_curr, i_next in ((1, 2, 0), (2, 0, 1), (0, 1, 2)):
+        o0 = co[:, i_prev]
+        o1 = co[:, i_next]
+        proj_dir = (o0 + o1) * 0.5 - co[:, i_curr]
+        d = (proj_dir * proj_dir).sum(axis=1)
+        safe = np.where(d < 1e-12, 1.0, d)
+        scale = np.where(d < 1e-12, 0.0, ((o0 - o1) * proj_dir).sum(axis=1) / safe)
+        diff = proj_dir * scale[:, None]
+        difs[:, i_next] = (diff * diff).sum(axis=1)
+    # argmax returns the first maximum, like max() in the per-face port.
+    index = difs.argmax(axis=1)
+    rows = np.arange(len(co))
+    return _normalize_rows(co[rows, index] - co[rows, (index + 1) % 3])
+
+
+def _quad_tangents(co):
+    """Vectorized ``BMFace.calc_tangent_edge_pair`` for an (N, 4, 3) array."""
+    tangent = (co[:, 3] - co[:, 2]) + (co[:, 0] - co[:, 1])
+    other = (co[:, 0] - co[:, 3]) + (co[:, 1] - co[:, 2])
+    longer = (tangent * tangent).sum(axis=1) < (other * other).sum(axis=1)
+    tangent[longer] = other[longer]
+    return _normalize_rows(tangent)
+
+
+def face_tangents_sum(faces):
+    """Sum of the NORMAL-orientation tangent of every face in ``faces``.
+
+    Triangles and quads are computed in bulk; n-gons keep using
+    ``BMFace.calc_tangent_edge`` (matching ``_face_tangent_auto``).
+    """
+    total = np.zeros(3, dtype=np.float64)
+    by_size = {3: [], 4: []}
+    for f in faces:
+        group = by_size.get(len(f.verts))
+        if group is None:
+            total += f.calc_tangent_edge()
+        else:
+            group.append(f)
+    for size, group in by_size.items():
+        if not group:
+            continue
+        co = vert_coords([v for f in group for v in f.verts]).reshape(-1, size, 3)
+        tangents = _tri_tangents(co) if size == 3 else _quad_tangents(co)
+        total += tangents.sum(axis=0, dtype=np.float64)
+    return total
+
+
+def normals_sum(elems):
+    """Sum of ``.normal`` over BMesh verts or faces."""
+    count = len(elems)
+    flat = np.fromiter(
+        chain.from_iterable(e.normal for e in elems), dtype=np.float32, count=count * 3
+    )
+    return flat.reshape(count, 3).sum(axis=0, dtype=np.float64)
+
+
+def selection_stats(bm, faces=True):
+    """Collect the selection statistics of ``bm`` in one pass per element type.
+
+    With ``faces=False`` the face pass is skipped (no NORMAL orientation
+    needed), leaving ``face_count`` at 0 and ``normal``/``tangent`` zero.
+    """
+    verts = [v for v in bm.verts if v.select]
+    count = len(verts)
+    median = bounds = None
+    if count:
+        co = vert_coords(verts)
+        median = Vector(co.sum(axis=0, dtype=np.float64) / count)
+        bounds = (Vector(co.min(axis=0)), Vector(co.max(axis=0)))
+
+    normal = Vector((0.0, 0.0, 0.0))
+    tangent = Vector((0.0, 0.0, 0.0))
+    face_count = 0
+    if faces and count:
+        sel_faces = [f for f in bm.faces if f.select]
+        face_count = len(sel_faces)
+        if face_count:
+            normal = Vector(normals_sum(sel_faces))
+            tangent = Vector(face_tangents_sum(sel_faces))
+
+    return SelectionStats(verts, count, median, bounds, face_count, normal, tangent)
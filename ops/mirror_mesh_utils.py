@@ -1,7 +1,10 @@
 import bmesh
+import bpy
+import numpy as np
 from mathutils import Euler, Matrix, Vector
 
-from ..utils import addon
+from ..utils import addon, handlers
+from . import mirror_mesh_numpy
 
 
 def _selection(bm):
@@ -142,13 +145,16 @@ def _create_space_normal_tangent(normal, tangent):
     return Matrix((x, y, z)).transposed()
 
 
-def _build_normal_frame(bm, mw, around_active):
+def _build_normal_frame(bm, mw, around_active, stats=None):
     """World-space NORMAL orientation frame matching Blender's edit-mesh logic.
 
     ``around_active`` reproduces ``around == V3D_AROUND_ACTIVE`` (i.e. the
     Active Element pivot): the frame then follows the active element instead of
     the aggregate selection. Returns a 3x3 matrix whose columns are the X/Y/Z
     axis directions in world space, or ``None`` when no usable selection.
+
+    ``stats`` is an optional ``SelectionStats`` (collected with faces) to reuse;
+    face normals/tangents and vertex normals are then summed in bulk.
     """
     history = list(bm.select_history)
     active = history[-1] if history else None
@@ -167,14 +173,14 @@ def _build_normal_frame(bm, mw, around_active):
         else:
             result = "FACE"
     else:
-        sel_verts = [v for v in bm.verts if v.select]
-        sel_edges = [e for e in bm.edges if e.select]
-        sel_faces = [f for f in bm.faces if f.select]
-
-        if sel_faces:
-            for f in sel_faces:
-                normal += f.normal
-                plane += _face_tangent_auto(f)
+        if stats is None:
+            stats = mirror_mesh_numpy.selection_stats(bm)
+        sel_verts = stats.verts
+        sel_edges = [] if stats.face_count else [e for e in bm.edges if e.select]
+
+        if stats.face_count:
+            normal = stats.normal.copy()
+            plane = stats.tangent.copy()
             result = "FACE"
         elif len(sel_verts) == 3:
             v_tri = sel_verts
@@ -242,8 +248,7 @@ def _build_normal_frame(bm, mw, around_active):
                 plane = (v.co - vp0.co).normalized() + (vp1.co - v.co).normalized()
             result = "EDGE" if plane.length > _EPS else "VERT"
         elif len(sel_verts) > 3:
-            for v in sel_verts:
-                normal += v.normal
+            normal = Vector(mirror_mesh_numpy.normals_sum(sel_verts))
             normal.normalize()
             result = "VERT"
         else:
@@ -277,34 +282,78 @@ def _build_normal_frame(bm, mw, around_active):
     return _create_space_normal_tangent(normal, plane)
 
 
+def edit_mesh_objects(context):
+    """Mesh objects in edit mode, the active edit object first."""
+    active = context.edit_object
+    objects = [
+        o for o in getattr(context, "objects_in_mode", None) or () if o.type == "MESH"
+    ]
+    if active is not None and active.type == "MESH":
+        objects = [active] + [o for o in objects if o != active]
+    return objects
+
+
 def get_mesh_mirror_frame(context):
-    """Compute the world-space mirror plane frame for the edit-mesh object.
+    """Compute the world-space mirror plane frame for the edited mesh objects.
 
     Returns ``(world_pivot, frame)`` where ``world_pivot`` is the plane origin and
     ``frame`` is a 3x3 matrix with the X/Y/Z axis directions as columns, or
     ``None`` when there is no usable selection.
+
+    With several objects in edit mode the median is taken over the selection
+    of all of them (world space). Origin, Local and the active element follow
+    the active object; the Normal frame follows the active object, or the
+    first object with a selection when the active one has none.
     """
     obj = context.edit_object
     if not obj or obj.type != "MESH":
         return None
 
     pref = addon.pref().tools.mesh
-    bm = bmesh.from_edit_mesh(obj.data)
-
-    sel_verts = [v for v in bm.verts if v.select]
+    normal_frame = pref.orientation == "NORMAL"
+
+    # Face sums are only needed by the aggregate Normal frame (no active
+    # element to follow).
+    def collect(o, bm, primary):
+        aggregate = pref.pivot != "ACTIVE" or bm.select_history.active is None
+        return mirror_mesh_numpy.selection_stats(
+            bm, faces=normal_frame and aggregate and primary
+        )
+
+    entries = []
+    for o in edit_mesh_objects(context):
+        bm = bmesh.from_edit_mesh(o.data)
+        entries.append((o, bm, collect(o, bm, o == obj)))
+    selected = [entry for entry in entries if entry[2].count]
+    total = sum(entry[2].count for entry in selected)
 
     # A selection is only required to derive the location from the elements
     # (Active/Median) or to derive the Normal orientation.
-    needs_selection = pref.pivot in {"ACTIVE", "MEDIAN"} or pref.orientation == "NORMAL"
-    if needs_selection and not sel_verts:
+    needs_selection = pref.pivot in {"ACTIVE", "MEDIAN"} or normal_frame
+    if needs_selection and not total:
         return None
 
-    mw = obj.matrix_world
-    mw3 = mw.to_3x3()
+    # Object whose elements drive the Active pivot and the Normal frame.
+    primary, bm, stats = selected[0] if selected else entries[0]
+    if primary != obj:
+        stats = collect(primary, bm, True)
+
+    if len(selected) > 1:
+        world_median = sum(
+            ((o.matrix_world @ st.median) * st.count for o, _bm, st in selected),
+            Vector((0.0, 0.0, 0.0)),
+        ) / total
+    elif selected:
+        world_median = primary.matrix_world @ stats.median
+    else:
+        world_median = None
+
+    mw = primary.matrix_world
+    mw3 = obj.matrix_world.to_3x3()
 
     # Pivot location (world space)
     if pref.pivot == "ORIGIN":
-        world_pivot = mw.translation.copy()
+        world_pivot = obj.matrix_world.translation.copy()
     elif pref.pivot == "CURSOR":
         world_pivot = context.scene.cursor.location.copy()
     elif pref.pivot == "CUSTOM":
@@ -312,17 +361,15 @@ def get_mesh_mirror_frame(context):
     elif pref.pivot == "ACTIVE":
         active = bm.select_history.active
         if isinstance(active, bmesh.types.BMFace):
-            co_local = active.calc_center_median()
+            world_pivot = mw @ active.calc_center_median()
         elif isinstance(active, bmesh.types.BMVert):
-            co_local = active.co.copy()
+            world_pivot = mw @ active.co
         elif isinstance(active, bmesh.types.BMEdge):
-            co_local = (active.verts[0].co + active.verts[1].co) / 2.0
+            world_pivot = mw @ ((active.verts[0].co + active.verts[1].co) / 2.0)
         else:
-            co_local = sum((v.co for v in sel_verts), Vector()) / len(sel_verts)
-        world_pivot = mw @ co_local
+            world_pivot = world_median
     else:  # MEDIAN
-        co_local = sum((v.co for v in sel_verts), Vector()) / len(sel_verts)
-        world_pivot = mw @ co_local
+        world_pivot = world_median
 
     # Orientation frame (world space)
     orientation = pref.orientation
@@ -335,75 +382,181 @@ def get_mesh_mirror_frame(context):
     elif orientation == "CUSTOM":
         frame = Euler(pref.custom_rotation, "XYZ").to_matrix()
     else:  # NORMAL
-        frame = _build_normal_frame(bm, mw, pref.pivot == "ACTIVE")
+        frame = _build_normal_frame(bm, mw, pref.pivot == "ACTIVE", stats)
         if frame is None:
             frame = Matrix.Identity(3)
 
     return world_pivot, frame
 
 
-def symmetrize_geom(bm, verts, edges, faces, plane_co, plane_no, merge, dist, select_result=False):
+def get_mesh_mirror_plane(context, axis):
+    """Local-space ``(plane_co, plane_no)`` of the edit object for ``axis``.
+
+    Uses the frame from ``get_mesh_mirror_frame``; returns ``None`` when there
+    is no frame or its axis is degenerate.
+    """
+    frame_data = get_mesh_mirror_frame(context)
+    if frame_data is None:
+        return None
+    world_pivot, frame = frame_data
+
+    world_axis = frame.col[{"X": 0, "Y": 1, "Z": 2}[axis]]
+    if world_axis.length < 1e-6:
+        return None
+
+    mw_inv = context.edit_object.matrix_world.inverted()
+    local_no = (mw_inv.to_3x3() @ world_axis).normalized()
+    return mw_inv @ world_pivot, local_no
+
+
+class MeshFrameCache:
+    """Memoized ``get_mesh_mirror_frame`` for the edit-mode gizmo.
+
+    The frame only depends on the edit meshes (selection and geometry), the
+    object matrices, the 3D cursor and the ``tools.mesh`` plane settings. Mesh
+    changes are picked up from depsgraph updates (edit-mode selection, edits
+    and undo all tag the mesh); everything else is part of the key, so a
+    viewport orbit reuses the last frame. ``revision`` changes whenever a new
+    frame is computed.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self.revision = 0
+        self.key = None
+        self.value = None
+
+    def on_depsgraph_update(self, scene, depsgraph):
+        if any(isinstance(update.id, bpy.types.Mesh) for update in depsgraph.updates):
+            self.generation += 1
+
+    def _key(self, context):
+        obj = context.edit_object
+        if not obj or obj.type != "MESH":
+            return None
+        pref = addon.pref().tools.mesh
+        objects = tuple(
+            (
+                o.as_pointer(),
+                o.data.total_vert_sel,
+                o.data.total_edge_sel,
+                o.data.total_face_sel,
+                tuple(map(tuple, o.matrix_world)),
+            )
+            for o in edit_mesh_objects(context)
+        )
+        return (
+            self.generation,
+            objects,
+            tuple(map(tuple, context.scene.cursor.matrix)),
+            pref.pivot,
+            pref.orientation,
+            tuple(pref.custom_location),
+            tuple(pref.custom_rotation),
+        )
+
+    def get(self, context):
+        """Cached ``get_mesh_mirror_frame(context)``; treat the result as read-only."""
+        key = self._key(context)
+        if key is None or key != self.key:
+            self.value = get_mesh_mirror_frame(context) if key is not None else None
+            self.key = key
+            self.revision += 1
+        return self.value
+
+
+mesh_frame_cache = MeshFrameCache()
+handlers.subscribe_depsgraph(mesh_frame_cache.on_depsgraph_update)
+
+
+def symmetrize_geom(
+    bm, verts, edges, faces, plane_co, plane_no, merge, dist, select_result=False,
+    engine="PYTHON", roi=False,
+):
     """Symmetrize geometry across an arbitrary plane.
 
     Clears the side opposite to ``plane_no``, duplicates the kept side, reflects
     it across the plane and (optionally) welds the seam. Mirrors the behavior of
     the object-mode real mirror, but applied destructively to mesh geometry.
 
+    ``engine="NUMPY"`` runs the per-vertex stages (on-plane tests, reflection,
+    seam picking) through ``mirror_mesh_numpy``; the result is bit-identical.
+
+    ``roi=True`` treats ``verts``/``edges``/``faces`` as the region around the
+    plane (see ``mirror_mesh_numpy.plane_region``): only that region is
+    bisected and scanned for on-plane faces and seam verts, while the rest of
+    the mesh, known to lie on the kept side, is duplicated as-is.
+
     Returns the number of mirrored vertices created.
     """
     geom = list(verts) + list(edges) + list(faces)
-    if not geom:
+    if not geom and not roi:
         return 0
 
     n = plane_no.normalized()
     tol = max(dist, 1e-5)
+    vectorized = engine == "NUMPY"
 
     def on_plane(v):
         return abs((v.co - plane_co).dot(n)) <= tol
 
     # 1. Bisect, clearing the side opposite to the plane normal.
-    res = bmesh.ops.bisect_plane(
-        bm,
-        geom=geom,
-        dist=tol,
-        plane_co=plane_co,
-        plane_no=n,
-        clear_inner=True,
-        clear_outer=False,
-    )
-    kept = [g for g in res["geom"] if g.is_valid]
+    kept = []
+    if geom:
+        res = bmesh.ops.bisect_plane(
+            bm,
+            geom=geom,
+            dist=tol,
+            plane_co=plane_co,
+            plane_no=n,
+            clear_inner=True,
+            clear_outer=False,
+        )
+        kept = [g for g in res["geom"] if g.is_valid]
 
     # 2. Remove faces that lie flat on the plane (e.g. the face that defines the
     #    mirror), so they don't remain as a wall between the two halves.
-    on_plane_faces = [
-        f
-        for f in kept
-        if isinstance(f, bmesh.types.BMFace) and all(on_plane(v) for v in f.verts)
-    ]
+    if vectorized:
+        on_plane_faces = mirror_mesh_numpy.on_plane_faces(bm, kept, plane_co, n, tol)
+    else:
+        on_plane_faces = [
+            f
+            for f in kept
+            if isinstance(f, bmesh.types.BMFace) and all(on_plane(v) for v in f.verts)
+        ]
     if on_plane_faces:
         bmesh.ops.delete(bm, geom=on_plane_faces, context="FACES_ONLY")
         kept = [g for g in kept if g.is_valid]
 
-    if not kept:
+    # Outside the region everything is already on the kept side.
+    source = bm.verts[:] + bm.edges[:] + bm.faces[:] if roi else kept
+    if not source:
         return 0
 
     # 3. Duplicate the kept side.
-    dup = bmesh.ops.duplicate(bm, geom=kept)
+    dup = bmesh.ops.duplicate(bm, geom=source)
     vmap = dup["vert_map"]
     dup_verts = [g for g in dup["geom"] if isinstance(g, bmesh.types.BMVert)]
     dup_faces = [g for g in dup["geom"] if isinstance(g, bmesh.types.BMFace)]
 
     # 4. Reflect the duplicate across the plane.
-    for v in dup_verts:
-        d = (v.co - plane_co).dot(n)
-        v.co = v.co - 2.0 * d * n
+    if vectorized:
+        mirror_mesh_numpy.reflect_verts(dup_verts, plane_co, n)
+    else:
+        for v in dup_verts:
+            d = (v.co - plane_co).dot(n)
+            v.co = v.co - 2.0 * d * n
 
     # 5. Negative scale flips winding — restore it.
     if dup_faces:
         bmesh.ops.reverse_faces(bm, faces=dup_faces)
 
     # 6. Weld the seam: verts on the plane coincide with their reflected copies.
-    if merge:
+    if merge and vectorized:
+        seam = mirror_mesh_numpy.seam_verts(kept, vmap, plane_co, n, tol)
+        if seam:
+            bmesh.ops.remove_doubles(bm, verts=seam, dist=tol)
+    elif merge:
         seam = []
         for v in kept:
             if not (isinstance(v, bmesh.types.BMVert) and v.is_valid and on_plane(v)):
@@ -421,3 +574,169 @@ def symmetrize_geom(bm, verts, edges, faces, plane_co, plane_no, merge, dist, se
                 v.select_set(True)
 
     return len(dup_verts)
+
+
+def symmetrize_multi_geom(
+    bm, verts, edges, faces, planes, merge, dist, select_result=False, engine="PYTHON",
+):
+    """Symmetrize geometry across several planes in a single pass.
+
+    ``planes`` is a list of ``(plane_co, plane_no)``. The geometry is cut once
+    per plane, keeping the region on the positive side of all of them; then
+    every combination of reflections (2**k - 1 copies) is duplicated straight
+    from that region and all seams are welded together. Unlike chained
+    ``symmetrize_geom`` calls, no pass re-processes the copies of a previous
+    one.
+
+    Returns the number of mirrored vertices created.
+    """
+    geom = list(verts) + list(edges) + list(faces)
+    if not geom or not planes:
+        return 0
+
+    planes = [(co, no.normalized()) for co, no in planes]
+    tol = max(dist, 1e-5)
+    vectorized = engine == "NUMPY"
+
+    def on_any_plane(v):
+        return any(abs((v.co - co).dot(n)) <= tol for co, n in planes)
+
+    # 1. Cut away everything behind any of the planes.
+    for plane_co, n in planes:
+        res = bmesh.ops.bisect_plane(
+            bm,
+            geom=geom,
+            dist=tol,
+            plane_co=plane_co,
+            plane_no=n,
+            clear_inner=True,
+            clear_outer=False,
+        )
+        geom = [g for g in res["geom"] if g.is_valid]
+        if not geom:
+            return 0
+
+    # 2. Faces flat on one of the planes would become walls between copies.
+    wall = [
+        f
+        for f in geom
+        if isinstance(f, bmesh.types.BMFace)
+        and any(all(abs((v.co - co).dot(n)) <= tol for v in f.verts) for co, n in planes)
+    ]
+    if wall:
+        bmesh.ops.delete(bm, geom=wall, context="FACES_ONLY")
+        geom = [g for g in geom if g.is_valid]
+    if not geom:
+        return 0
+
+    kept_verts = [v for v in geom if isinstance(v, bmesh.types.BMVert)]
+    created = []
+
+    # 3. One copy per non-empty subset of the planes.
+    for mask in range(1, 1 << len(planes)):
+        subset = [planes[i] for i in range(len(planes)) if mask >> i & 1]
+        dup = bmesh.ops.duplicate(bm, geom=geom)
+        dup_verts = [g for g in dup["geom"] if isinstance(g, bmesh.types.BMVert)]
+        dup_faces = [g for g in dup["geom"] if isinstance(g, bmesh.types.BMFace)]
+
+        if vectorized:
+            mirror_mesh_numpy.transform_verts(
+                dup_verts, *mirror_mesh_numpy.reflection_affine(subset)
+            )
+        else:
+            for plane_co, n in subset:
+                for v in dup_verts:
+                    d = (v.co - plane_co).dot(n)
+                    v.co = v.co - 2.0 * d * n
+
+        # An odd number of reflections flips the winding.
+        if dup_faces and len(subset) % 2:
+            bmesh.ops.reverse_faces(bm, faces=dup_faces)
+        created.extend(dup_verts)
+
+    # 4. One weld over every vertex that ended up on a plane.
+    if merge:
+        candidates = [v for v in kept_verts + created if v.is_valid]
+        if vectorized:
+            co = mirror_mesh_numpy.vert_coords(candidates)
+            mask = np.zeros(len(candidates), dtype=bool)
+            for plane_co, n in planes:
+                mask |= np.abs(mirror_mesh_numpy.signed_distance(co, plane_co, n)) <= tol
+            seam = [v for v, on in zip(candidates, mask.tolist()) if on]
+        else:
+            seam = [v for v in candidates if on_any_plane(v)]
+        if seam:
+            bmesh.ops.remove_doubles(bm, verts=seam, dist=tol)
+
+    if select_result:
+        for v in created:
+            if v.is_valid:
+                v.select_set(True)
+
+    return len(created)
+
+
+def _reflect_in_place(verts, plane_co, n, vectorized):
+    if vectorized:
+        mirror_mesh_numpy.reflect_verts(verts, plane_co, n)
+    else:
+        for v in verts:
+            d = (v.co - plane_co).dot(n)
+            v.co = v.co - 2.0 * d * n
+
+
+def flip_copy_geom(
+    bm, verts, edges, faces, plane_co, plane_no, select_result=False, engine="PYTHON"
+):
+    """Add a reflected copy of the geometry, without bisecting or welding.
+
+    Meant for geometry that already sits on one side of the plane. Returns the
+    number of vertices created.
+    """
+    geom = list(verts) + list(edges) + list(faces)
+    if not geom:
+        return 0
+
+    n = plane_no.normalized()
+    dup = bmesh.ops.duplicate(bm, geom=geom)
+    dup_verts = [g for g in dup["geom"] if isinstance(g, bmesh.types.BMVert)]
+    dup_faces = [g for g in dup["geom"] if isinstance(g, bmesh.types.BMFace)]
+
+    _reflect_in_place(dup_verts, plane_co, n, engine == "NUMPY")
+    if dup_faces:
+        bmesh.ops.reverse_faces(bm, faces=dup_faces)
+        for f in dup_faces:
+            f.normal_update()
+    for v in dup_verts:
+        v.normal_update()
+
+    if select_result:
+        for v in verts:
+            v.select_set(False)
+        for v in dup_verts:
+            v.select_set(True)
+
+    return len(dup_verts)
+
+
+def flip_geom(bm, verts, faces, plane_co, plane_no, engine="PYTHON"):
+    """Reflect the geometry across the plane in place and fix its winding.
+
+    Faces in ``faces`` are reversed; faces only partly inside the flipped
+    vertices keep their winding. Returns the number of vertices moved.
+    """
+    if not verts:
+        return 0
+
+    n = plane_no.normalized()
+    _reflect_in_place(verts, plane_co, n, engine == "NUMPY")
+    if faces:
+        bmesh.ops.reverse_faces(bm, faces=faces)
+
+    # Normals of the flipped region and of the faces around it.
+    for f in {f for v in verts for f in v.link_faces}:
+        f.normal_update()
+    for v in verts:
+        v.normal_update()
+
+    return len(verts)
@@ -0,0 +1,151 @@
+"""Pooled pivot empties for mirror modifiers.
+
+Mirror modifiers and chisel mirror items need an empty as mirror object
+whenever the pivot or orientation isn't the object's own. Instead of a new
+empty per operation, ``PivotPool`` hands out an existing empty with the same
+location and rotation (within ``TOLERANCE``) from the ``RotorMirrorPivots``
+collection, hidden in the view layer, and only creates one when none matches.
+
+``purge_unused`` removes pooled (and older, unpooled) pivot empties that
+nothing references anymore.
+"""
+
+import bpy
+from mathutils import Euler, Vector
+
+from ..utils import addon
+
+POOL_COLLECTION = "RotorMirrorPivots"
+PIVOT_NAME = "RotorMirrorPivot"
+TOLERANCE = 1e-5
+
+# IDs that only link an empty into the scene, rather than reference it.
+LINK_TYPES = (bpy.types.Collection, bpy.types.Scene)
+
+
+def _pivot_key(location, rotation_matrix):
+    q = 1.0 / TOLERANCE
+    return (
+        tuple(round(v * q) for v in location),
+        tuple(round(v * q) for row in rotation_matrix for v in row),
+    )
+
+
+def _empty_key(empty):
+    return _pivot_key(empty.location, empty.rotation_euler.to_matrix())
+
+
+class PivotPool:
+    """Index of the pooled empties by rounded location and rotation.
+
+    The index is rebuilt when the pool collection changed size; entries are
+    checked against the empty's current transform before being reused, so
+    empties moved by hand are not handed out for their old placement.
+    """
+
+    def __init__(self):
+        self._index = {}
+        self._signature = None
+
+    def collection(self, context, create=True):
+        """The pool collection, linked to the scene and hidden in the view layer."""
+        col = bpy.data.collections.get(POOL_COLLECTION)
+        if col is None:
+            if not create:
+                return None
+            col = bpy.data.collections.new(POOL_COLLECTION)
+
+        scene_root = context.scene.collection
+        if col.name not in scene_root.children:
+            scene_root.children.link(col)
+            layer_col = context.view_layer.layer_collection.children.get(col.name)
+            if layer_col is not None:
+                layer_col.hide_viewport = True
+        return col
+
+    def acquire(self, context, location, orientation=(0.0, 0.0, 0.0)):
+        """A pivot empty at ``location`` with ``orientation`` (Euler angles)."""
+        col = self.collection(context)
+        self._refresh(col)
+
+        location = Vector(location)
+        rotation = Euler(orientation).to_matrix()
+        key = _pivot_key(location, rotation)
+
+        empty = col.objects.get(self._index.get(key, ""))
+        if empty is not None and _empty_key(empty) == key:
+            return empty
+
+        pref = addon.pref().tools.mirror
+        empty = bpy.data.objects.new(PIVOT_NAME, None)
+        empty.empty_display_type = pref.empty_display_type
+        empty.empty_display_size = pref.empty_display_size
+        empty.location = location
+        empty.rotation_euler = orientation
+        col.objects.link(empty)
+
+        self._index[key] = empty.name
+        self._signature = (col.session_uid, len(col.objects))
+        return empty
+
+    def _refresh(self, col):
+        signature = (col.session_uid, len(col.objects))
+        if signature == self._signature:
+            return
+        self._index = {
+            _empty_key(obj): obj.name for obj in col.objects if obj.type == "EMPTY"
+        }
+        self._signature = signature
+
+
+pivot_pool = PivotPool()
+
+
+def purge_unused():
+    """Remove pivot empties nothing references; returns how many were removed.
+
+    Covers the pool and pivot empties created before it (by name). An empty
+    counts as used when any ID other than the collections (or scene) it is
+    linked to points to it: mirror modifiers, chisel mirror items,
+    constraints, children, drivers.
+    """
+    pool = bpy.data.collections.get(POOL_COLLECTION)
+    candidates = {
+        obj
+        for obj in bpy.data.objects
+        if obj.type == "EMPTY"
+        and obj.instance_type == "NONE"
+        and not obj.library
+        and (obj.name.startswith(PIVOT_NAME) or (pool and obj.name in pool.objects))
+    }
+    if not candidates:
+        return 0
+
+    user_map = bpy.data.user_map(subset=candidates)
+    unused = [
+        obj
+        for obj in candidates
+        if all(isinstance(user, LINK_TYPES) for user in user_map[obj])
+    ]
+    if unused:
+        bpy.data.batch_remove(unused)
+    return len(unused)
+
+
+class ROTOR_OT_PurgeMirrorPivots(bpy.types.Operator):
+    """Remove mirror pivot empties that no modifier references anymore"""
+
+    bl_idname = "mirror.purge_pivots"
+    bl_label = "Purge Unused Pivots"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        removed = purge_unused()
+        if removed:
+            self.report({"INFO"}, f"Removed {removed} unused pivot empties.")
+        else:
+            self.report({"INFO"}, "No unused pivot empties.")
+        return {"FINISHED"}
+
+
+classes = (ROTOR_OT_PurgeMirrorPivots,)
@@ -0,0 +1,152 @@
+"""Object-mode mirror planes.
+
+The pivot and orientation preferences define a mirror frame; a ``MirrorPlane``
+is that frame with one of its axes as the plane normal. ``PlaneResolver``
+reads the preferences once and hands out planes: one shared plane when the
+frame doesn't depend on the object, otherwise one per object (Individual
+pivot, Local orientation), memoized for the lifetime of the resolver. Create
+one per operator run or redraw and pass it along.
+
+Object frames come from ``matrix_world``: its translation and its rotation
+with scale removed, so parented objects and every rotation mode resolve to
+where the object actually is.
+"""
+
+from mathutils import Euler, Matrix, Vector
+
+from ..utils import addon
+
+IDENTITY = Matrix.Identity(3)
+
+
+def world_location(obj):
+    """World-space origin of ``obj``."""
+    return obj.matrix_world.translation.copy()
+
+
+def world_rotation(obj):
+    """World-space rotation of ``obj`` (orthonormal, scale removed)."""
+    return obj.matrix_world.to_quaternion().to_matrix()
+
+
+def cursor_rotation(context):
+    """Rotation of the 3D cursor, whatever its rotation mode."""
+    return context.scene.cursor.matrix.to_quaternion().to_matrix()
+
+
+class MirrorPlane:
+    """A mirror plane in world space.
+
+    ``matrix`` is the frame (pivot and rotation) and ``matrix_inv`` its
+    inverse, ``normal`` the unit plane normal (flipped for the negative side)
+    and ``xform`` the reflection across the plane.
+    """
+
+    __slots__ = ("pivot", "rotation", "normal", "matrix", "matrix_inv", "xform")
+
+    def __init__(self, pivot, rotation, axis_idx, is_neg=False):
+        self.pivot = pivot.freeze()
+        self.rotation = rotation.freeze()
+
+        normal = rotation.col[axis_idx].normalized()
+        self.normal = (-normal if is_neg else normal).freeze()
+
+        T = Matrix.Translation(pivot)
+        self.matrix = (T @ rotation.to_4x4()).freeze()
+        self.matrix_inv = self.matrix.inverted_safe().freeze()
+
+        S = Matrix.Identity(4)
+        S[axis_idx][axis_idx] = -1.0
+        self.xform = (self.matrix @ S @ self.matrix_inv).freeze()
+
+    def local(self, obj):
+        """The plane ``(co, no)`` in the local space of ``obj``."""
+        world_to_local = obj.matrix_world.inverted()
+        co = world_to_local @ self.pivot
+        no = world_to_local.to_3x3() @ self.normal
+        no.normalize()
+        return co, no
+
+
+class PlaneResolver:
+    """Memoized mirror planes of objects for one pivot/orientation setting."""
+
+    def __init__(self, context, axis_idx, is_neg=False, pivot=None, orientation=None):
+        pref = addon.pref().tools.mirror
+        self.axis_idx = axis_idx
+        self.is_neg = is_neg
+        self.pivot = pivot or pref.pivot
+        self.orientation = orientation or pref.orientation
+        self.per_object = self.pivot == "INDIVIDUAL" or (
+            self.orientation == "LOCAL" and self.pivot in ("WORLD", "CURSOR", "CUSTOM")
+        )
+
+        active = context.active_object
+        cursor = context.scene.cursor
+        self._active = active
+        self._active_location = world_location(active) if active else None
+        self._cursor_location = cursor.location.copy()
+        self._custom_location = Vector(pref.custom_location)
+
+        self._rotation = None
+        if self.orientation == "LOCAL" and self.pivot == "ACTIVE" and active:
+            self._rotation = world_rotation(active)
+        elif self.orientation == "CURSOR":
+            self._rotation = cursor_rotation(context)
+        elif self.orientation == "CUSTOM":
+            self._rotation = Euler(pref.custom_rotation, "XYZ").to_matrix()
+
+        self._shared = None
+        self._planes = {}
+
+    def __call__(self, obj=None):
+        """The plane for ``obj`` (the active object's when None)."""
+        if obj is None:
+            obj = self._active
+        if not self.per_object or obj is None:
+            if self._shared is None:
+                self._shared = self._plane(self._pivot_point(obj), self._frame_rotation(obj))
+            return self._shared
+
+        plane = self._planes.get(obj)
+        if plane is None:
+            plane = self._planes[obj] = self._plane(
+                self._pivot_point(obj), self._frame_rotation(obj)
+            )
+        return plane
+
+    def group(self, objects):
+        """One plane for a group of objects (collection instances): per-object
+        pivots and rotations are averaged."""
+        objects = list(objects)
+        if not self.per_object or not objects:
+            return self(objects[0] if objects else None)
+
+        pivot = self._pivot_point(None)
+        if self.pivot == "INDIVIDUAL":
+            pivot = sum((world_location(o) for o in objects), Vector()) / len(objects)
+        rotation = self._rotation
+        if self.orientation == "LOCAL":
+            rotation = sum(
+                (world_rotation(o) for o in objects), Matrix.Diagonal((0, 0, 0))
+            ) * (1.0 / len(objects))
+        return self._plane(pivot, rotation)
+
+    def _plane(self, pivot, rotation):
+        return MirrorPlane(pivot, rotation or IDENTITY.copy(), self.axis_idx, self.is_neg)
+
+    def _pivot_point(self, obj):
+        if self.pivot == "ACTIVE" and self._active_location is not None:
+            return self._active_location
+        if self.pivot == "INDIVIDUAL" and obj is not None:
+            return world_location(obj)
+        if self.pivot == "CURSOR":
+            return self._cursor_location
+        if self.pivot == "CUSTOM":
+            return self._custom_location
+        return Vector((0, 0, 0))
+
+    def _frame_rotation(self, obj):
+        if self.per_object and self.orientation == "LOCAL" and obj is not None:
+            return world_rotation(obj)
+        return self._rotation
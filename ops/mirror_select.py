@@ -0,0 +1,95 @@
+import bmesh
+import bpy
+import numpy as np
+
+from ..utils import addon
+from .mirror_mesh_numpy import reflect, vert_coords
+from .mirror_mesh_utils import get_mesh_mirror_plane
+from .mirror_symmetry import symmetry_cache
+
+
+def mirrored_indices(me, bm, verts, plane_co, plane_no, tol):
+    """Counterpart indices of ``verts`` across the plane (-1 when missing).
+
+    Uses the cached pair map of the plane when there is one; otherwise the
+    reflected positions are looked up in the cached per-mesh KD-tree.
+    """
+    indices = np.fromiter((v.index for v in verts), dtype=np.int64, count=len(verts))
+    smap = symmetry_cache.peek(me, bm, plane_co, plane_no, tol)
+    if smap is not None:
+        return smap.counterparts(indices)
+
+    tree = symmetry_cache.tree(me, bm)
+    found = np.full(len(verts), -1, dtype=np.int64)
+    reflected = reflect(vert_coords(verts), plane_co, plane_no)
+    for i, r in enumerate(reflected.tolist()):
+        _co, index, dist = tree.find(r)
+        if index is not None and dist <= tol:
+            found[i] = index
+    return found
+
+
+class ROTOR_OT_SelectMirror(bpy.types.Operator):
+    """Select the mirrored counterparts of the selection across the Mirror Mesh plane"""
+
+    bl_idname = "mirror.select_mirror"
+    bl_label = "Select Mirror"
+    bl_options = {"REGISTER", "UNDO"}
+
+    axis: bpy.props.EnumProperty(
+        name="Axis",
+        description="Axis of the mirror frame used as the plane normal",
+        items=[("X", "X", ""), ("Y", "Y", ""), ("Z", "Z", "")],
+    )
+    extend: bpy.props.BoolProperty(
+        name="Extend",
+        description="Keep the current selection and add the mirrored elements",
+        default=False,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return (
+            context.mode == "EDIT_MESH"
+            and context.edit_object is not None
+            and context.edit_object.type == "MESH"
+        )
+
+    def execute(self, context):
+        obj = context.edit_object
+        me = obj.data
+        bm = bmesh.from_edit_mesh(me)
+
+        selected = [v for v in bm.verts if v.select]
+        if not selected:
+            self.report({"WARNING"}, "Nothing selected.")
+            return {"CANCELLED"}
+
+        plane = get_mesh_mirror_plane(context, self.axis)
+        if plane is None:
+            self.report({"WARNING"}, "No usable mirror plane for the current selection.")
+            return {"CANCELLED"}
+        local_co, local_no = plane
+        tol = max(addon.pref().tools.mesh.merge_threshold, 1e-5)
+
+        bm.verts.index_update()
+        bm.verts.ensure_lookup_table()
+        mirrored = mirrored_indices(me, bm, selected, local_co, local_no, tol)
+        found = mirrored[mirrored >= 0]
+
+        if not self.extend:
+            # Deselecting a vertex also clears its edges and faces.
+            for v in selected:
+                v.select_set(False)
+        for i in found.tolist():
+            bm.verts[i].select_set(True)
+        bm.select_flush(True)
+        bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
+
+        missing = len(selected) - len(found)
+        if missing:
+            self.report({"INFO"}, f"{missing} vertices have no mirrored counterpart.")
+        return {"FINISHED"}
+
+
+classes = (ROTOR_OT_SelectMirror,)
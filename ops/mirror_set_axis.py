@@ -6,55 +6,39 @@ from .mirror_utils import (
     toggle_axis,
     get_mirror_object,
     create_mirror_modifier,
-    bisect_object,
     execute_real_mirror,
+    modifier_template,
 )
+from .mirror_bisect import bisect_objects, report_cleared
 from .mirror_chisel import (
     is_chisel_object,
-    get_chisel_mirror_item,
     chisel_axis_state,
     add_chisel_mirror,
     toggle_chisel_axis,
     remove_chisel_mirror,
 )
+from .mirror_index import CHISEL, MODIFIER, mirror_index
 from .mirror_props import ROTOR_PG_MirrorObjectItem
 
 
 def detect_is_disabling(active_object, axis_idx, is_neg):
     """Check whether toggling this axis on the active object's tracked mirror
     (pinned modifier, or pinned chisel mirror item) would disable it."""
-    if is_chisel_object(active_object):
-        chisel_item, _ = get_chisel_mirror_item(active_object)
-        if chisel_item is None:
-            return False
-        use_axis, use_flip = chisel_axis_state(chisel_item)
-        current_state = (use_axis[axis_idx], use_flip[axis_idx], is_neg)
+    entry, data = mirror_index.pinned(active_object)
+    if entry is None:
+        return False
+    if entry.kind == CHISEL:
+        use_axis, use_flip = chisel_axis_state(data)
     else:
-        # Only look for pinned mirror modifiers for set operations
-        active_mirror_mod = next(
-            (
-                m
-                for m in reversed(active_object.modifiers)
-                if m.type == "MIRROR" and m.use_pin_to_last
-            ),
-            None,
-        )
-        if active_mirror_mod is None:
-            return False
-        current_state = (
-            active_mirror_mod.use_axis[axis_idx],
-            active_mirror_mod.use_bisect_flip_axis[axis_idx],
-            is_neg,
-        )
+        use_axis, use_flip = data.use_axis, data.use_bisect_flip_axis
+    current_state = (use_axis[axis_idx], use_flip[axis_idx], is_neg)
     new_axis, _ = MIRROR_AXIS_TRANSITIONS[current_state]
     return current_state[0] and not new_axis
 
 
 def has_mirror_modifier(obj):
     """True if obj already has a mirror (Blender modifier or chisel item)"""
-    if is_chisel_object(obj):
-        return get_chisel_mirror_item(obj, pinned_only=False)[0] is not None
-    return any(m.type == "MIRROR" for m in obj.modifiers)
+    return mirror_index.has_mirror(obj)
 
 
 class ROTOR_OT_SetMirrorAxis(bpy.types.Operator):
@@ -234,11 +218,18 @@ class ROTOR_OT_SetMirrorAxis(bpy.types.Operator):
             context, active_object, pivot, orientation
         )
 
+        # Pinned mirrors and modifier settings are looked up once per run
+        pinned_table = mirror_index.pinned_table(enabled_objects)
+        template = modifier_template()
+
+        # Objects getting a new pinned modifier are bisected in one batch
+        to_bisect = []
         for obj in enabled_objects:
+            entry, pinned = pinned_table[obj]
             # Chisel objects: drive chisel's pinned mirror item instead of a
             # pinned modifier
             if is_chisel_object(obj):
-                chisel_item, chisel_index = get_chisel_mirror_item(obj)
+                chisel_item = pinned if entry and entry.kind == CHISEL else None
 
                 if chisel_item is None:
                     if is_disabling:
@@ -257,20 +248,13 @@ class ROTOR_OT_SetMirrorAxis(bpy.types.Operator):
                 # We have a mirror item - toggle the axis on it
                 if not toggle_chisel_axis(chisel_item, axis_idx, is_neg):
                     # All axes disabled - remove the mirror item
-                    remove_chisel_mirror(context, obj, chisel_index)
+                    remove_chisel_mirror(context, obj, entry.key)
 
                 affected_count += 1
                 continue
 
             # ONLY work with pinned mirror modifiers for set operation
-            mirror_mod = next(
-                (
-                    m
-                    for m in reversed(obj.modifiers)
-                    if m.type == "MIRROR" and m.use_pin_to_last
-                ),
-                None,
-            )
+            mirror_mod = pinned if entry and entry.kind == MODIFIER else None
 
             if mirror_mod is None:
                 if is_disabling:
@@ -280,19 +264,13 @@ class ROTOR_OT_SetMirrorAxis(bpy.types.Operator):
                 else:
                     # Enabling - create a new pinned modifier
                     if pref.bisect:
-                        bisect_object(
-                            obj, axis_idx, pivot, orientation, context, is_neg
-                        )
+                        to_bisect.append(obj)
 
-                    create_mirror_modifier(
-                        context, obj, mirror_object, individual, axis_idx, is_neg
-                    )
                     # Pin the newly created modifier for set operations
-                    new_mod = next(
-                        (m for m in reversed(obj.modifiers) if m.type == "MIRROR"), None
+                    create_mirror_modifier(
+                        context, obj, mirror_object, individual, axis_idx, is_neg,
+                        template=template, pin=True,
                     )
-                    if new_mod:
-                        new_mod.use_pin_to_last = True
                     affected_count += 1
                     continue
 
@@ -309,6 +287,12 @@ class ROTOR_OT_SetMirrorAxis(bpy.types.Operator):
 
             affected_count += 1
 
+        cleared = []
+        if to_bisect:
+            cleared = bisect_objects(
+                context, to_bisect, axis_idx, pivot, orientation, is_neg
+            )
+
         # Report results
         if is_disabling:
             if skipped_count > 0 and affected_count > 0:
@@ -327,6 +311,7 @@ class ROTOR_OT_SetMirrorAxis(bpy.types.Operator):
         else:
             # Enabling - we create modifiers if needed
             self.report({"INFO"}, f"Set mirror on {affected_count} objects.")
+        report_cleared(self, cleared)
 
         # Check if we should return to previous tool
         pref = addon.pref().tools.mirror
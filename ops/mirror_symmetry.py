@@ -0,0 +1,359 @@
+"""Vertex counterpart maps across an arbitrary mirror plane.
+
+``build_pair_map`` pairs every vertex with the vertex closest to its
+reflection (``mathutils.kdtree``, within a tolerance). Vertices left without a
+positional match (slightly moved or sculpted) are then resolved through
+topology: an unpaired vertex next to a paired one takes the best unpaired
+neighbor of that vertex's counterpart.
+
+``symmetry_cache`` keeps the maps per mesh and plane so repeated lookups cost
+O(1) per vertex; a map is dropped as soon as the mesh's topology signature
+(element counts and a hash of the edge list) changes.
+
+With the Store Symmetry Map preference, the last map of a mesh is also saved
+on the datablock: counterparts as the ``rotor_symmetry`` point attribute, the
+plane and a topology hash as custom properties. After reopening the file the
+stored map is reused as long as the hash still matches the mesh.
+"""
+
+import hashlib
+from collections import deque
+
+import bpy
+import numpy as np
+from mathutils import kdtree
+
+from ..utils import addon, handlers
+from .mirror_mesh_numpy import reflect, vert_coords
+
+# Minimum share of positionally matched vertices before the topology pass
+# runs; below it the mesh is simply not symmetric and walking it is wasted.
+TOPOLOGY_MIN_MATCHED = 0.5
+
+
+class SymmetryMap:
+    """Counterpart index for one mesh and plane (local space).
+
+    ``pairs[i]`` is the counterpart of vertex ``i``, ``i`` itself for vertices
+    on the plane and -1 when no counterpart was found.
+    """
+
+    __slots__ = ("pairs", "plane_co", "plane_no", "tol", "signature")
+
+    def __init__(self, pairs, plane_co, plane_no, tol, signature):
+        self.pairs = pairs
+        self.plane_co = plane_co
+        self.plane_no = plane_no
+        self.tol = tol
+        self.signature = signature
+
+    @property
+    def unpaired(self):
+        """Indices of vertices without a counterpart."""
+        return np.flatnonzero(self.pairs < 0)
+
+    @property
+    def is_complete(self):
+        return bool(len(self.pairs)) and not (self.pairs < 0).any()
+
+    def counterpart(self, index):
+        return int(self.pairs[index])
+
+    def counterparts(self, indices):
+        """Counterparts of ``indices`` (an int array), -1 where missing."""
+        return self.pairs[np.asarray(indices, dtype=np.int64)]
+
+
+def topology_hash(edges, vert_count):
+    """Hash of the vertex count and edge list; stable across save/load."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.int64(vert_count).tobytes())
+    digest.update(np.ascontiguousarray(edges, dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+
+def bmesh_counts(bm):
+    """Element counts of a BMesh; the cheap first part of its signature."""
+    return (len(bm.verts), len(bm.edges), len(bm.faces))
+
+
+def bmesh_signature(bm, edges=None):
+    """Topology signature of a BMesh: element counts and a hash of the edge
+    list, so rebuilt or reordered topology with the same counts is caught.
+    ``edges`` is the ``bmesh_edges`` array when already at hand."""
+    if edges is None:
+        edges = bmesh_edges(bm)
+    return (*bmesh_counts(bm), topology_hash(edges, len(bm.verts)))
+
+
+def bmesh_edges(bm):
+    """(E, 2) int array with the vertex indices of every edge."""
+    bm.verts.index_update()
+    count = len(bm.edges)
+    flat = np.fromiter(
+        (v.index for e in bm.edges for v in e.verts), dtype=np.int64, count=count * 2
+    )
+    return flat.reshape(count, 2)
+
+
+def _adjacency(edges, count):
+    """CSR adjacency (offsets, neighbors) for ``count`` vertices."""
+    both = np.concatenate((edges, edges[:, ::-1]))
+    order = np.argsort(both[:, 0], kind="stable")
+    neighbors = both[order, 1]
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(both[:, 0], minlength=count), out=offsets[1:])
+    return offsets, neighbors
+
+
+def build_kdtree(co):
+    """Balanced ``mathutils.kdtree.KDTree`` over an (N, 3) coordinate array."""
+    tree = kdtree.KDTree(len(co))
+    for i, c in enumerate(co.tolist()):
+        tree.insert(c, i)
+    tree.balance()
+    return tree
+
+
+def _match_positions(co, reflected, tol, tree=None):
+    """Nearest-vertex match of every reflected point, kept only when mutual."""
+    count = len(co)
+    if tree is None:
+        tree = build_kdtree(co)
+
+    pairs = np.full(count, -1, dtype=np.int64)
+    for i, r in enumerate(reflected.tolist()):
+        _co, index, dist = tree.find(r)
+        if index is not None and dist <= tol:
+            pairs[i] = index
+
+    matched = np.flatnonzero(pairs >= 0)
+    mutual = pairs[pairs[matched]] == matched
+    pairs[matched[~mutual]] = -1
+    return pairs
+
+
+def _match_topology(pairs, co, reflected, edges):
+    """Pair the remaining vertices by walking out from matched neighbors.
+
+    A worklist holds the unpaired vertices next to a paired one; each new
+    pair queues its unpaired neighbors, so the walk touches every vertex a
+    bounded number of times instead of rescanning all unpaired ones per ring.
+    """
+    offsets, neighbors = _adjacency(edges, len(co))
+    valence = np.diff(offsets)
+
+    def ring(i):
+        return neighbors[offsets[i]:offsets[i + 1]].tolist()
+
+    paired = pairs >= 0
+    frontier = edges[paired[edges[:, 0]] != paired[edges[:, 1]]].ravel()
+    seeds = np.unique(frontier[~paired[frontier]]).tolist()
+    queue = deque(seeds)
+    queued = set(seeds)
+
+    while queue:
+        a = queue.popleft()
+        queued.discard(a)
+        if pairs[a] >= 0:
+            continue
+        best = None
+        best_dist = None
+        for b in ring(a):
+            mirror_b = pairs[b]
+            if mirror_b < 0:
+                continue
+            for c in ring(mirror_b):
+                if (pairs[c] >= 0 and c != a) or valence[c] != valence[a]:
+                    continue
+                dist = float(((reflected[a] - co[c]) ** 2).sum())
+                if best_dist is None or dist < best_dist:
+                    best, best_dist = c, dist
+        if best is None:
+            continue
+        pairs[a] = best
+        pairs[best] = a
+        for v in (*ring(a), *ring(best)):
+            if pairs[v] < 0 and v not in queued:
+                queue.append(v)
+                queued.add(v)
+    return pairs
+
+
+def build_pair_map(
+    co, edges, plane_co, plane_no, tol, signature=None, topology=True, tree=None
+):
+    """Build a ``SymmetryMap`` for coordinates ``co`` and ``edges``.
+
+    ``plane_no`` must be normalized. ``topology`` enables the fallback for
+    vertices without a positional match. ``tree`` is an optional KD-tree over
+    ``co`` to reuse.
+    """
+    reflected = reflect(co, plane_co, plane_no)
+    pairs = _match_positions(co, reflected, tol, tree)
+
+    if topology and len(edges) and (pairs >= 0).mean() >= TOPOLOGY_MIN_MATCHED:
+        pairs = _match_topology(pairs, co, reflected, edges)
+
+    return SymmetryMap(pairs, tuple(plane_co), tuple(plane_no), tol, signature)
+
+
+def bmesh_pair_map(bm, plane_co, plane_no, tol, topology=True, edges=None):
+    """``build_pair_map`` for a BMesh."""
+    co = vert_coords(bm.verts[:])
+    if edges is None:
+        edges = bmesh_edges(bm) if topology else np.zeros((0, 2), dtype=np.int64)
+    signature = bmesh_signature(bm, edges if topology else None)
+    return build_pair_map(co, edges, plane_co, plane_no, tol, signature, topology)
+
+
+ATTRIBUTE = "rotor_symmetry"
+PLANE_PROP = "rotor_symmetry_plane"
+HASH_PROP = "rotor_symmetry_hash"
+
+
+def store_pair_map(me, bm, smap, edges):
+    """Save ``smap`` on ``me`` through its edit BMesh ``bm``."""
+    layer = bm.verts.layers.int.get(ATTRIBUTE)
+    if layer is None:
+        layer = bm.verts.layers.int.new(ATTRIBUTE)
+    for v, pair in zip(bm.verts, smap.pairs.tolist()):
+        v[layer] = pair
+    me[PLANE_PROP] = [*smap.plane_co, *smap.plane_no, smap.tol]
+    me[HASH_PROP] = topology_hash(edges, len(bm.verts))
+
+
+def load_pair_map(me, bm, plane_co, plane_no, tol, edges):
+    """Stored map of ``me`` for this plane, or None when missing or stale."""
+    stored = me.get(PLANE_PROP)
+    if stored is None or len(stored) != 7 or me.get(HASH_PROP) is None:
+        return None
+    if _plane_key(stored[:3], stored[3:6], stored[6]) != _plane_key(plane_co, plane_no, tol):
+        return None
+    layer = bm.verts.layers.int.get(ATTRIBUTE)
+    if layer is None or me[HASH_PROP] != topology_hash(edges, len(bm.verts)):
+        return None
+
+    count = len(bm.verts)
+    pairs = np.fromiter((v[layer] for v in bm.verts), dtype=np.int64, count=count)
+    if ((pairs < -1) | (pairs >= count)).any():
+        return None
+    return SymmetryMap(
+        pairs, tuple(plane_co), tuple(plane_no), tol, bmesh_signature(bm, edges)
+    )
+
+
+def _plane_key(plane_co, plane_no, tol):
+    return (
+        tuple(round(c, 6) for c in plane_co),
+        tuple(round(c, 6) for c in plane_no),
+        round(tol, 9),
+    )
+
+
+class SymmetryCache:
+    """Pair maps per mesh (``session_uid``) and plane.
+
+    Keeps the last few planes per mesh. A map whose topology signature no
+    longer matches the mesh is rebuilt on the next lookup. Lookups compare
+    element counts only; the full signature (an edge-list hash, O(edges)) is
+    checked once after each geometry update of the mesh. Misses first try the
+    map stored on the mesh, and new maps are stored when the preference is on.
+
+    A KD-tree of the vertex positions is kept per mesh as well. It does not
+    depend on the plane, so lookups across a new plane only pay for the
+    queries; it is dropped when the mesh geometry is updated.
+    """
+
+    def __init__(self, planes_per_mesh=4):
+        self.planes_per_mesh = planes_per_mesh
+        self._maps = {}
+        self._trees = {}
+        self._touched = set()
+
+    def _verify(self, me, bm):
+        """Drop the maps of ``me`` whose full signature went stale, if its
+        geometry was updated since the last check."""
+        uid = me.session_uid
+        if uid not in self._touched:
+            return
+        self._touched.discard(uid)
+        maps = self._maps.get(uid)
+        if maps:
+            signature = bmesh_signature(bm)
+            for key in [key for key, smap in maps.items() if smap.signature != signature]:
+                del maps[key]
+
+    def tree(self, me, bm):
+        """Cached KD-tree over the vertex positions of ``me``."""
+        counts = bmesh_counts(bm)
+        entry = self._trees.get(me.session_uid)
+        if entry is not None and entry[0] == counts:
+            return entry[1]
+        tree = build_kdtree(vert_coords(bm.verts[:]))
+        self._trees[me.session_uid] = (counts, tree)
+        return tree
+
+    def peek(self, me, bm, plane_co, plane_no, tol):
+        """Cached pair map if one is still valid, without building it."""
+        self._verify(me, bm)
+        smap = self._maps.get(me.session_uid, {}).get(_plane_key(plane_co, plane_no, tol))
+        if smap is not None and smap.signature[:3] == bmesh_counts(bm):
+            return smap
+        return None
+
+    def get(self, me, bm, plane_co, plane_no, tol, topology=True):
+        """Cached pair map for ``me`` (edited through ``bm``)."""
+        self._verify(me, bm)
+        maps = self._maps.setdefault(me.session_uid, {})
+        key = _plane_key(plane_co, plane_no, tol)
+
+        smap = maps.get(key)
+        if smap is not None and smap.signature[:3] == bmesh_counts(bm):
+            return smap
+
+        edges = bmesh_edges(bm)
+        signature = bmesh_signature(bm, edges)
+        smap = load_pair_map(me, bm, plane_co, plane_no, tol, edges)
+        if smap is None:
+            match_edges = edges if topology else np.zeros((0, 2), dtype=np.int64)
+            # Build with a fresh tree (positions may have changed since the
+            # last depsgraph update) and keep it for plane-free lookups.
+            co = vert_coords(bm.verts[:])
+            tree = build_kdtree(co)
+            self._trees[me.session_uid] = (signature[:3], tree)
+            smap = build_pair_map(
+                co, match_edges, plane_co, plane_no, tol, signature, topology, tree
+            )
+            if addon.pref().tools.mesh.store_symmetry:
+                store_pair_map(me, bm, smap, edges)
+        maps.pop(key, None)
+        maps[key] = smap
+        while len(maps) > self.planes_per_mesh:
+            maps.pop(next(iter(maps)))
+        return smap
+
+    def invalidate(self, me=None):
+        """Drop the maps of ``me``, or of every mesh."""
+        if me is None:
+            self._maps.clear()
+            self._trees.clear()
+            self._touched.clear()
+        else:
+            self._maps.pop(me.session_uid, None)
+            self._trees.pop(me.session_uid, None)
+            self._touched.discard(me.session_uid)
+
+    def on_depsgraph_update(self, scene, depsgraph):
+        if not self._trees and not self._maps:
+            return
+        for update in depsgraph.updates:
+            if update.is_updated_geometry and isinstance(update.id, bpy.types.Mesh):
+                uid = update.id.original.session_uid
+                self._trees.pop(uid, None)
+                if uid in self._maps:
+                    self._touched.add(uid)
+
+
+symmetry_cache = SymmetryCache()
+handlers.subscribe_depsgraph(symmetry_cache.on_depsgraph_update)
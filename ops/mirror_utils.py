@@ -1,7 +1,11 @@
 import bpy
 import bmesh
-from mathutils import Euler, Matrix, Vector
+import numpy as np
+from mathutils import Matrix, Vector
 from ..utils import addon
+from ..utils.mesh_data import reverse_winding
+from .mirror_flipped import flipped_meshes, source_checksum
+from .mirror_plane import PlaneResolver, cursor_rotation, world_location, world_rotation
 
 
 # Mirror axis state transition table
@@ -37,10 +41,10 @@ def get_mirror_object(context, obj, pivot, orientation):
         case ("ACTIVE", "LOCAL"):
             mirror_object = obj
         case ("ACTIVE", "GLOBAL"):
-            mirror_object = create_empty_mirror_object(context, obj.location)
+            mirror_object = create_empty_mirror_object(context, world_location(obj))
         case ("ACTIVE", "CURSOR"):
             mirror_object = create_empty_mirror_object(
-                context, obj.location, orientation=context.scene.cursor.rotation_euler
+                context, world_location(obj), orientation=cursor_rotation(context).to_euler()
             )
         case ("INDIVIDUAL", "LOCAL"):
             mirror_object = None
@@ -50,7 +54,7 @@ def get_mirror_object(context, obj, pivot, orientation):
             individual = True
         case ("WORLD", "LOCAL"):
             mirror_object = create_empty_mirror_object(
-                context, (0.0, 0.0, 0.0), orientation=obj.rotation_euler
+                context, (0.0, 0.0, 0.0), orientation=world_rotation(obj).to_euler()
             )
         case ("WORLD", "GLOBAL"):
             mirror_object = create_empty_mirror_object(context, (0.0, 0.0, 0.0))
@@ -58,11 +62,11 @@ def get_mirror_object(context, obj, pivot, orientation):
             mirror_object = create_empty_mirror_object(
                 context,
                 (0.0, 0.0, 0.0),
-                orientation=context.scene.cursor.rotation_euler,
+                orientation=cursor_rotation(context).to_euler(),
             )
         case ("CURSOR", "LOCAL"):
             mirror_object = create_empty_mirror_object(
-                context, context.scene.cursor.location, orientation=obj.rotation_euler
+                context, context.scene.cursor.location, orientation=world_rotation(obj).to_euler()
             )
         case ("CURSOR", "GLOBAL"):
             mirror_object = create_empty_mirror_object(
@@ -72,15 +76,15 @@ def get_mirror_object(context, obj, pivot, orientation):
             mirror_object = create_empty_mirror_object(
                 context,
                 context.scene.cursor.location,
-                orientation=context.scene.cursor.rotation_euler,
+                orientation=cursor_rotation(context).to_euler(),
             )
         case ("CUSTOM", orient):
             pref = addon.pref().tools.mirror
             loc = Vector(pref.custom_location)
             if orient == "LOCAL":
-                rot = obj.rotation_euler
+                rot = world_rotation(obj).to_euler()
             elif orient == "CURSOR":
-                rot = context.scene.cursor.rotation_euler
+                rot = cursor_rotation(context).to_euler()
             elif orient == "CUSTOM":
                 rot = pref.custom_rotation
             else:  # GLOBAL
@@ -93,7 +97,7 @@ def get_mirror_object(context, obj, pivot, orientation):
             elif piv == "CURSOR":
                 loc = context.scene.cursor.location.copy()
             else:  # ACTIVE or INDIVIDUAL -> object origin
-                loc = obj.location.copy()
+                loc = world_location(obj)
             mirror_object = create_empty_mirror_object(
                 context, loc, orientation=pref.custom_rotation
             )
@@ -101,8 +105,42 @@ def get_mirror_object(context, obj, pivot, orientation):
     return mirror_object, individual
 
 
-def create_mirror_modifier(context, obj, mirror_object, individual, axis_idx, is_neg):
-    """Create a mirror modifier for the given object"""
+# Mirror modifier properties the tool preferences can set on new modifiers,
+# each one only when its ``apply_<name>`` toggle is on.
+MODIFIER_PREF_PROPS = (
+    # Clipping & Merge
+    "use_clip",
+    "use_mirror_merge",
+    "merge_threshold",
+    "bisect_threshold",
+    # UV Settings
+    "use_mirror_u",
+    "use_mirror_v",
+    "mirror_offset_u",
+    "mirror_offset_v",
+    "offset_u",
+    "offset_v",
+    # Other Settings
+    "use_mirror_vertex_groups",
+    "use_mirror_udim",
+)
+
+
+def modifier_template():
+    """The ``(name, value)`` pairs new mirror modifiers get from the tool
+    preferences. Read it once per operator run and pass it along."""
+    pref = addon.pref().tools.mirror
+    return tuple(
+        (name, getattr(pref, name))
+        for name in MODIFIER_PREF_PROPS
+        if getattr(pref, "apply_" + name)
+    )
+
+
+def create_mirror_modifier(
+    context, obj, mirror_object, individual, axis_idx, is_neg, template=None, pin=False
+):
+    """Create a mirror modifier for the given object and return it"""
 
     _mirror_object = mirror_object
 
@@ -110,12 +148,13 @@ def create_mirror_modifier(context, obj, mirror_object, individual, axis_idx, is
         _mirror_object = None
 
     if individual:
-        _mirror_object = create_empty_mirror_object(context, obj.location)
+        _mirror_object = create_empty_mirror_object(context, world_location(obj))
 
     mirror_mod = obj.modifiers.new(name="Mirror", type="MIRROR")
-    mirror_mod.use_axis = [False, False, False]
 
-    mirror_mod.use_axis[axis_idx] = True
+    use_axis = [False, False, False]
+    use_axis[axis_idx] = True
+    mirror_mod.use_axis = use_axis
     mirror_mod.use_bisect_flip_axis[axis_idx] = is_neg
     mirror_mod.use_bisect_axis[axis_idx] = True
 
@@ -123,67 +162,35 @@ def create_mirror_modifier(context, obj, mirror_object, individual, axis_idx, is
     mirror_mod.show_expanded = False
 
     # Apply enabled properties from tool preferences
-    pref = addon.pref().tools.mirror
-
-    # Clipping & Merge
-    if pref.apply_use_clip:
-        mirror_mod.use_clip = pref.use_clip
-
-    if pref.apply_use_mirror_merge:
-        mirror_mod.use_mirror_merge = pref.use_mirror_merge
-
-    if pref.apply_merge_threshold:
-        mirror_mod.merge_threshold = pref.merge_threshold
+    if template is None:
+        template = modifier_template()
+    for name, value in template:
+        setattr(mirror_mod, name, value)
 
-    if pref.apply_bisect_threshold:
-        mirror_mod.bisect_threshold = pref.bisect_threshold
+    if pin:
+        mirror_mod.use_pin_to_last = True
 
-    # UV Settings
-    if pref.apply_use_mirror_u:
-        mirror_mod.use_mirror_u = pref.use_mirror_u
-
-    if pref.apply_use_mirror_v:
-        mirror_mod.use_mirror_v = pref.use_mirror_v
-
-    if pref.apply_mirror_offset_u:
-        mirror_mod.mirror_offset_u = pref.mirror_offset_u
-
-    if pref.apply_mirror_offset_v:
-        mirror_mod.mirror_offset_v = pref.mirror_offset_v
-
-    if pref.apply_offset_u:
-        mirror_mod.offset_u = pref.offset_u
-
-    if pref.apply_offset_v:
-        mirror_mod.offset_v = pref.offset_v
-
-    # Other Settings
-    if pref.apply_use_mirror_vertex_groups:
-        mirror_mod.use_mirror_vertex_groups = pref.use_mirror_vertex_groups
-
-    if pref.apply_use_mirror_udim:
-        mirror_mod.use_mirror_udim = pref.use_mirror_udim
+    return mirror_mod
 
 
 def create_empty_mirror_object(context, location, orientation=(0.0, 0.0, 0.0)):
-    """Create an empty object at the given location and orientation for use as mirror_object"""
+    """Return an empty at the given location and orientation for use as
+    mirror_object, reusing a matching one from the pivot pool"""
+    # Local import to avoid a circular import
+    from .mirror_pivots import pivot_pool
 
-    pref = addon.pref().tools.mirror
+    return pivot_pool.acquire(context, location, orientation)
 
-    empty = bpy.data.objects.new("RotorMirrorPivot", None)
-    empty.empty_display_type = pref.empty_display_type
-    empty.empty_display_size = pref.empty_display_size
-    empty.location = location
-    empty.rotation_euler = orientation
-    context.collection.objects.link(empty)
-    return empty
 
+def bisect_plane_local(obj, plane):
+    """Return the bisect ``plane`` (a ``MirrorPlane``) in the object's local
+    space as ``(co, no)``.
 
-def bisect_object(obj, axis_idx, pivot, orientation, context, is_neg=False):
-    """Bisect a single object using bmesh.ops.bisect_plane without changing modes"""
+    Returns ``None`` for objects that are never bisected (non-mesh, chisel).
+    """
 
     if obj.type != "MESH":
-        return
+        return None
 
     # Never bisect a chisel object's SDF base mesh — chisel mirror inherently
     # bisects, and the base mesh is shared by chisel instances.
@@ -191,169 +198,160 @@ def bisect_object(obj, axis_idx, pivot, orientation, context, is_neg=False):
     from .mirror_chisel import is_chisel_object
 
     if is_chisel_object(obj):
-        return
+        return None
 
-    # Get the bisect plane normal vector
-    normal = Vector((0, 0, 0))
-    normal[axis_idx] = -1.0 if is_neg else 1.0
-
-    # Get the pivot point
-    if pivot == "WORLD":
-        pivot_point = Vector((0, 0, 0))
-    elif pivot == "ACTIVE" and context.active_object:
-        pivot_point = context.active_object.location.copy()
-    elif pivot == "INDIVIDUAL":
-        pivot_point = obj.location.copy()
-    elif pivot == "CURSOR":
-        pivot_point = context.scene.cursor.location.copy()
-    elif pivot == "CUSTOM":
-        pivot_point = Vector(addon.pref().tools.mirror.custom_location)
-    else:
-        pivot_point = Vector((0, 0, 0))
-
-    # Transform normal based on orientation
-    obj_normal = normal.copy()
-    if orientation == "LOCAL":
-        if pivot == "ACTIVE" and context.active_object:
-            # Use active object's rotation to transform the normal
-            rot_mat = context.active_object.rotation_euler.to_matrix()
-            obj_normal = rot_mat @ obj_normal
-        elif pivot == "INDIVIDUAL":
-            # Use this object's rotation to transform the normal
-            rot_mat = obj.rotation_euler.to_matrix()
-            obj_normal = rot_mat @ obj_normal
-        elif pivot == "WORLD":
-            # When pivot is WORLD and orientation is LOCAL, use object's rotation
-            rot_mat = obj.rotation_euler.to_matrix()
-            obj_normal = rot_mat @ obj_normal
-        elif pivot == "CURSOR":
-            # When pivot is CURSOR and orientation is LOCAL, use object's rotation
-            rot_mat = obj.rotation_euler.to_matrix()
-            obj_normal = rot_mat @ obj_normal
-    elif orientation == "CURSOR":
-        # Use cursor's rotation to transform the normal regardless of pivot
-        rot_mat = context.scene.cursor.rotation_euler.to_matrix()
-        obj_normal = rot_mat @ obj_normal
-    elif orientation == "CUSTOM":
-        # Use the custom orientation to transform the normal regardless of pivot
-        rot_mat = Euler(addon.pref().tools.mirror.custom_rotation, "XYZ").to_matrix()
-        obj_normal = rot_mat @ obj_normal
-
-    # Create new bmesh from mesh
-    bm = bmesh.new()
-    bm.from_mesh(obj.data)
+    return plane.local(obj)
 
-    # Transform pivot point to object's local space
-    world_to_local = obj.matrix_world.inverted()
-    local_pivot = world_to_local @ pivot_point
 
-    # Transform normal to object's local space
-    local_normal = world_to_local.to_3x3() @ obj_normal
-    local_normal.normalize()
+def bisect_mesh(me, plane_co, plane_no):
+    """Clear the geometry of ``me`` behind the plane through a BMesh round-trip"""
+    bm = bmesh.new()
+    bm.from_mesh(me)
 
     # Perform bisect operation
     bmesh.ops.bisect_plane(
         bm,
         geom=bm.verts[:] + bm.edges[:] + bm.faces[:],
-        plane_co=local_pivot,
-        plane_no=local_normal,
+        plane_co=plane_co,
+        plane_no=plane_no,
         clear_inner=True,
         clear_outer=False,
     )
 
     # Update mesh and free bmesh
-    bm.to_mesh(obj.data)
+    bm.to_mesh(me)
     bm.free()
 
     # Update object
-    obj.data.update()
+    me.update()
+
+
+def bisect_object(obj, axis_idx, pivot, orientation, context, is_neg=False):
+    """Bisect a single object using bmesh.ops.bisect_plane without changing modes"""
+    resolver = PlaneResolver(context, axis_idx, is_neg, pivot, orientation)
+    plane = bisect_plane_local(obj, resolver(obj))
+    if plane is not None:
+        bisect_mesh(obj.data, *plane)
 
 
-def compute_mirror_xform(context, obj, axis_idx):
+def compute_mirror_xform(context, obj, axis_idx, resolver=None):
     """Return the 4x4 mirror transform (T @ R @ S @ R_inv @ T_inv) for the
     current pivot/orientation preferences. Shared by the mesh and chisel
-    real-mirror paths."""
-    pref = addon.pref().tools.mirror
-    pivot = pref.pivot
-    orientation = pref.orientation
+    real-mirror paths; pass a ``PlaneResolver`` to reuse it across objects."""
+    if resolver is None:
+        resolver = PlaneResolver(context, axis_idx)
+    return resolver(obj).xform.copy()
+
+
+def mirror_xforms(context, objects, axis_idx, resolver=None):
+    """``compute_mirror_xform`` for many objects, as an (N, 4, 4) array."""
+    if resolver is None:
+        resolver = PlaneResolver(context, axis_idx)
+    if not resolver.per_object:
+        xform = np.array(resolver(objects[0]).xform, dtype=np.float64)
+        return np.broadcast_to(xform, (len(objects), 4, 4))
+    return np.array([resolver(obj).xform for obj in objects], dtype=np.float64)
+
+
+def _hierarchy_depth(obj):
+    depth = 0
+    while obj.parent is not None:
+        obj = obj.parent
+        depth += 1
+    return depth
+
+
+def place_mirrors(context, pairs, axis_idx, baked=()):
+    """Give each ``(source, copy)`` pair its mirrored world transform.
+
+    All matrices come from one batched product. Copies are placed parents
+    first, so each world matrix is set against its parent copy's new one; a
+    copy whose source parent was mirrored too is parented to that parent's
+    copy. Copies of ``baked`` sources get the local axis flip appended (see
+    ``mirror_bake``).
+    """
+    if not pairs:
+        return
+    pairs = sorted(pairs, key=lambda pair: _hierarchy_depth(pair[0]))
+    objects = [obj for obj, _new_obj in pairs]
+    index = {obj: i for i, obj in enumerate(objects)}
 
-    # 1. Build scale matrix with -1 on mirror axis
-    scale_vec = [1.0, 1.0, 1.0]
-    scale_vec[axis_idx] = -1.0
-    mirror_mat = (
-        Matrix.Scale(scale_vec[0], 4, Vector((1, 0, 0)))
-        @ Matrix.Scale(scale_vec[1], 4, Vector((0, 1, 0)))
-        @ Matrix.Scale(scale_vec[2], 4, Vector((0, 0, 1)))
-    )
+    flip = np.identity(4)
+    flip[axis_idx, axis_idx] = -1.0
+    flips = np.array([flip if obj in baked else np.identity(4) for obj in objects])
+
+    xforms = mirror_xforms(context, objects, axis_idx)
+    world = np.array([obj.matrix_world for obj in objects], dtype=np.float64)
+    matrices = xforms @ world @ flips
 
-    # 2. Compute pivot point
-    if pivot == "WORLD":
-        pivot_point = Vector((0, 0, 0))
-    elif pivot == "ACTIVE" and context.active_object:
-        pivot_point = context.active_object.location.copy()
-    elif pivot == "INDIVIDUAL":
-        pivot_point = obj.location.copy()
-    elif pivot == "CURSOR":
-        pivot_point = context.scene.cursor.location.copy()
-    elif pivot == "CUSTOM":
-        pivot_point = Vector(addon.pref().tools.mirror.custom_location)
-    else:
-        pivot_point = Vector((0, 0, 0))
-
-    # 3. Compute rotation from orientation
-    rot_mat = None
-    if orientation == "LOCAL":
-        if pivot == "ACTIVE" and context.active_object:
-            rot_mat = context.active_object.rotation_euler.to_matrix().to_4x4()
-        elif pivot == "INDIVIDUAL":
-            rot_mat = obj.rotation_euler.to_matrix().to_4x4()
-        elif pivot in ("WORLD", "CURSOR", "CUSTOM"):
-            rot_mat = obj.rotation_euler.to_matrix().to_4x4()
-    elif orientation == "CURSOR":
-        rot_mat = context.scene.cursor.rotation_euler.to_matrix().to_4x4()
-    elif orientation == "CUSTOM":
-        rot_mat = Euler(addon.pref().tools.mirror.custom_rotation, "XYZ").to_matrix().to_4x4()
-
-    # 4. Compose mirror_xform = T @ R @ S @ R_inv @ T_inv
-    T = Matrix.Translation(pivot_point)
-    T_inv = Matrix.Translation(-pivot_point)
-    S = mirror_mat
-    if rot_mat is not None:
-        R = rot_mat
-        R_inv = rot_mat.inverted()
-        mirror_xform = T @ R @ S @ R_inv @ T_inv
-    else:
-        mirror_xform = T @ S @ T_inv
-
-    return mirror_xform
-
-
-def create_real_mirror(context, obj, axis_idx, is_neg):
+    for i, (obj, new_obj) in enumerate(pairs):
+        parent = index.get(obj.parent)
+        if parent is not None:
+            new_obj.parent = pairs[parent][1]
+        new_obj.matrix_world = Matrix(matrices[i].tolist())
+
+
+def reverse_faces(me):
+    """Reverse the winding of every face of ``me``."""
+    # Array path; BMesh only for corner layers it can't carry
+    if reverse_winding(me):
+        return
+    bm = bmesh.new()
+    bm.from_mesh(me)
+    bmesh.ops.reverse_faces(bm, faces=bm.faces[:])
+    bm.to_mesh(me)
+    bm.free()
+    me.update()
+
+
+def create_real_mirror(
+    context, obj, axis_idx, is_neg, flipped=None, linked=False, place=True
+):
     """Duplicate object + mesh and flip across the mirror axis.
 
-    Returns the new object or None if the object type is unsupported.
+    ``flipped`` maps source data to its flipped copy; objects sharing data
+    within one run share a single copy. Flipped meshes are also reused across
+    runs while the source geometry is unchanged (``flipped_meshes``). With
+    ``linked`` the duplicate keeps the original data and only the transform is
+    mirrored. With ``place`` False the transform is left to the caller
+    (``place_mirrors``). Returns the new object or None if the object type is
+    unsupported.
     """
+    if flipped is None:
+        flipped = {}
+
     # 1. Duplicate object and mesh data
-    new_obj = obj.copy()
-    if obj.data:
-        new_obj.data = obj.data.copy()
+    new_obj = obj.copy()  # shares obj.data until replaced below
+    shared = linked
+    checksum = None
+    if obj.data and not linked:
+        if obj.data not in flipped and obj.type == "MESH":
+            checksum = source_checksum(obj)
+            if checksum is not None:
+                cached = flipped_meshes.find(obj.data, checksum)
+                if cached is not None:
+                    flipped[obj.data] = cached
+        shared = obj.data in flipped
+        if shared:
+            new_obj.data = flipped[obj.data]
+        else:
+            new_obj.data = obj.data.copy()
+            flipped[obj.data] = new_obj.data
 
     # Link to same collections
     for col in obj.users_collection:
         col.objects.link(new_obj)
 
     # 2. Apply transform
-    mirror_xform = compute_mirror_xform(context, obj, axis_idx)
-    new_obj.matrix_world = mirror_xform @ obj.matrix_world
+    if place:
+        mirror_xform = compute_mirror_xform(context, obj, axis_idx)
+        new_obj.matrix_world = mirror_xform @ obj.matrix_world
 
     # 3. Fix normals — negative scale inverts face winding
-    if new_obj.type == "MESH" and new_obj.data:
-        bm = bmesh.new()
-        bm.from_mesh(new_obj.data)
-        bmesh.ops.reverse_faces(bm, faces=bm.faces[:])
-        bm.to_mesh(new_obj.data)
-        bm.free()
-        new_obj.data.update()
+    if new_obj.type == "MESH" and new_obj.data and not shared:
+        reverse_faces(new_obj.data)
+        if checksum is not None:
+            flipped_meshes.store(obj.data, checksum, new_obj.data)
 
     return new_obj
 
@@ -364,14 +362,28 @@ def execute_real_mirror(operator, context, axis_idx, is_neg, enabled_objects):
     Handles bisect, loop over objects, selection update, and report.
     Returns {'FINISHED'} or {'CANCELLED'}.
     """
-    # Local import to avoid a circular import (mirror_chisel imports from here)
+    # Local imports to avoid circular imports (both modules import from here)
+    from .mirror_bake import bakeable, create_baked_mirrors
+    from .mirror_bisect import bisect_objects, report_cleared
     from .mirror_chisel import is_chisel_object, create_chisel_real_mirror
 
     pref = addon.pref().tools.mirror
     pivot = pref.pivot
     orientation = pref.orientation
 
+    # Bisect before copying the mesh data (chisel objects are skipped)
+    cleared = []
+    if pref.bisect:
+        cleared = bisect_objects(
+            context, enabled_objects, axis_idx, pivot, orientation, is_neg
+        )
+
     new_objects = []
+    placed = []
+    flipped = {}
+    flipped_meshes.prune()
+    to_bake = []
+    unbaked = 0
     for obj in enabled_objects:
         # Chisel objects: shared-data duplicate, never bisect the SDF base mesh
         if is_chisel_object(obj):
@@ -380,12 +392,24 @@ def execute_real_mirror(operator, context, axis_idx, is_neg, enabled_objects):
                 new_objects.append(new_obj)
             continue
 
-        if pref.bisect:
-            bisect_object(obj, axis_idx, pivot, orientation, context, is_neg)
+        if pref.real_bake and obj.type == "MESH":
+            if bakeable(obj):
+                to_bake.append(obj)
+                continue
+            # Modifiers depending on local axes: keep the negative scale
+            unbaked += 1
 
-        new_obj = create_real_mirror(context, obj, axis_idx, is_neg)
+        new_obj = create_real_mirror(
+            context, obj, axis_idx, is_neg, flipped, pref.real_linked, place=False
+        )
         if new_obj:
-            new_objects.append(new_obj)
+            placed.append((obj, new_obj))
+
+    baked = create_baked_mirrors(to_bake, axis_idx)
+    placed.extend(baked)
+    # All world matrices in one batch, parents before children
+    place_mirrors(context, placed, axis_idx, baked={obj for obj, _new_obj in baked})
+    new_objects.extend(new_obj for _obj, new_obj in placed)
 
     if not new_objects:
         operator.report({"WARNING"}, "No objects were mirrored.")
@@ -399,6 +423,12 @@ def execute_real_mirror(operator, context, axis_idx, is_neg, enabled_objects):
     context.view_layer.objects.active = new_objects[0]
 
     operator.report({"INFO"}, f"Created {len(new_objects)} mirrored copies.")
+    if unbaked:
+        operator.report(
+            {"WARNING"},
+            f"{unbaked} objects have modifiers that depend on local axes and were mirrored without baking.",
+        )
+    report_cleared(operator, cleared)
 
     # Tool fallback
     last_tool = context.scene.rotor.ops.last_tool
@@ -3,6 +3,8 @@ from bpy.utils import register_class, register_tool, unregister_class, unregiste
 
 from . import btypes, gizmos, keymap, ops, preferences, tools
 from .icons import load_icons, unload_icons
+from .shaders import handle
+from .utils import handlers
 
 classes = (
     *btypes.classes,
@@ -44,9 +46,13 @@ def register():
 
     btypes.register()
     keymap.register()
+    handlers.register()
 
 
 def unregister():
+    handlers.unregister()
+    gizmos.mirror.gizmo_state.unsubscribe()
+    handle.Common().clear_all()
     keymap.unregister()
 
     unregister_tool(tools.mirror.ROTOR_MT_MirrorMesh)
@@ -265,3 +265,43 @@ class PlanePreviewDraw(DrawBase):
         gpu.state.blend_set("ALPHA")
 
 
+class PointsDraw(DrawBase):
+    """Draws highlighted vertices of one edit-mode object as screen-sized points."""
+
+    COLOR_POINTS = (1.0, 0.35, 0.1, 1.0)
+
+    def __init__(self):
+        self.shader = gpu.shader.from_builtin("UNIFORM_COLOR")
+        self.batch = None
+        self.size = 6.0
+        self.object_name = ""
+
+    def is_valid(self):
+        return self.batch is not None
+
+    def create_batch(self):
+        return self.batch
+
+    def clear(self):
+        self.batch = None
+
+    def update(self, object_name, points):
+        """Rebuild the batch from world-space ``points`` (sequence or (N, 3) array)."""
+        self.object_name = object_name
+        if not len(points):
+            self.batch = None
+            return
+        self.batch = batch_for_shader(self.shader, "POINTS", {"pos": points})
+
+    def draw(self, context):
+        obj = context.edit_object
+        if obj is None or obj.name != self.object_name:
+            return
+        super().draw(context)
+
+    def setup_draw_state(self, context):
+        gpu.state.depth_test_set("NONE")
+        gpu.state.point_size_set(self.size)
+        self.shader.bind()
+        self.shader.uniform_float("color", self.COLOR_POINTS)
+        gpu.state.blend_set("ALPHA")
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 import bpy
-from .draw import GhostDraw, GuideDraw, PlanePreviewDraw
+from .draw import GhostDraw, GuideDraw, PlanePreviewDraw, PointsDraw
 
 
 draw_handlers = []
@@ -67,6 +67,21 @@ class PlanePreview(Handle):
         draw_handlers.append(self.handle)
 
 
+@dataclass
+class Points(Handle):
+    """Dataclass for the highlighted-points draw handler."""
+
+    callback: PointsDraw | None = None
+
+    def create(self, context):
+        """Create a points draw handler."""
+        self.callback = PointsDraw()
+        self.handle = bpy.types.SpaceView3D.draw_handler_add(
+            self.callback.draw, (context,), "WINDOW", "POST_VIEW"
+        )
+        draw_handlers.append(self.handle)
+
+
 @dataclass
 class Common:
     """Common functions for the handle data."""
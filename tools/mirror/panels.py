@@ -1,7 +1,13 @@
+import math
+
 import bpy
 
+from ...ops.mirror_index import mirror_index
 from ...utils import addon
 
+# Rows per page of the mirror index listing
+INDEX_PAGE_SIZE = 30
+
 
 class ROTOR_PT_Element(bpy.types.Panel):
     bl_label = "Element"
@@ -105,6 +111,18 @@ class ROTOR_PT_ToolOptions(bpy.types.Panel):
         col.separator()
         col.prop(rotor, "empty_display_type", text="Empty Shape")
         col.prop(rotor, "empty_display_size", text="Empty Size")
+        col.operator("mirror.purge_pivots", icon="TRASH")
+
+        col.separator()
+        col.prop(rotor, "bisect_engine")
+
+        col.separator()
+        col = col.column(align=True)
+        col.active = rotor.real
+        col.prop(rotor, "real_bake")
+        row = col.row(align=True)
+        row.active = not rotor.real_bake
+        row.prop(rotor, "real_linked")
 
 
 class ROTOR_PT_MirrorOptions(bpy.types.Panel):
@@ -293,6 +311,82 @@ class ROTOR_PT_MeshOptions(bpy.types.Panel):
         row.enabled = mesh.merge
         row.prop(mesh, "merge_threshold")
 
+        col.separator()
+        col.prop(mesh, "engine")
+        col.prop(mesh, "use_roi")
+        col.prop(mesh, "store_symmetry")
+
+        col.separator()
+        row = col.row(align=True)
+        row.label(text="Multi-Axis")
+        for axes in ("XY", "XZ", "YZ", "XYZ"):
+            op = row.operator("mirror.mirror_mesh", text=axes)
+            op.axes = set(axes)
+            op.target = "MESH"
+
+        row = col.row(align=True)
+        row.label(text="Select Mirror")
+        for axis in ("X", "Y", "Z"):
+            row.operator("mirror.select_mirror", text=axis).axis = axis
+
+        row = col.row(align=True)
+        row.label(text="Symmetry")
+        row.operator("mirror.check_symmetry", text="Check").mode = "CHECK"
+        row.operator("mirror.check_symmetry", text="Repair").mode = "REPAIR"
+        row.operator("mirror.check_symmetry", text="", icon="X").mode = "CLEAR"
+
+
+class ROTOR_PT_MirrorIndex(bpy.types.Panel):
+    bl_label = "Mirrors"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Rotor"
+    bl_description = "Every mirror in the file"
+    bl_context = "objectmode"
+
+    def draw(self, context):
+        layout = self.layout
+        state = context.scene.rotor.ops
+
+        layout.prop(state, "mirror_filter", text="", icon="VIEWZOOM")
+
+        total = len(mirror_index.rows(state.mirror_filter))
+        pages = max(1, math.ceil(total / INDEX_PAGE_SIZE))
+        start = (min(state.mirror_page, pages) - 1) * INDEX_PAGE_SIZE
+        total, rows = mirror_index.page(
+            state.mirror_filter, start, start + INDEX_PAGE_SIZE
+        )
+
+        row = layout.row()
+        row.label(text=f"{total} Objects")
+        if pages > 1:
+            row.prop(state, "mirror_page", text="")
+            row.label(text=f"/ {pages}")
+
+        col = layout.column(align=True)
+        for name, entries in rows:
+            row = col.row(align=True)
+            pinned = any(entry.pinned for entry in entries)
+            op = row.operator(
+                "mirror.select_mirror_object",
+                text=name,
+                icon="PINNED" if pinned else "MOD_MIRROR",
+                emboss=False,
+            )
+            op.name = name
+            row.label(text=", ".join(entry.label for entry in entries))
+
+        active = context.active_object
+        if active is not None and active.type == "EMPTY":
+            users = mirror_index.users(active)
+            if users:
+                layout.separator()
+                layout.operator(
+                    "mirror.select_mirror_object",
+                    text=f"Select {len(users)} Mirrored Around {active.name}",
+                    icon="RESTRICT_SELECT_OFF",
+                )
+
 
 classes = (
     ROTOR_PT_Element,
@@ -304,4 +398,5 @@ classes = (
     ROTOR_PT_MeshOrientation,
     ROTOR_PT_MeshPivot,
     ROTOR_PT_MeshOptions,
+    ROTOR_PT_MirrorIndex,
 )
@@ -51,6 +51,13 @@ mesh_orientations = [
 ]
 
 
+mesh_modes = [
+    ("SYMMETRIZE", "Symmetrize", "Bisect, mirror the kept side and weld the seam"),
+    ("FLIP_COPY", "Flip Copy", "Add a reflected copy, without bisecting or welding"),
+    ("FLIP", "Flip", "Reflect the geometry in place"),
+]
+
+
 mesh_pivots = [
     ("ACTIVE", "Active Element", "Mirror across the active element", "PIVOT_ACTIVE", 1),
     ("MEDIAN", "Median Point", "Mirror across the selection median", "PIVOT_MEDIAN", 2),
@@ -109,12 +116,45 @@ class Mirror(bpy.types.PropertyGroup):
         default=False,
     )
 
+    real_linked: bpy.props.BoolProperty(
+        name="Linked Data",
+        description=(
+            "Real mirrors share the mesh data of the original and rely on the "
+            "mirrored transform, instead of copying and flipping the mesh"
+        ),
+        default=False,
+    )
+
+    real_bake: bpy.props.BoolProperty(
+        name="Bake Into Data",
+        description=(
+            "Real mirrors get mirrored mesh data and a positive transform "
+            "instead of a negative scale"
+        ),
+        default=False,
+    )
+
     bisect: bpy.props.BoolProperty(
         name="Bisect",
         description="Bisect the object using specified axis",
         default=False,
     )
 
+    bisect_engine: bpy.props.EnumProperty(
+        name="Bisect Engine",
+        description="Implementation used to bisect objects",
+        items=[
+            ("BMESH", "BMesh", "Bisect each object through a BMesh round-trip"),
+            (
+                "NUMPY",
+                "NumPy",
+                "Clip mesh arrays with NumPy on a thread pool; falls back to BMesh for "
+                "meshes with shape keys, vertex groups, custom normals or edge data",
+            ),
+        ],
+        default="NUMPY",
+    )
+
     tool_fallback: bpy.props.BoolProperty(
         name="Tool Fallback",
         description="Return to previous tool after mirror operation",
@@ -362,6 +402,41 @@ class MirrorMesh(bpy.types.PropertyGroup):
         unit="LENGTH",
     )
 
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        description="How the Mirror Mesh tool mirrors geometry",
+        items=mesh_modes,
+        default="SYMMETRIZE",
+    )
+
+    engine: bpy.props.EnumProperty(
+        name="Engine",
+        description="Implementation used for the per-vertex symmetrize stages",
+        items=[
+            ("PYTHON", "Python", "Classify, reflect and weld one vertex at a time"),
+            ("NUMPY", "NumPy", "Classify, reflect and weld as array operations"),
+        ],
+        default="NUMPY",
+    )
+
+    use_roi: bpy.props.BoolProperty(
+        name="Region of Interest",
+        description=(
+            "When mirroring the full mesh, only bisect, update and weld the geometry "
+            "near or behind the plane"
+        ),
+        default=True,
+    )
+
+    store_symmetry: bpy.props.BoolProperty(
+        name="Store Symmetry Map",
+        description=(
+            "Save vertex counterparts and their plane on the mesh, so they are reused "
+            "after reopening the file instead of being rebuilt"
+        ),
+        default=False,
+    )
+
     tool_fallback: bpy.props.BoolProperty(
         name="Tool Fallback",
         description="Return to previous tool after the mirror operation",
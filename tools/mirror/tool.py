@@ -3,6 +3,7 @@ from pathlib import Path
 import bpy
 
 from ...utils import addon
+from ...ops.mirror_live import live_symmetry
 
 
 class ROTOR_MT_Mirror(bpy.types.WorkSpaceTool):
@@ -98,6 +99,7 @@ class ROTOR_MT_MirrorMesh(bpy.types.WorkSpaceTool):
         "\n • SPACE - Pick custom plane"
         "\n • Q - Cycle orientation"
         "\n • E - Cycle pivot"
+        "\n • SHIFT + CTRL + M - Select mirror"
     )
     bl_widget = "ROTOR_GGT_MirrorMeshGizmoGroup"
     bl_icon = (Path(__file__).parent.parent.parent / "icons" / "mirror").as_posix()
@@ -110,6 +112,7 @@ class ROTOR_MT_MirrorMesh(bpy.types.WorkSpaceTool):
         ),
         ("mirror.set_orientation", {"type": "Q", "value": "PRESS"}, {"properties": [("cycle", True)]}),
         ("mirror.set_pivot", {"type": "E", "value": "PRESS"}, {"properties": [("cycle", True)]}),
+        ("mirror.select_mirror", {"type": "M", "value": "PRESS", "shift": True, "ctrl": True}, None),
     )
 
     def draw_settings(context, layout, tool):
@@ -117,9 +120,19 @@ class ROTOR_MT_MirrorMesh(bpy.types.WorkSpaceTool):
         row = layout.row(align=True)
 
         row.label(text="Mirror:")
-        row.prop(mesh, "merge", text="Merge")
+        row.prop(mesh, "mode", text="")
+        sub = row.row(align=True)
+        sub.enabled = mesh.mode == "SYMMETRIZE"
+        sub.prop(mesh, "merge", text="Merge")
         row.separator()
         row.prop(mesh, "tool_fallback", text="Tool Fallback")
+        row.separator()
+
+        row.label(text="Live:")
+        live = live_symmetry.active and live_symmetry.axis
+        for axis in ("X", "Y", "Z"):
+            op = row.operator("mirror.live_symmetry", text=axis, depress=live == axis)
+            op.axis = axis
 
         row.separator_spacer()
 
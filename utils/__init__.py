@@ -1,2 +1,3 @@
 from . import addon as addon
+from . import handlers as handlers
 from . import infobar as infobar
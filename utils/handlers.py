@@ -0,0 +1,71 @@
+"""Shared application handlers.
+
+A single persistent ``depsgraph_update_post`` handler fans out to the
+subscribed callbacks, so caches that track scene changes don't each register
+their own handler. Callbacks subscribe once at import time and receive
+``(scene, depsgraph)``.
+
+Reset callbacks run after a file load, undo or redo, when cached state may
+describe data that no longer exists; they take no arguments.
+"""
+
+import traceback
+
+import bpy
+from bpy.app.handlers import persistent
+
+depsgraph_callbacks = []
+reset_callbacks = []
+
+
+def subscribe_depsgraph(callback):
+    """Call ``callback(scene, depsgraph)`` after every depsgraph update."""
+    if callback not in depsgraph_callbacks:
+        depsgraph_callbacks.append(callback)
+    return callback
+
+
+def subscribe_reset(callback):
+    """Call ``callback()`` after a file load, undo or redo."""
+    if callback not in reset_callbacks:
+        reset_callbacks.append(callback)
+    return callback
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    for callback in tuple(depsgraph_callbacks):
+        try:
+            callback(scene, depsgraph)
+        except Exception:
+            traceback.print_exc()
+
+
+@persistent
+def _on_reset(*_args):
+    for callback in tuple(reset_callbacks):
+        try:
+            callback()
+        except Exception:
+            traceback.print_exc()
+
+
+def _reset_handlers():
+    app = bpy.app.handlers
+    return (app.load_post, app.undo_post, app.redo_post)
+
+
+def register():
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    for handler_list in _reset_handlers():
+        if _on_reset not in handler_list:
+            handler_list.append(_on_reset)
+
+
+def unregister():
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    for handler_list in _reset_handlers():
+        if _on_reset in handler_list:
+            handler_list.remove(_on_reset)
@@ -0,0 +1,212 @@
+"""Bulk mesh data access through ``foreach_get``/``foreach_set``.
+
+``read_mesh`` pulls the topology and the generic attributes of a ``Mesh`` into
+NumPy arrays; ``write_mesh`` rebuilds the mesh from arrays of the same layout;
+``reverse_winding`` flips the faces of a mesh in place. They must run on the
+main thread; the arrays in between can be processed anywhere.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+# Attribute data type -> (foreach property, dtype, components).
+ATTRIBUTE_TYPES = {
+    "FLOAT": ("value", np.float32, 1),
+    "INT": ("value", np.int32, 1),
+    "INT8": ("value", np.int8, 1),
+    "BOOLEAN": ("value", bool, 1),
+    "FLOAT2": ("vector", np.float32, 2),
+    "INT32_2D": ("value", np.int32, 2),
+    "FLOAT_VECTOR": ("vector", np.float32, 3),
+    "FLOAT_COLOR": ("color", np.float32, 4),
+    "BYTE_COLOR": ("color", np.float32, 4),
+    "QUATERNION": ("value", np.float32, 4),
+    "FLOAT4X4": ("value", np.float32, 16),
+}
+
+# Types that can be blended between two elements.
+INTERPOLATED_TYPES = {"FLOAT", "FLOAT2", "FLOAT_VECTOR", "FLOAT_COLOR", "BYTE_COLOR"}
+
+# Attributes stored in the topology arrays rather than as generic data.
+STRUCTURAL_ATTRIBUTES = {"position", ".edge_verts", ".corner_vert", ".corner_edge"}
+
+
+@dataclass
+class Attribute:
+    name: str
+    domain: str
+    data_type: str
+    data: np.ndarray
+
+    @property
+    def interpolated(self):
+        return self.data_type in INTERPOLATED_TYPES
+
+
+@dataclass
+class MeshArrays:
+    """Topology and generic attributes of a mesh."""
+
+    co: np.ndarray
+    edges: np.ndarray
+    loop_start: np.ndarray
+    loop_total: np.ndarray
+    corner_vert: np.ndarray
+    corner_edge: np.ndarray
+    attributes: list = field(default_factory=list)
+    uv_active: str = ""
+    uv_render: str = ""
+
+
+def _domain_size(me, domain):
+    return {
+        "POINT": len(me.vertices),
+        "EDGE": len(me.edges),
+        "FACE": len(me.polygons),
+        "CORNER": len(me.loops),
+    }[domain]
+
+
+def unsupported_attributes(me, ignore=()):
+    """Names of attributes ``read_mesh`` cannot carry over, except ``ignore``."""
+    names = []
+    for attr in me.attributes:
+        if attr.name in STRUCTURAL_ATTRIBUTES or attr.name in ignore:
+            continue
+        if attr.data_type not in ATTRIBUTE_TYPES or attr.domain not in {
+            "POINT", "EDGE", "FACE", "CORNER"
+        }:
+            names.append(attr.name)
+    return names
+
+
+def _read(collection, prop, dtype, count, width):
+    data = np.empty(count * width, dtype=dtype)
+    if count:
+        collection.foreach_get(prop, data)
+    return data.reshape(count, width) if width > 1 else data
+
+
+def read_mesh(me, skip_domains=(), skip_internal=True):
+    """Read ``me`` into a ``MeshArrays``.
+
+    Attributes in ``skip_domains`` and, with ``skip_internal``, ``.``-prefixed
+    state layers (selection, hiding, UV pins) are left out.
+    """
+    nv, ne, nf, nl = len(me.vertices), len(me.edges), len(me.polygons), len(me.loops)
+    arrays = MeshArrays(
+        co=_read(me.vertices, "co", np.float32, nv, 3),
+        edges=_read(me.edges, "vertices", np.int32, ne, 2),
+        loop_start=_read(me.polygons, "loop_start", np.int32, nf, 1),
+        loop_total=_read(me.polygons, "loop_total", np.int32, nf, 1),
+        corner_vert=_read(me.loops, "vertex_index", np.int32, nl, 1),
+        corner_edge=_read(me.loops, "edge_index", np.int32, nl, 1),
+    )
+
+    for attr in me.attributes:
+        if attr.name in STRUCTURAL_ATTRIBUTES or attr.domain in skip_domains:
+            continue
+        if skip_internal and attr.name.startswith("."):
+            continue
+        spec = ATTRIBUTE_TYPES.get(attr.data_type)
+        if spec is None:
+            continue
+        prop, dtype, width = spec
+        count = _domain_size(me, attr.domain)
+        arrays.attributes.append(
+            Attribute(
+                attr.name, attr.domain, attr.data_type,
+                _read(attr.data, prop, dtype, count, width),
+            )
+        )
+
+    uv_layers = me.uv_layers
+    if uv_layers.active is not None:
+        arrays.uv_active = uv_layers.active.name
+    for uv in uv_layers:
+        if uv.active_render:
+            arrays.uv_render = uv.name
+    return arrays
+
+
+def write_mesh(me, arrays):
+    """Replace the geometry of ``me`` with ``arrays``.
+
+    Edges in ``arrays.edges`` are kept (loose edges); face edges are derived
+    from the polygons.
+    """
+    me.clear_geometry()
+
+    me.vertices.add(len(arrays.co))
+    me.vertices.foreach_set("co", arrays.co.astype(np.float32).ravel())
+    me.edges.add(len(arrays.edges))
+    me.edges.foreach_set("vertices", arrays.edges.astype(np.int32).ravel())
+    me.loops.add(len(arrays.corner_vert))
+    me.loops.foreach_set("vertex_index", arrays.corner_vert.astype(np.int32))
+    me.polygons.add(len(arrays.loop_start))
+    me.polygons.foreach_set("loop_start", arrays.loop_start.astype(np.int32))
+
+    for attr in arrays.attributes:
+        layer = me.attributes.get(attr.name)
+        if layer is None:
+            layer = me.attributes.new(attr.name, attr.data_type, attr.domain)
+        prop, dtype, _width = ATTRIBUTE_TYPES[attr.data_type]
+        layer.data.foreach_set(prop, attr.data.astype(dtype).ravel())
+
+    if arrays.uv_active in me.uv_layers:
+        me.uv_layers.active = me.uv_layers[arrays.uv_active]
+    if arrays.uv_render in me.uv_layers:
+        me.uv_layers[arrays.uv_render].active_render = True
+
+    me.update(calc_edges=True)
+
+
+def winding_order(loop_start, loop_total):
+    """Corner permutations that reverse every face, keeping its first corner.
+
+    Returns ``(vert_order, edge_order)``: corner ``c`` of the reversed face
+    takes its vertex (and corner attributes) from ``vert_order[c]`` and its
+    edge from ``edge_order[c]``. This is the order ``bmesh.ops.reverse_faces``
+    produces.
+    """
+    start = np.repeat(loop_start.astype(np.int64), loop_total)
+    total = np.repeat(loop_total.astype(np.int64), loop_total)
+    k = np.arange(len(start), dtype=np.int64) - start
+    return start + (total - k) % total, start + (total - 1 - k)
+
+
+def reverse_winding(me):
+    """Reverse the winding of every face of ``me`` in place.
+
+    Corner vertices, corner edges and corner attributes are permuted through
+    ``foreach_get``/``foreach_set``; no other data is touched. Returns False
+    without changing anything when a corner attribute can't be read as an
+    array.
+    """
+    corner_attrs = [
+        attr for attr in me.attributes
+        if attr.domain == "CORNER" and attr.name not in STRUCTURAL_ATTRIBUTES
+    ]
+    if any(attr.data_type not in ATTRIBUTE_TYPES for attr in corner_attrs):
+        return False
+
+    nf, nl = len(me.polygons), len(me.loops)
+    if not nf:
+        return True
+    loop_start = _read(me.polygons, "loop_start", np.int32, nf, 1)
+    loop_total = _read(me.polygons, "loop_total", np.int32, nf, 1)
+    vert_order, edge_order = winding_order(loop_start, loop_total)
+
+    corner_vert = _read(me.loops, "vertex_index", np.int32, nl, 1)
+    corner_edge = _read(me.loops, "edge_index", np.int32, nl, 1)
+    me.loops.foreach_set("vertex_index", corner_vert[vert_order])
+    me.loops.foreach_set("edge_index", corner_edge[edge_order])
+
+    for attr in corner_attrs:
+        prop, dtype, width = ATTRIBUTE_TYPES[attr.data_type]
+        data = _read(attr.data, prop, dtype, nl, width)
+        attr.data.foreach_set(prop, data[vert_order].ravel())
+
+    me.update()
+    return True